@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Synthetic acquisition folders of configurable scale for the benchmarks.
+
+The folders have the layout PdfReportBuilder expects from a FIT module; the
+content is generated, so two folders built with the same scale are identical.
+"""
+
+import base64
+import hashlib
+import os
+import zipfile
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+from jinja2 import Template
+from PIL import Image
+
+from fit_common.core import pdf_report_builder
+from fit_common.core.pdf_report_builder import PdfReportBuilder
+
+STANDIN_TEMPLATES = {
+    "front.html": "<html><body><h1>{{ document_title }}</h1>"
+    "<p>{{ document_subtitle }}</p><p>{{ version }}</p></body></html>",
+    "content.html": """<html><body>{{ logo }}<h1>{{ document_title }}</h1>
+<h2>{{ index }}</h2>
+{% for section in sections %}<p>{{ loop.index }}. {{ section.title }}</p>{% endfor %}
+{% for section in sections %}
+<h2>{{ section.title }}</h2><div>{{ section.description }}</div>
+{% if section.rows is defined %}
+<table border="1"><tr>{% for c in section.columns %}<th>{{ c }}</th>{% endfor %}</tr>
+{% for row in section.rows %}<tr><td>{{ row.value }}</td><td>{{ row.desc }}</td></tr>
+{% endfor %}</table><p>{{ note }}: {{ section.note }}</p>
+{% elif section.type == "verification_report" %}
+<p>{{ section.verification_result }}</p><pre>{{ section.content }}</pre>
+{% elif section.content is defined %}<div>{{ section.content }}</div>{% endif %}
+{% endfor %}</body></html>""",
+}
+_PIXEL = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000100e221bc330000000049454e44ae426082"
+    )
+).decode("ascii")
+
+SCREEN_RECORDER_FILENAME = "acquisition_video"
+PACKET_CAPTURE_FILENAME = "acquisition.pcap"
+
+
+class AnyTranslations(defaultdict):
+    """Answers every translation key with a readable version of the key."""
+
+    def __missing__(self, key: str) -> str:
+        return key.replace("_", " ").capitalize()
+
+
+def use_standin_templates() -> None:
+    """Replace the fit_assets templates and logo when fit_assets is missing."""
+    pdf_report_builder.get_report_template = lambda name: Template(
+        STANDIN_TEMPLATES[name]
+    )
+    setattr(
+        PdfReportBuilder,
+        "_PdfReportBuilder__fit_logo",
+        lambda self: f"data:image/png;base64,{_PIXEL}",
+    )
+
+
+@dataclass(frozen=True)
+class CorpusScale:
+    # Files in downloads/; every one of them is listed in acquisition.hash.
+    files: int = 100
+    # Size of each downloaded file in bytes.
+    file_size: int = 1024
+    # Lines of acquisition.hash, padded with made-up entries past ``files``.
+    hash_lines: int = 0
+    whois_lines: int = 200
+    # 0 x 0 leaves out acquisition_page.png.
+    screenshot_width: int = 1280
+    screenshot_height: int = 4000
+    # Entries of acquisition.zip; 0 leaves the archive out.
+    zip_entries: int = 1000
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def build_acquisition(path: str, scale: CorpusScale) -> None:
+    """Fill ``path`` with a synthetic acquisition of the given scale."""
+    os.makedirs(path, exist_ok=True)
+    downloads = os.path.join(path, "downloads")
+    os.makedirs(downloads, exist_ok=True)
+
+    hash_lines = []
+    for number in range(scale.files):
+        name = f"file-{number:06d}.html"
+        content = _file_content(number, scale.file_size)
+        with open(os.path.join(downloads, name), "wb") as f:
+            f.write(content)
+        hash_lines.append(f"{hashlib.sha256(content).hexdigest()}  downloads/{name}")
+    for number in range(scale.files, scale.hash_lines):
+        hash_lines.append(f"{number:064x}  downloads/file-{number:06d}.html")
+
+    with open(os.path.join(path, "acquisition.hash"), "w", encoding="utf-8") as f:
+        f.write("\n".join(hash_lines) + "\n")
+
+    with open(os.path.join(path, "whois.txt"), "w", encoding="utf-8") as f:
+        for number in range(scale.whois_lines):
+            f.write(f"Registrar WHOIS field {number:05d}: EXAMPLE.TEST\n")
+
+    if scale.screenshot_width and scale.screenshot_height:
+        _write_screenshot(
+            os.path.join(path, "acquisition_page.png"),
+            scale.screenshot_width,
+            scale.screenshot_height,
+        )
+
+    if scale.zip_entries:
+        with zipfile.ZipFile(
+            os.path.join(path, "acquisition.zip"), "w", zipfile.ZIP_STORED
+        ) as archive:
+            for number in range(scale.zip_entries):
+                archive.writestr(
+                    f"site/page-{number:06d}.html", _file_content(number, 64)
+                )
+
+    small_files = {
+        "acquisition.log": "acquisition started\nacquisition finished\n",
+        "caseinfo.json": '{"name": "Benchmark"}',
+        "system_info.txt": "OS: synthetic\n",
+        "tsa.crt": "certificate",
+        "timestamp.tsr": "timestamp",
+        SCREEN_RECORDER_FILENAME + ".mp4": "video",
+        PACKET_CAPTURE_FILENAME: "pcap",
+    }
+    for name, content in small_files.items():
+        with open(os.path.join(path, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def write_verify_info(path: str, scale: CorpusScale) -> str:
+    """Write the verification log a VERIFY report embeds; returns its path."""
+    verify_info = os.path.join(path, "verify_info.txt")
+    with open(verify_info, "w", encoding="utf-8") as f:
+        for number in range(max(scale.files, scale.hash_lines)):
+            f.write(f"downloads/file-{number:06d}.html: OK\n")
+    return verify_info
+
+
+def _file_content(number: int, size: int) -> bytes:
+    line = f"<p>synthetic content {number}</p>\n".encode("ascii")
+    return (line * (size // len(line) + 1))[:size]
+
+
+def _write_screenshot(path: str, width: int, height: int) -> None:
+    # Horizontal bands compress like a real page and keep the PNG small.
+    image = Image.new("RGB", (width, height), "white")
+    band = Image.new("RGB", (width, 40), (220, 225, 235))
+    for top in range(0, height, 120):
+        image.paste(band, (0, top))
+    image.save(path, format="PNG")
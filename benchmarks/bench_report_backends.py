@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Full report generation with the HTML templates versus ReportlabBackend.
+
+Usage: python -m benchmarks.bench_report_backends [--hash-lines 500 2000 ...]
+
+Without the fit_assets package the report templates are replaced by minimal
+stand-ins, so absolute numbers differ from a real installation.
+"""
+
+import argparse
+import importlib.util
+import os
+import tempfile
+import time
+
+from benchmarks.acquisition_corpus import (
+    AnyTranslations,
+    CorpusScale,
+    build_acquisition,
+    use_standin_templates,
+)
+from fit_common.core.pdf_report_builder import PdfReportBuilder, ReportType
+from fit_common.core.report_backends import ReportlabBackend
+
+
+def _acquisition(path: str, hash_lines: int) -> None:
+    build_acquisition(
+        path,
+        CorpusScale(
+            files=0,
+            hash_lines=hash_lines,
+            whois_lines=max(1, hash_lines // 20),
+            screenshot_width=0,
+            screenshot_height=0,
+            zip_entries=0,
+        ),
+    )
+
+
+def _generate(path: str, backend: ReportlabBackend | None) -> float:
+    builder = PdfReportBuilder(
+        ReportType.ACQUISITION,
+        translations=AnyTranslations(),
+        path=path,
+        filename="report.pdf",
+        case_info={"name": "Benchmark"},
+    )
+    builder.ntp = "2026-01-01"
+    builder.in_memory = True
+    builder.content_backend = backend
+    started = time.perf_counter()
+    builder.generate_pdf()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--hash-lines", type=int, nargs="+", default=[250, 1000, 4000, 8000]
+    )
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("fit_assets") is None:
+        print("fit_assets not installed: using stand-in templates")
+        use_standin_templates()
+
+    backend = ReportlabBackend()
+    print(f"{'hash lines':>10} {'html (s)':>9} {'reportlab (s)':>14} {'speed-up':>9}")
+    for hash_lines in args.hash_lines:
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as path:
+            _acquisition(path, hash_lines)
+            html = _generate(path, None)
+            native = _generate(path, backend)
+        print(f"{hash_lines:>10} {html:>9.2f} {native:>14.2f} {html / native:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
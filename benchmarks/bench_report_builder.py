@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Time, peak RSS and output size of generate_pdf on synthetic acquisitions.
+
+Usage: python -m benchmarks.bench_report_builder [--scales small medium ...]
+       [--output results.json] [--compare baseline.json]
+
+Every run happens in a fresh process, so the peak RSS of one run is not
+inflated by the runs before it. Without the fit_assets package the report
+templates are replaced by minimal stand-ins, so absolute numbers differ from
+a real installation; compare results produced on the same machine and setup.
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.acquisition_corpus import (
+    PACKET_CAPTURE_FILENAME,
+    SCREEN_RECORDER_FILENAME,
+    AnyTranslations,
+    CorpusScale,
+    build_acquisition,
+    use_standin_templates,
+    write_verify_info,
+)
+from fit_common.core.acquisition_type import AcquisitionType
+from fit_common.core.pdf_report_builder import PdfReportBuilder, ReportType
+
+SCALES = {
+    "small": CorpusScale(
+        files=50,
+        hash_lines=50,
+        whois_lines=100,
+        screenshot_width=1280,
+        screenshot_height=2000,
+        zip_entries=200,
+    ),
+    "medium": CorpusScale(
+        files=500,
+        hash_lines=2000,
+        whois_lines=1000,
+        screenshot_width=1920,
+        screenshot_height=8000,
+        zip_entries=5000,
+    ),
+    "large": CorpusScale(
+        files=2000,
+        hash_lines=10000,
+        whois_lines=5000,
+        screenshot_width=1920,
+        screenshot_height=20000,
+        zip_entries=50000,
+    ),
+}
+
+
+def _peak_rss() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows.
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _run(
+    report_type_name: str, path: str, verify_info: str | None
+) -> dict[str, float | int | None]:
+    if importlib.util.find_spec("fit_assets") is None:
+        use_standin_templates()
+
+    report_type = ReportType[report_type_name]
+    filename = f"report_{report_type_name.lower()}.pdf"
+    builder = PdfReportBuilder(
+        report_type,
+        translations=AnyTranslations(),
+        path=path,
+        filename=filename,
+        case_info={"name": "Benchmark", "operator": "Benchmark"},
+        screen_recorder_filename=SCREEN_RECORDER_FILENAME,
+        packet_capture_filename=PACKET_CAPTURE_FILENAME,
+    )
+    builder.acquisition_type = AcquisitionType.WEB
+    builder.ntp = "2026-01-01 00:00:00"
+    if report_type == ReportType.VERIFY:
+        builder.verify_result = True
+        builder.verify_info_file_path = verify_info
+
+    started = time.perf_counter()
+    builder.generate_pdf()
+    elapsed = time.perf_counter() - started
+    return {
+        "time": elapsed,
+        "peak_rss": _peak_rss(),
+        "output_size": os.path.getsize(os.path.join(path, filename)),
+    }
+
+
+def _run_isolated(
+    report_type: ReportType, path: str, verify_info: str | None
+) -> dict[str, float | int | None]:
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_run, report_type.name, path, verify_info).result()
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(scales: list[str], repeat: int) -> dict[str, object]:
+    results = []
+    for name in scales:
+        scale = SCALES[name]
+        # xhtml2pdf only reads images below the working directory.
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as path:
+            build_acquisition(path, scale)
+            for report_type in (ReportType.ACQUISITION, ReportType.VERIFY):
+                runs = []
+                for _ in range(repeat):
+                    # generate_pdf removes the verify info file it embeds.
+                    verify_info = (
+                        write_verify_info(path, scale)
+                        if report_type == ReportType.VERIFY
+                        else None
+                    )
+                    runs.append(_run_isolated(report_type, path, verify_info))
+                best = min(runs, key=lambda run: run["time"] or 0.0)
+                results.append(
+                    {
+                        "scale": name,
+                        "report_type": report_type.name,
+                        **best,
+                        "parameters": scale.to_dict(),
+                    }
+                )
+    return {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fit_assets": importlib.util.find_spec("fit_assets") is not None,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _print_results(suite: dict[str, object], baseline: dict | None) -> None:
+    previous = {}
+    if baseline is not None:
+        previous = {
+            (result["scale"], result["report_type"]): result
+            for result in baseline["results"]
+        }
+
+    print(
+        f"{'scale':<8} {'report':<12} {'time (s)':>9} "
+        f"{'peak RSS (MiB)':>15} {'size (KiB)':>11} {'time vs base':>13}"
+    )
+    for result in suite["results"]:
+        rss = result["peak_rss"]
+        rss_text = f"{rss / 2**20:.1f}" if rss is not None else "n/a"
+        change = ""
+        before = previous.get((result["scale"], result["report_type"]))
+        if before is not None and before["time"]:
+            change = f"{(result['time'] / before['time'] - 1) * 100:+.1f}%"
+        print(
+            f"{result['scale']:<8} {result['report_type']:<12} "
+            f"{result['time']:>9.2f} {rss_text:>15} "
+            f"{result['output_size'] / 1024:>11.1f} {change:>13}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales", nargs="+", choices=list(SCALES), default=["small", "medium"]
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("fit_assets") is None:
+        print("fit_assets not installed: using stand-in templates")
+
+    suite = run_suite(args.scales, max(1, args.repeat))
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print_results(suite, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(suite, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
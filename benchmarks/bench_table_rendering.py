@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Render time of one large table versus the same rows split in chunks.
+
+Usage: python -m benchmarks.bench_table_rendering [--rows 250 500 ...]
+"""
+
+import argparse
+import io
+import time
+
+from jinja2 import Template
+from xhtml2pdf import pisa
+
+from fit_common.core.report_sections import split_table_sections
+
+# Same shape as the artifact tables of content.html: a title, a header row
+# and two text columns per row.
+_TEMPLATE = Template(
+    """<html><body>
+{% for section in sections %}
+{% if not section.continued %}<h2>{{ section.title }}</h2>{% endif %}
+<table border="1">
+<tr>{% for column in section.columns %}<th>{{ column }}</th>{% endfor %}</tr>
+{% for row in section.rows %}<tr><td>{{ row.value }}</td><td>{{ row.desc }}</td></tr>
+{% endfor %}</table>
+{% endfor %}
+</body></html>"""
+)
+
+
+def _section(rows: int) -> dict[str, object]:
+    return {
+        "title": "Acquired content",
+        "type": "acquired_content",
+        "description": "",
+        "columns": ["File name", "Description"],
+        "rows": [
+            {"value": f"downloads/file-{number:06d}.html", "desc": "Downloaded file"}
+            for number in range(rows)
+        ],
+        "note": "",
+    }
+
+
+def _render(sections: list[dict[str, object]]) -> float:
+    html = _TEMPLATE.render(sections=sections)
+    started = time.perf_counter()
+    pisa.CreatePDF(html, dest=io.BytesIO())
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[250, 500, 1000, 2000, 4000]
+    )
+    parser.add_argument("--rows-per-table", type=int, default=100)
+    args = parser.parse_args()
+
+    # Load fonts and lazy imports outside of the measurements.
+    _render([_section(1)])
+
+    print(f"{'rows':>6} {'single (s)':>11} {'chunked (s)':>12} {'ms/row':>7}")
+    for rows in args.rows:
+        single = _render([_section(rows)])
+        chunked = _render(split_table_sections([_section(rows)], args.rows_per_table))
+        print(
+            f"{rows:>6} {single:>11.2f} {chunked:>12.2f} {chunked / rows * 1000:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@
 from .acquisition_type import AcquisitionType
 from .paths import (
     resolve_app_path,
+    resolve_cache_path,
     resolve_db_path,
     resolve_log_path,
     resolve_path,
@@ -54,6 +55,7 @@ __all__ = [
     "resolve_path",
     "resolve_log_path",
     "resolve_db_path",
+    "resolve_cache_path",
     "resolve_app_path",
     # acquisition
     "AcquisitionType",
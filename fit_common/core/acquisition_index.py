@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Single-scan snapshot of the files in an acquisition folder."""
+
+import os
+from bisect import bisect_left
+
+
+class AcquisitionDirectoryIndex:
+    """Top-level files of a folder, scanned once with their stat results.
+
+    Names are kept sorted so prefix lookups are a binary search instead of a
+    pass over every entry. The snapshot does not follow later changes to the
+    folder: build a new one when the folder may have changed.
+    """
+
+    def __init__(self, path: str | None, entries: dict[str, os.stat_result]) -> None:
+        self.__path = path
+        self.__entries = entries
+        self.__names = sorted(entries)
+        self.__lower_names: list[tuple[str, str]] | None = None
+
+    @classmethod
+    def scan(cls, path: str | None) -> "AcquisitionDirectoryIndex":
+        entries: dict[str, os.stat_result] = {}
+        if path and os.path.isdir(path):
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_file():
+                            entries[entry.name] = entry.stat()
+                    except OSError:
+                        continue
+        return cls(path, entries)
+
+    @property
+    def path(self) -> str | None:
+        return self.__path
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def names(self) -> list[str]:
+        return list(self.__names)
+
+    def join(self, name: str) -> str:
+        return os.path.join(self.__path or "", name)
+
+    def stat(self, name: str) -> os.stat_result | None:
+        return self.__entries.get(name)
+
+    def size(self, name: str) -> int | None:
+        stat = self.__entries.get(name)
+        return stat.st_size if stat is not None else None
+
+    def is_empty(self, name: str) -> bool:
+        """True when the file is missing or has no content."""
+
+        return not self.size(name)
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        start = bisect_left(self.__names, prefix)
+        matches = []
+        for name in self.__names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
+
+    def find_prefix(self, prefix: str) -> str | None:
+        """Return the first name, in sorted order, starting with ``prefix``."""
+
+        start = bisect_left(self.__names, prefix)
+        if start < len(self.__names) and self.__names[start].startswith(prefix):
+            return self.__names[start]
+        return None
+
+    def with_suffix(self, suffix: str, case_sensitive: bool = True) -> list[str]:
+        if case_sensitive:
+            return [name for name in self.__names if name.endswith(suffix)]
+
+        if self.__lower_names is None:
+            self.__lower_names = [(name.lower(), name) for name in self.__names]
+        suffix = suffix.lower()
+        return [name for lower, name in self.__lower_names if lower.endswith(suffix)]
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Hit/miss statistics shared by the report and hashing caches."""
+
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Same fields as functools.lru_cache; ``maxsize`` is -1 when unbounded."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
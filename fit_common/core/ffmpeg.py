@@ -5,11 +5,15 @@ from __future__ import annotations
 import re
 import shlex
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Literal, Optional, Sequence, cast
 
 from fit_common.core import debug, get_platform
+from fit_common.core.hash_tee import tee_to_file
+from fit_common.core.hashing import DEFAULT_ALGORITHMS, FileDigest
 
 _LOG_CONTEXT = "fit_common.core.ffmpeg"
 
@@ -28,6 +32,12 @@ class FFmpegResult:
     timed_out: bool = False
 
 
+@dataclass
+class FFmpegRecordingResult(FFmpegResult):
+    # Size and digests of the output file; None when it could not be written.
+    digest: Optional[FileDigest] = None
+
+
 DeviceKind = Literal["audio", "video", "unknown"]
 
 
@@ -153,6 +163,91 @@ def execute_ffmpeg_command(
     return proc
 
 
+def execute_ffmpeg_recording(
+    ffmpeg_path: Path | str,
+    args: Sequence[str],
+    output_path: Path | str,
+    algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+    timeout: Optional[float] = None,
+    stop: Optional[threading.Event] = None,
+) -> FFmpegRecordingResult:
+    """Run ffmpeg writing to stdout and tee it into ``output_path``, hashed.
+
+    ``args`` are the input and encoding options without an output: the
+    stream goes to ``pipe:1``, so the format must be streamable (e.g.
+    matroska, mpegts, or mp4 with ``-movflags frag_keyframe+empty_moov``).
+    The digests are computed while the recording is written and are ready
+    when ffmpeg exits, with no read-back of the file. Setting ``stop`` asks
+    ffmpeg to finish the recording cleanly; ``timeout`` kills it.
+    """
+
+    ffmpeg_exec = str(ffmpeg_path)
+    command = [ffmpeg_exec, *args, "pipe:1"]
+    quoted = " ".join(shlex.quote(part) for part in command)
+    debug(f"ℹ️ Running ffmpeg recording: {quoted}", context=_LOG_CONTEXT)
+
+    proc = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.stdin is not None
+    assert proc.stdout is not None
+    assert proc.stderr is not None
+    stdin, stderr = proc.stdin, proc.stderr
+    stderr_chunks: list[bytes] = []
+    finished = threading.Event()
+    timed_out = threading.Event()
+
+    def drain_stderr() -> None:
+        # ffmpeg blocks once the stderr pipe is full.
+        for line in stderr:
+            stderr_chunks.append(line)
+
+    def watch() -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not finished.wait(0.1):
+            if stop is not None and stop.is_set() and not stdin.closed:
+                # "q" on stdin makes ffmpeg finalize the output and exit.
+                try:
+                    stdin.write(b"q")
+                    stdin.close()
+                except OSError:
+                    pass
+            if deadline is not None and time.monotonic() >= deadline:
+                timed_out.set()
+                proc.kill()
+                return
+
+    threads = [
+        threading.Thread(target=drain_stderr, name="fit-ffmpeg-stderr", daemon=True),
+        threading.Thread(target=watch, name="fit-ffmpeg-watch", daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    digest: Optional[FileDigest] = None
+    try:
+        digest = tee_to_file(proc.stdout, str(output_path), algorithms)
+    except OSError as exc:
+        debug(f"❌ Cannot write {output_path}: {exc}", context=_LOG_CONTEXT)
+        proc.kill()
+    finally:
+        returncode = proc.wait()
+        finished.set()
+        for thread in threads:
+            thread.join()
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            if not stream.closed:
+                stream.close()
+
+    stderr_text = normalize_output(b"".join(stderr_chunks))
+    for line in stderr_text.splitlines():
+        debug(f"ℹ️ [ffmpeg] {line}", context=_LOG_CONTEXT)
+    return FFmpegRecordingResult(returncode, stderr_text, timed_out.is_set(), digest)
+
+
 def normalize_output(value: Optional[str | bytes]) -> str:
     """Normalize ffmpeg stdout/stderr so callers can treat it as text."""
 
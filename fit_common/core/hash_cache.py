@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""On-disk cache of file digests keyed by device, inode, size and mtime."""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Sequence
+
+from fit_common.core.paths import resolve_db_path
+from fit_common.core.cache_info import CacheInfo
+
+HASH_CACHE_DB = "hash_cache.db"
+
+# A file modified this recently may change again within the same mtime tick,
+# unseen by the key, so its digests are not stored yet.
+_SETTLE_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_digest (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (device, inode, size, mtime_ns, algorithm)
+)
+"""
+
+
+class HashCache:
+    """Digests of files already hashed, so unchanged files are not read again.
+
+    An entry is found only while the file keeps its device, inode, size and
+    mtime; any write changes at least one of them. The key trusts the file
+    system metadata, which can be forged: forensic re-verification must not
+    use the cache (see the ``strict`` flag of the hashing APIs).
+    """
+
+    def __init__(self, db_path: str | None = None) -> None:
+        self.__db_path = db_path or resolve_db_path(HASH_CACHE_DB)
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(
+            self.__db_path, timeout=30, check_same_thread=False
+        )
+        with self.__connection:
+            self.__connection.execute(_SCHEMA)
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def db_path(self) -> str:
+        return self.__db_path
+
+    def lookup(
+        self, stat: os.stat_result, algorithms: Sequence[str]
+    ) -> dict[str, str] | None:
+        """Digests of the file ``stat`` describes, or None unless all are known."""
+
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT algorithm, digest FROM file_digest"
+                " WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ?",
+                file_key(stat),
+            ).fetchall()
+            known = dict(rows)
+            if all(algorithm in known for algorithm in algorithms):
+                self.__hits += 1
+                return {algorithm: known[algorithm] for algorithm in algorithms}
+            self.__misses += 1
+            return None
+
+    def store(self, stat: os.stat_result, digests: dict[str, str]) -> bool:
+        """Record ``digests`` for the file ``stat`` describes.
+
+        Entries of earlier versions of the same file are dropped. Returns
+        False, storing nothing, when the file was modified too recently to
+        be trusted.
+        """
+
+        if time.time_ns() - stat.st_mtime_ns < _SETTLE_NS:
+            return False
+        key = file_key(stat)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "DELETE FROM file_digest WHERE device = ? AND inode = ?"
+                " AND (size != ? OR mtime_ns != ?)",
+                key,
+            )
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO file_digest VALUES (?, ?, ?, ?, ?, ?)",
+                [(*key, algorithm, digest) for algorithm, digest in digests.items()],
+            )
+        return True
+
+    def cache_info(self) -> CacheInfo:
+        with self.__lock:
+            (files,) = self.__connection.execute(
+                "SELECT COUNT(DISTINCT device || ':' || inode) FROM file_digest"
+            ).fetchone()
+            # The cache is not bounded: maxsize is reported as -1.
+            return CacheInfo(self.__hits, self.__misses, -1, files)
+
+    def clear(self) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM file_digest")
+            self.__hits = 0
+            self.__misses = 0
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def file_key(stat: os.stat_result) -> tuple[int, int, int, int]:
+    """The (device, inode, size, mtime_ns) identity of one file version."""
+
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
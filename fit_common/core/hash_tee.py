@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Hash bytes while they are written, so a recording is never read back."""
+
+import hashlib
+import io
+import os
+import time
+from contextlib import nullcontext
+from typing import IO, BinaryIO, Sequence
+
+from fit_common.core.hashing import (
+    ALGORITHM_LABELS,
+    DEFAULT_ALGORITHMS,
+    DEFAULT_BUFFER_SIZE,
+    FileDigest,
+)
+
+
+class HashingWriter(io.RawIOBase):
+    """Binary stream that hashes every byte written through to ``stream``.
+
+    Only the bytes ``stream`` accepts are hashed, so a short write on a
+    pipe or a raw file keeps the digests in step with the data on disk.
+    Closing the writer closes ``stream`` too.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, algorithms: Sequence[str] = DEFAULT_ALGORITHMS
+    ) -> None:
+        unknown = [name for name in algorithms if name not in ALGORITHM_LABELS]
+        if unknown or not algorithms:
+            raise ValueError(f"Unsupported hash algorithms: {unknown or algorithms}")
+        super().__init__()
+        self.__stream = stream
+        self.__hashers = [hashlib.new(name) for name in algorithms]
+        self.__size = 0
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def digests(self) -> dict[str, str]:
+        """Hex digests of the bytes written so far, by hashlib name."""
+
+        return {hasher.name: hasher.hexdigest() for hasher in self.__hashers}
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        if self.closed:
+            raise ValueError("write to closed file")
+        written = self.__stream.write(data)
+        if written is None:
+            # A non-blocking raw stream that could not take anything.
+            return 0
+        view = memoryview(data).cast("B")[:written]
+        for hasher in self.__hashers:
+            hasher.update(view)
+        self.__size += written
+        return written
+
+    def flush(self) -> None:
+        if not self.closed:
+            self.__stream.flush()
+
+    def close(self) -> None:
+        if not self.closed:
+            # IOBase.close() flushes, so the stream must still be open.
+            try:
+                super().close()
+            finally:
+                self.__stream.close()
+
+
+def tee_to_file(
+    source: IO[bytes] | str,
+    output_path: str,
+    algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> FileDigest:
+    """Copy ``source`` into ``output_path`` until EOF, hashing on the way.
+
+    ``source`` is a readable binary stream, such as the stdout of a
+    subprocess, or the path of a named pipe to open. The returned digest
+    is ready as soon as the source ends and can go straight into the
+    acquisition.hash manifest.
+    """
+
+    started = time.perf_counter()
+    with (
+        open(source, "rb") if isinstance(source, str) else nullcontext(source) as src,
+        HashingWriter(open(output_path, "wb"), algorithms) as writer,
+    ):
+        buffer = bytearray(buffer_size)
+        view = memoryview(buffer)
+        while read := src.readinto(buffer):  # type: ignore[attr-defined]
+            block = view[:read]
+            while block:
+                block = block[writer.write(block) :]
+        writer.flush()
+        return FileDigest(
+            os.path.basename(output_path),
+            writer.size,
+            writer.digests(),
+            time.perf_counter() - started,
+        )
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Multi-algorithm hashing of acquisition files and the acquisition.hash manifest.
+
+The manifest lists one block per file, separated by a blank line::
+
+    Name: acquisition.log
+    Size: 1234
+    MD5: ...
+    SHA-1: ...
+    SHA-256: ...
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+from fit_common.core.acquisition_index import AcquisitionDirectoryIndex
+from fit_common.core.hash_cache import HashCache, file_key
+from fit_common.core.report_fingerprint import is_fingerprint_file
+
+HASH_MANIFEST = "acquisition.hash"
+MERKLE_SUFFIX = ".merkle"
+
+# Hidden mkstemp files of an atomic write (manifest, Merkle sidecar,
+# optimised report) left behind by a crash.
+_TEMP_FILE = re.compile(r"\.[a-z0-9_]{8}\.(hash|merkle|fingerprint|pdf)")
+
+ALGORITHM_LABELS = {
+    "md5": "MD5",
+    "sha1": "SHA-1",
+    "sha256": "SHA-256",
+    "sha512": "SHA-512",
+}
+DEFAULT_ALGORITHMS = ("md5", "sha1", "sha256")
+
+# Large enough that hashlib releases the GIL and per-call overhead vanishes.
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+_ALGORITHM_BY_LENGTH = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+_CHECKSUM_LINE = re.compile(
+    r"^([0-9a-fA-F]{128}|[0-9a-fA-F]{64}|[0-9a-fA-F]{40}|[0-9a-fA-F]{32})"
+    r" [ *](.+)$"
+)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    name: str
+    # None when the manifest does not record it.
+    size: int | None
+    digests: dict[str, str]
+
+
+@dataclass(frozen=True)
+class FileDigest:
+    name: str
+    size: int
+    # Hex digests by hashlib algorithm name, in the requested order.
+    digests: dict[str, str]
+    elapsed: float
+    # True when the digests come from a HashCache and the file was not read.
+    cached: bool = False
+
+
+def hash_file(
+    path: str,
+    algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    use_mmap: bool = False,
+) -> dict[str, str]:
+    """Return the hex digests of ``path`` for every algorithm, in one read pass."""
+
+    return _digest_file(path, _new_hashers(algorithms), buffer_size, use_mmap)[1]
+
+
+def _digest_file(
+    path: str,
+    hashers: list["hashlib._Hash"],
+    buffer_size: int,
+    use_mmap: bool,
+) -> tuple[int, dict[str, str]]:
+    # Returns the number of bytes hashed along with the digests.
+    hashed = 0
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if use_mmap and size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for start in range(0, size, buffer_size):
+                        block = view[start : start + buffer_size]
+                        for hasher in hashers:
+                            hasher.update(block)
+                        hashed += len(block)
+                        block.release()
+                finally:
+                    view.release()
+        else:
+            buffer = bytearray(buffer_size)
+            view = memoryview(buffer)
+            while read := f.readinto(buffer):
+                block = view[:read]
+                for hasher in hashers:
+                    hasher.update(block)
+                hashed += read
+    return hashed, {hasher.name: hasher.hexdigest() for hasher in hashers}
+
+
+def hash_files(
+    path: str,
+    names: Iterable[str],
+    algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+    max_workers: int | None = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    use_mmap: bool = False,
+    cache: HashCache | None = None,
+    strict: bool = False,
+) -> list[FileDigest]:
+    """Hash the files ``names`` under ``path`` concurrently, in the given order.
+
+    hashlib releases the GIL while it digests a buffer, so threads hash
+    several files at once. Raises the first OSError met. See digest_file
+    for ``cache`` and ``strict``.
+    """
+
+    # Fail on an unknown algorithm before any file is opened.
+    _new_hashers(algorithms)
+
+    def digest(name: str) -> FileDigest:
+        return digest_file(path, name, algorithms, buffer_size, use_mmap, cache, strict)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        thread_name_prefix="fit-hash",
+    ) as executor:
+        return list(executor.map(digest, names))
+
+
+def digest_file(
+    path: str,
+    name: str,
+    algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    use_mmap: bool = False,
+    cache: HashCache | None = None,
+    strict: bool = False,
+) -> FileDigest:
+    """Hash the file ``name`` under ``path`` and time it.
+
+    With a ``cache``, a file whose device, inode, size and mtime are
+    unchanged since it was last hashed is not read again. ``strict`` reads
+    every file regardless, and only refreshes the cache.
+    """
+
+    started = time.perf_counter()
+    file_path = os.path.join(path, name)
+    hashers = _new_hashers(algorithms)
+    stat = os.stat(file_path) if cache is not None else None
+    if cache is not None and stat is not None and not strict:
+        cached = cache.lookup(stat, algorithms)
+        if cached is not None:
+            return FileDigest(
+                name, stat.st_size, cached, time.perf_counter() - started, True
+            )
+
+    size, digests = _digest_file(file_path, hashers, buffer_size, use_mmap)
+    # A file written to while it was read has no trustworthy digest to keep.
+    if cache is not None and stat is not None:
+        if file_key(os.stat(file_path)) == file_key(stat) and size == stat.st_size:
+            cache.store(stat, digests)
+    return FileDigest(name, size, digests, time.perf_counter() - started)
+
+
+def acquisition_file_names(path: str, manifest: str = HASH_MANIFEST) -> list[str]:
+    """Files of an acquisition folder that belong in its manifest, sorted.
+
+    The manifest itself and the files FIT writes beside the evidence are
+    left out: report fingerprints, Merkle sidecars and leftover temp files.
+    """
+
+    return [
+        name
+        for name in AcquisitionDirectoryIndex.scan(path).names()
+        if name != manifest and not _is_sidecar_file(name)
+    ]
+
+
+def _is_sidecar_file(name: str) -> bool:
+    return (
+        is_fingerprint_file(name)
+        or name.endswith(MERKLE_SUFFIX)
+        or _TEMP_FILE.fullmatch(name) is not None
+    )
+
+
+def format_manifest_entry(digest: FileDigest) -> str:
+    lines = [f"Name: {digest.name}", f"Size: {digest.size}"]
+    lines.extend(
+        f"{ALGORITHM_LABELS[algorithm]}: {value}"
+        for algorithm, value in digest.digests.items()
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_hash_manifest(
+    path: str, digests: Iterable[FileDigest], manifest: str = HASH_MANIFEST
+) -> str:
+    """Write the manifest into ``path``; it is replaced only once complete."""
+
+    manifest_path = os.path.join(path, manifest)
+    fd, temp_path = tempfile.mkstemp(dir=path, prefix=".", suffix=".hash")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write("\n".join(format_manifest_entry(digest) for digest in digests))
+        os.replace(temp_path, manifest_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return manifest_path
+
+
+def read_hash_manifest(manifest_path: str) -> list[ManifestEntry]:
+    """Parse a manifest written by write_hash_manifest.
+
+    Lines in the ``<hex digest>  <name>`` form of md5sum/sha256sum are
+    accepted too; their algorithm is told by the digest length.
+    """
+
+    labels = {label: algorithm for algorithm, label in ALGORITHM_LABELS.items()}
+    entries: list[ManifestEntry] = []
+    name: str | None = None
+    size: int | None = None
+    digests: dict[str, str] = {}
+
+    def flush() -> None:
+        if name is not None:
+            entries.append(ManifestEntry(name, size, dict(digests)))
+
+    with open(manifest_path, "r", encoding="utf-8", errors="surrogateescape") as f:
+        for raw_line in f:
+            line = raw_line.rstrip("\r\n")
+            key, separator, value = line.partition(": ")
+            if separator and key == "Name":
+                flush()
+                name, size, digests = value, None, {}
+            elif separator and key == "Size" and name is not None:
+                size = int(value) if value.strip().isdigit() else None
+            elif separator and key in labels and name is not None:
+                digests[labels[key]] = value.strip().lower()
+            elif line.strip():
+                match = _CHECKSUM_LINE.match(line)
+                if match is None:
+                    continue
+                flush()
+                name, size = match.group(2), None
+                hex_digest = match.group(1).lower()
+                digests = {_ALGORITHM_BY_LENGTH[len(hex_digest)]: hex_digest}
+    flush()
+    return entries
+
+
+def hash_acquisition(
+    path: str,
+    algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+    max_workers: int | None = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    use_mmap: bool = False,
+    cache: HashCache | None = None,
+    strict: bool = False,
+) -> list[FileDigest]:
+    """Hash every file of an acquisition folder and write its acquisition.hash."""
+
+    digests = hash_files(
+        path,
+        acquisition_file_names(path),
+        algorithms,
+        max_workers,
+        buffer_size,
+        use_mmap,
+        cache,
+        strict,
+    )
+    write_hash_manifest(path, digests)
+    return digests
+
+
+def _new_hashers(algorithms: Sequence[str]) -> list["hashlib._Hash"]:
+    unknown = [name for name in algorithms if name not in ALGORITHM_LABELS]
+    if unknown or not algorithms:
+        raise ValueError(f"Unsupported hash algorithms: {unknown or algorithms}")
+    return [hashlib.new(name) for name in algorithms]
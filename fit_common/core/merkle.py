@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Chunked Merkle-tree digests for very large evidence files.
+
+A file is split in fixed-size chunks. Each chunk is a leaf,
+``SHA-256(0x00 || chunk)``; each inner node is ``SHA-256(0x01 || left ||
+right)``, and an odd node is carried up unchanged. The leaves, the root and
+the plain whole-file digests are kept in a JSON sidecar next to the file,
+which is also the checkpoint an interrupted run resumes from.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Sequence
+
+from fit_common.core.hashing import (
+    ALGORITHM_LABELS,
+    DEFAULT_ALGORITHMS,
+    MERKLE_SUFFIX,
+)
+
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+_FORMAT = "fit-merkle"
+_VERSION = 1
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+@dataclass(frozen=True)
+class MerkleDigest:
+    size: int
+    mtime_ns: int
+    chunk_size: int
+    # Hex SHA-256 of every chunk, in file order.
+    leaves: list[str]
+    # None while the tree is incomplete.
+    root: str | None
+    # Plain whole-file hex digests by hashlib algorithm name.
+    digests: dict[str, str]
+
+    @property
+    def complete(self) -> bool:
+        return self.root is not None
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "format": _FORMAT,
+            "version": _VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "chunk_size": self.chunk_size,
+            "leaves": self.leaves,
+            "root": self.root,
+            "digests": self.digests,
+        }
+
+
+def leaf_digest(chunk: bytes | memoryview) -> bytes:
+    hasher = hashlib.sha256(_LEAF_PREFIX)
+    hasher.update(chunk)
+    return hasher.digest()
+
+
+def merkle_root(leaves: Sequence[bytes]) -> bytes:
+    """Root of the tree over ``leaves``; an empty list is one empty chunk."""
+
+    level = list(leaves) or [leaf_digest(b"")]
+    while len(level) > 1:
+        parents = [
+            hashlib.sha256(_NODE_PREFIX + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0]
+
+
+def sidecar_path_for(path: str) -> str:
+    return path + MERKLE_SUFFIX
+
+
+def read_merkle_sidecar(sidecar_path: str) -> MerkleDigest:
+    """Load a sidecar; raises ValueError when it is not one."""
+
+    with open(sidecar_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != _FORMAT or data.get("version") != _VERSION:
+        raise ValueError(f"{sidecar_path} is not a Merkle sidecar")
+    return MerkleDigest(
+        int(data["size"]),
+        int(data["mtime_ns"]),
+        int(data["chunk_size"]),
+        list(data["leaves"]),
+        data["root"],
+        dict(data["digests"]),
+    )
+
+
+def hash_file_merkle(
+    path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+    max_workers: int | None = None,
+    sidecar_path: str | None = None,
+    checkpoint_every: int = 16,
+) -> MerkleDigest:
+    """Build the chunk tree and the plain digests of ``path`` in one read pass.
+
+    The file is read sequentially once. Leaves are hashed on a thread pool
+    and every whole-file algorithm runs on its own thread, so the work
+    spreads over the cores while at most two chunks per worker are held in
+    memory. The sidecar is rewritten every ``checkpoint_every`` leaves; a
+    later call on the unchanged file resumes from its leaves. The plain
+    digests cannot be checkpointed, so the resumed prefix is still read for
+    them, but not hashed into leaves again.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+    unknown = [name for name in algorithms if name not in ALGORITHM_LABELS]
+    if unknown:
+        raise ValueError(f"Unsupported hash algorithms: {unknown}")
+
+    sidecar_path = sidecar_path or sidecar_path_for(path)
+    stat = os.stat(path)
+    leaves = _resumable_leaves(sidecar_path, stat, chunk_size)
+    resumed = len(leaves)
+    hashers = [hashlib.new(name) for name in algorithms]
+    workers = max_workers or os.cpu_count() or 1
+
+    def checkpoint() -> None:
+        _write_sidecar(
+            sidecar_path,
+            MerkleDigest(stat.st_size, stat.st_mtime_ns, chunk_size, leaves, None, {}),
+        )
+
+    # One single-threaded executor per algorithm keeps its updates in order.
+    streams = [
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="fit-merkle-stream")
+        for _ in hashers
+    ]
+    pending: deque[tuple[Future[bytes] | None, list[Future[None]]]] = deque()
+    index = 0
+    try:
+        with (
+            ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="fit-merkle-leaf"
+            ) as leaf_pool,
+            open(path, "rb") as f,
+        ):
+
+            def collect() -> None:
+                leaf, updates = pending.popleft()
+                for update in updates:
+                    update.result()
+                if leaf is not None:
+                    leaves.append(leaf.result().hex())
+                    if len(leaves) % checkpoint_every == 0:
+                        checkpoint()
+
+            while chunk := f.read(chunk_size):
+                leaf = (
+                    leaf_pool.submit(leaf_digest, chunk) if index >= resumed else None
+                )
+                updates = [
+                    stream.submit(hasher.update, chunk)
+                    for stream, hasher in zip(streams, hashers)
+                ]
+                pending.append((leaf, updates))
+                index += 1
+                if len(pending) >= 2 * workers:
+                    collect()
+            while pending:
+                collect()
+    finally:
+        for stream in streams:
+            stream.shutdown(wait=True)
+
+    root = merkle_root([bytes.fromhex(leaf) for leaf in leaves]).hex()
+    digest = MerkleDigest(
+        stat.st_size,
+        stat.st_mtime_ns,
+        chunk_size,
+        leaves,
+        root,
+        {hasher.name: hasher.hexdigest() for hasher in hashers},
+    )
+    _write_sidecar(sidecar_path, digest)
+    return digest
+
+
+def verify_chunks(
+    path: str,
+    start: int = 0,
+    end: int | None = None,
+    sidecar_path: str | None = None,
+    max_workers: int | None = None,
+) -> list[int]:
+    """Re-hash the chunks covering bytes ``start``..``end`` and compare them.
+
+    Returns the indexes of the chunks that no longer match; a chunk past the
+    current end of the file counts as not matching. Only the chunks of the
+    range are read. Raises ValueError when the sidecar is incomplete or its
+    leaves do not add up to its root.
+    """
+
+    sidecar = read_merkle_sidecar(sidecar_path or sidecar_path_for(path))
+    if not sidecar.complete:
+        raise ValueError("The Merkle sidecar is incomplete, finish hashing first")
+    if merkle_root([bytes.fromhex(leaf) for leaf in sidecar.leaves]).hex() != (
+        sidecar.root
+    ):
+        raise ValueError("The Merkle sidecar leaves do not match its root")
+
+    end = sidecar.size if end is None else min(end, sidecar.size)
+    if start >= end:
+        return []
+    first = start // sidecar.chunk_size
+    last = (end - 1) // sidecar.chunk_size
+
+    def matches(index: int) -> bool:
+        with open(path, "rb") as f:
+            f.seek(index * sidecar.chunk_size)
+            chunk = f.read(sidecar.chunk_size)
+        return leaf_digest(chunk).hex() == sidecar.leaves[index]
+
+    indexes = range(first, last + 1)
+    with ThreadPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        thread_name_prefix="fit-merkle-verify",
+    ) as executor:
+        results = list(executor.map(matches, indexes))
+    return [index for index, ok in zip(indexes, results) if not ok]
+
+
+def _resumable_leaves(
+    sidecar_path: str, stat: os.stat_result, chunk_size: int
+) -> list[str]:
+    try:
+        sidecar = read_merkle_sidecar(sidecar_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+    if (
+        sidecar.complete
+        or sidecar.size != stat.st_size
+        or sidecar.mtime_ns != stat.st_mtime_ns
+        or sidecar.chunk_size != chunk_size
+    ):
+        return []
+    return list(sidecar.leaves)
+
+
+def _write_sidecar(sidecar_path: str, digest: MerkleDigest) -> None:
+    directory = os.path.dirname(os.path.abspath(sidecar_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=MERKLE_SUFFIX)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(digest.to_dict(), f)
+        os.replace(temp_path, sidecar_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
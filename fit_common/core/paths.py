@@ -62,3 +62,11 @@ def resolve_log_path(filename: str | None = None) -> str:
     if not filename:
         return log_dir
     return os.path.join(log_dir, filename)
+
+
+def resolve_cache_path(filename: str | None = None) -> str:
+    cache_dir = os.path.join(resolve_app_path(), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    if not filename:
+        return cache_dir
+    return os.path.join(cache_dir, filename)
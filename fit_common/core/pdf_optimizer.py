@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Size optimisation of generated PDF reports."""
+
+import io
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+
+from pypdf import PdfReader, PdfWriter
+
+from fit_common.core.debug import debug
+
+_LOG_CONTEXT = "fit_common.core.pdf_optimizer"
+
+
+@dataclass(frozen=True)
+class PdfOptimizationResult:
+    original_size: int
+    optimized_size: int
+    elapsed: float
+    images_recompressed: int
+
+    @property
+    def saved(self) -> int:
+        return self.original_size - self.optimized_size
+
+
+def optimize_pdf_writer(writer: PdfWriter, image_quality: int | None = None) -> int:
+    """Compress content streams and merge identical objects, in place.
+
+    Reports are built from independently rendered documents, so fonts and
+    images are embedded once per document; after this pass they are stored
+    once. With ``image_quality`` set, RGB and grayscale images are also
+    re-encoded as JPEG at that quality, which is lossy. Returns the number
+    of recompressed images.
+    """
+
+    # Deduplicate first so a shared image is only re-encoded once.
+    writer.compress_identical_objects(remove_duplicates=True, remove_unreferenced=True)
+
+    recompressed = 0
+    seen: set[int] = set()
+    for page in writer.pages:
+        if image_quality is not None:
+            for image in page.images:
+                reference = image.indirect_reference
+                if reference is None or reference.idnum in seen:
+                    continue
+                seen.add(reference.idnum)
+                if image.image is None or image.image.mode not in ("RGB", "L"):
+                    continue
+                try:
+                    image.replace(image.image, quality=image_quality)
+                except (OSError, TypeError, ValueError) as exc:
+                    debug(
+                        f"Unable to recompress image {image.name}: {exc}",
+                        context=_LOG_CONTEXT,
+                    )
+                    continue
+                recompressed += 1
+        page.compress_content_streams()
+    return recompressed
+
+
+def optimize_pdf_bytes(
+    writer: PdfWriter, image_quality: int | None = None
+) -> tuple[bytes, PdfOptimizationResult]:
+    """Serialise ``writer`` optimised, in memory, ready to be written once.
+
+    The writer is serialised as it is first, for comparison: when the
+    optimised document is not smaller, those original bytes are returned
+    and the result reports no saving and no recompressed image.
+    """
+
+    started = time.perf_counter()
+    original = io.BytesIO()
+    writer.write(original)
+    recompressed = optimize_pdf_writer(writer, image_quality)
+    optimized = io.BytesIO()
+    writer.write(optimized)
+
+    original_size = original.getbuffer().nbytes
+    if optimized.getbuffer().nbytes >= original_size:
+        elapsed = time.perf_counter() - started
+        return original.getvalue(), PdfOptimizationResult(
+            original_size, original_size, elapsed, 0
+        )
+    return optimized.getvalue(), PdfOptimizationResult(
+        original_size,
+        optimized.getbuffer().nbytes,
+        time.perf_counter() - started,
+        recompressed,
+    )
+
+
+def optimize_pdf_file(
+    path: str, image_quality: int | None = None
+) -> PdfOptimizationResult:
+    """Optimise a PDF in place; the file is replaced only once fully written.
+
+    The file is left untouched when the optimised document is not smaller.
+    """
+
+    started = time.perf_counter()
+    original_size = os.path.getsize(path)
+    writer = PdfWriter(clone_from=PdfReader(path))
+    recompressed = optimize_pdf_writer(writer, image_quality)
+
+    fd, temp_path = tempfile.mkstemp(
+        prefix=".", suffix=".pdf", dir=os.path.dirname(path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer.write(f)
+        optimized_size = os.path.getsize(temp_path)
+        if optimized_size < original_size:
+            os.replace(temp_path, path)
+        else:
+            optimized_size, recompressed = original_size, 0
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return PdfOptimizationResult(
+        original_size,
+        optimized_size,
+        time.perf_counter() - started,
+        recompressed,
+    )
@@ -8,19 +8,71 @@
 ######
 
 
-import base64
+import codecs
+import io
 import os
+import shutil
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from importlib.resources import files
-from typing import Mapping
+from pathlib import Path
+from typing import BinaryIO, Callable, ContextManager, Iterator, Mapping
 
 from jinja2 import Template
 from pypdf import PdfReader, PdfWriter
 from xhtml2pdf import pisa
 
-from fit_common.core import AcquisitionType, get_version
+from fit_common.core import AcquisitionType, debug, get_version
+from fit_common.core.acquisition_index import AcquisitionDirectoryIndex
+from fit_common.core.pdf_optimizer import PdfOptimizationResult, optimize_pdf_bytes
+from fit_common.core.report_backends import ContentBackend
+from fit_common.core.report_assets import data_uri, get_data_uri_cache
+from fit_common.core.report_budget import (
+    MemoryBudgetReport,
+    html_limit,
+    iter_appendix_chunks,
+    render_appendix_html,
+    spill_sections,
+)
+from fit_common.core.report_fingerprint import (
+    ReportFingerprint,
+    find_cached_report,
+    read_fingerprint,
+    remove_fingerprint,
+    write_fingerprint,
+)
+from fit_common.core.report_images import screenshot_derivative, tile_screenshot
+from fit_common.core.report_metrics import (
+    ReportInstrumentation,
+    ReportMetrics,
+    ReportStage,
+)
+from fit_common.core.report_renderer import (
+    RendererUnavailable,
+    RendererWorker,
+    get_renderer_worker,
+    render_pdf,
+)
+from fit_common.core.report_sections import get_section_cache, split_table_sections
+from fit_common.core.report_templates import (
+    get_report_template,
+    get_report_templates_digest,
+)
+from fit_common.core.verification import VerificationResult
+from fit_common.core.zip_manifest import iter_zip_manifest
+
+_LOG_CONTEXT = "fit_common.core.pdf_report_builder"
+
+_PDF_OPTIONS = {
+    "page-size": "Letter",
+    "margin-top": "1in",
+    "margin-right": "1in",
+    "margin-bottom": "1in",
+    "margin-left": "1in",
+}
 
 
 class ReportType(Enum):
@@ -28,6 +80,14 @@ class ReportType(Enum):
     VERIFY = auto()
 
 
+class ReportGenerationCancelled(Exception):
+    """Raised by generate_pdf when its cancel event is set between two stages."""
+
+    def __init__(self, stage: ReportStage) -> None:
+        super().__init__(f"Report generation cancelled before {stage.value}")
+        self.stage = stage
+
+
 class PdfReportBuilder:
     def __init__(
         self,
@@ -49,10 +109,36 @@ class PdfReportBuilder:
         self.__temp_dir = tempfile.TemporaryDirectory()
         self.__output_front = os.path.join(self.__temp_dir.name, "front_report.pdf")
         self.__output_content = os.path.join(self.__temp_dir.name, "content_report.pdf")
+        self.__output_tiles = os.path.join(self.__temp_dir.name, "screenshot_tiles")
+        self.__output_appendix = os.path.join(self.__temp_dir.name, "appendix")
         self.__acquisition_type = None
         self.__ntp = None
         self.__verify_result = None
         self.__verify_info_file_path = None
+        self.__parallel_rendering = False
+        self.__in_memory = False
+        self.__screenshot_dpi = None
+        self.__screenshot_tiling = False
+        self.__collect_metrics = False
+        self.__trace_memory = False
+        self.__output_cache = False
+        self.__section_cache = False
+        self.__hash_rows_limit: int | None = None
+        self.__zip_entries_per_page: int | None = None
+        self.__rows_per_table: int | None = None
+        self.__progress_callback: Callable[[ReportStage], None] | None = None
+        self.__cancel_event: threading.Event | None = None
+        self.__optimize_output = False
+        self.__image_quality: int | None = None
+        self.__optimization: PdfOptimizationResult | None = None
+        self.__content_backend: ContentBackend | None = None
+        self.__memory_budget: int | None = None
+        self.__memory_budget_report: MemoryBudgetReport | None = None
+        self.__translations_digest: str | None = None
+        self.__renderer: RendererWorker | None = None
+        self.__metrics: ReportMetrics | None = None
+        self.__instrumentation = ReportInstrumentation()
+        self.__index: AcquisitionDirectoryIndex | None = None
 
     @property
     def ntp(self) -> str | None:
@@ -86,6 +172,198 @@ class PdfReportBuilder:
     def verify_info_file_path(self, verify_info_file_path: str | None) -> None:
         self.__verify_info_file_path = verify_info_file_path
 
+    def use_verification(self, result: VerificationResult) -> None:
+        """Report ``result``: its outcome and its per-file log.
+
+        The log is written to this builder's temp directory and, like any
+        verify info file, removed once the report is generated.
+        """
+        self.__verify_result = result.ok
+        self.__verify_info_file_path = result.write_info_file(
+            os.path.join(self.__temp_dir.name, "verify_info.txt")
+        )
+
+    @property
+    def parallel_rendering(self) -> bool:
+        """Render the content in the warm worker while the front page renders here.
+
+        Only the one-page front page overlaps, so the gain is small and needs
+        a spare core. The shared worker costs about 1s to start, once per
+        process. On a single core, measured on small and medium VERIFY
+        reports, later reports took as long as serial or up to 0.5s longer,
+        spent moving the HTML and PDF through the pipe.
+        """
+
+        return self.__parallel_rendering
+
+    @parallel_rendering.setter
+    def parallel_rendering(self, parallel_rendering: bool) -> None:
+        self.__parallel_rendering = parallel_rendering
+
+    @property
+    def in_memory(self) -> bool:
+        return self.__in_memory
+
+    @in_memory.setter
+    def in_memory(self, in_memory: bool) -> None:
+        self.__in_memory = in_memory
+
+    @property
+    def screenshot_dpi(self) -> int | None:
+        return self.__screenshot_dpi
+
+    @screenshot_dpi.setter
+    def screenshot_dpi(self, screenshot_dpi: int | None) -> None:
+        self.__screenshot_dpi = screenshot_dpi
+
+    @property
+    def screenshot_tiling(self) -> bool:
+        return self.__screenshot_tiling
+
+    @screenshot_tiling.setter
+    def screenshot_tiling(self, screenshot_tiling: bool) -> None:
+        self.__screenshot_tiling = screenshot_tiling
+
+    @property
+    def renderer(self) -> RendererWorker | None:
+        return self.__renderer
+
+    @renderer.setter
+    def renderer(self, renderer: RendererWorker | None) -> None:
+        self.__renderer = renderer
+
+    @property
+    def output_cache(self) -> bool:
+        return self.__output_cache
+
+    @output_cache.setter
+    def output_cache(self, output_cache: bool) -> None:
+        self.__output_cache = output_cache
+
+    @property
+    def hash_rows_limit(self) -> int | None:
+        return self.__hash_rows_limit
+
+    @hash_rows_limit.setter
+    def hash_rows_limit(self, hash_rows_limit: int | None) -> None:
+        self.__hash_rows_limit = hash_rows_limit
+
+    @property
+    def zip_entries_per_page(self) -> int | None:
+        return self.__zip_entries_per_page
+
+    @zip_entries_per_page.setter
+    def zip_entries_per_page(self, zip_entries_per_page: int | None) -> None:
+        self.__zip_entries_per_page = zip_entries_per_page
+
+    @property
+    def rows_per_table(self) -> int | None:
+        """Split tables longer than this, when a content backend is set.
+
+        The shipped content.html gives every section a numbered index entry
+        and cannot tell a continuation apart, so templates get whole tables.
+        """
+
+        return self.__rows_per_table
+
+    @rows_per_table.setter
+    def rows_per_table(self, rows_per_table: int | None) -> None:
+        self.__rows_per_table = rows_per_table
+
+    @property
+    def section_cache(self) -> bool:
+        return self.__section_cache
+
+    @section_cache.setter
+    def section_cache(self, section_cache: bool) -> None:
+        self.__section_cache = section_cache
+
+    @property
+    def progress_callback(self) -> Callable[[ReportStage], None] | None:
+        return self.__progress_callback
+
+    @progress_callback.setter
+    def progress_callback(
+        self, progress_callback: Callable[[ReportStage], None] | None
+    ) -> None:
+        self.__progress_callback = progress_callback
+
+    @property
+    def cancel_event(self) -> threading.Event | None:
+        return self.__cancel_event
+
+    @cancel_event.setter
+    def cancel_event(self, cancel_event: threading.Event | None) -> None:
+        self.__cancel_event = cancel_event
+
+    @property
+    def content_backend(self) -> ContentBackend | None:
+        return self.__content_backend
+
+    @content_backend.setter
+    def content_backend(self, content_backend: ContentBackend | None) -> None:
+        self.__content_backend = content_backend
+
+    @property
+    def optimize_output(self) -> bool:
+        return self.__optimize_output
+
+    @optimize_output.setter
+    def optimize_output(self, optimize_output: bool) -> None:
+        self.__optimize_output = optimize_output
+
+    @property
+    def image_quality(self) -> int | None:
+        return self.__image_quality
+
+    @image_quality.setter
+    def image_quality(self, image_quality: int | None) -> None:
+        self.__image_quality = image_quality
+
+    @property
+    def optimization(self) -> PdfOptimizationResult | None:
+        return self.__optimization
+
+    @property
+    def memory_budget(self) -> int | None:
+        return self.__memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, memory_budget: int | None) -> None:
+        if memory_budget is not None:
+            html_limit(memory_budget)
+        self.__memory_budget = memory_budget
+
+    @property
+    def memory_budget_report(self) -> MemoryBudgetReport | None:
+        return self.__memory_budget_report
+
+    @property
+    def collect_metrics(self) -> bool:
+        return self.__collect_metrics
+
+    @collect_metrics.setter
+    def collect_metrics(self, collect_metrics: bool) -> None:
+        self.__collect_metrics = collect_metrics
+
+    @property
+    def trace_memory(self) -> bool:
+        """Measure stage memory with tracemalloc instead of the peak RSS.
+
+        Exact for Python allocations, but it slows rendering about tenfold:
+        leave it off when the timings matter.
+        """
+
+        return self.__trace_memory
+
+    @trace_memory.setter
+    def trace_memory(self, trace_memory: bool) -> None:
+        self.__trace_memory = trace_memory
+
+    @property
+    def metrics(self) -> ReportMetrics | None:
+        return self.__metrics
+
     @staticmethod
     def __safe_text(value: object | None) -> str:
         if value is None:
@@ -93,19 +371,298 @@ class PdfReportBuilder:
         return str(value).strip()
 
     def generate_pdf(self) -> None:
-        logo_path = files("fit_assets.images") / "logo-640x640.png"
-        logo_bytes = logo_path.read_bytes()
-        logo_base64 = base64.b64encode(logo_bytes).decode("utf-8")
+        self.__instrumentation = ReportInstrumentation(
+            self.__collect_metrics, self.__trace_memory
+        )
+        self.__metrics = None
+        self.__optimization = None
+        self.__memory_budget_report = None
+        try:
+            with self.__stage(ReportStage.SCAN):
+                self.__index = AcquisitionDirectoryIndex.scan(self.__path)
+
+            output_path = os.path.join(self.__path, self.__filename)
+            digest = None
+            if self.__output_cache:
+                with self.__stage(ReportStage.FINGERPRINT):
+                    digest = self.__fingerprint()
+                if self.__reuse_cached_report(output_path, digest):
+                    self.__remove_verify_info_file()
+                    return
+
+            # Whatever gets written next no longer matches an old fingerprint.
+            remove_fingerprint(output_path)
+            self.__generate_pdf()
+            if digest is not None:
+                write_fingerprint(output_path, digest)
+        except ReportGenerationCancelled:
+            # The inputs, verify info included, are left for a later run.
+            self.__remove_temporary_files()
+            debug("Report generation cancelled", context=_LOG_CONTEXT)
+            raise
+        finally:
+            self.__index = None
+            self.__translations_digest = None
+            if self.__collect_metrics:
+                self.__metrics = self.__instrumentation.metrics
+                for stage in self.__metrics.stages:
+                    debug(
+                        f"{stage.stage.value}: wall {stage.wall_time:.3f}s, "
+                        f"cpu {stage.cpu_time:.3f}s, "
+                        f"peak {stage.peak_memory / 1024:.0f} KiB",
+                        context=_LOG_CONTEXT,
+                    )
+
+    def __generate_pdf(self) -> None:
+        measure = self.__stage
+
+        with measure(ReportStage.SECTIONS):
+            sections = self.__build_sections()
+            # Only the backends read the ``continued`` marker of the parts.
+            if self.__rows_per_table and self.__content_backend is not None:
+                sections = split_table_sections(sections, self.__rows_per_table)
+            if self.__memory_budget is not None:
+                self.__apply_memory_budget(sections)
+
+        if self.__content_backend is not None:
+            writer = self.__render_with_backend(sections)
+        else:
+            writer = self.__render_with_templates(sections)
+
+        if self.__memory_budget_report is not None:
+            if self.__memory_budget_report.spilled:
+                with measure(ReportStage.APPENDIX):
+                    self.__append_appendices(writer, self.__memory_budget_report)
+            self.__log_memory_budget(self.__memory_budget_report)
+
+        output_path = os.path.join(self.__path, self.__filename)
+        optimized: bytes | None = None
+        if self.__optimize_output:
+            # Optimised in memory, so the acquisition folder is written once.
+            with measure(ReportStage.OPTIMIZE):
+                optimized, self.__optimization = optimize_pdf_bytes(
+                    writer, self.__image_quality
+                )
+            debug(
+                f"Optimized {output_path}: "
+                f"{self.__optimization.original_size} -> "
+                f"{self.__optimization.optimized_size} bytes "
+                f"in {self.__optimization.elapsed:.3f}s",
+                context=_LOG_CONTEXT,
+            )
+
+        with measure(ReportStage.WRITE):
+            with open(output_path, "wb") as f_out:
+                if optimized is None:
+                    writer.write(f_out)
+                else:
+                    f_out.write(optimized)
+
+        self.__remove_temporary_files()
+        self.__remove_verify_info_file()
+
+    def __render_with_templates(self, sections: list[dict]) -> PdfWriter:
+        measure = self.__stage
+        with measure(ReportStage.TEMPLATES):
+            front_page_html = self.__render_front_page()
+            content_page_html = self.__render_content_page(sections)
+
+        # create pdf front and content, merge them and remove merged files
+        if self.__in_memory:
+            front_pdf, content_pdf = self.__render_to_bytes(
+                front_page_html, content_page_html, _PDF_OPTIONS
+            )
+            with measure(ReportStage.MERGE):
+                return self.__merge_documents(
+                    [io.BytesIO(front_pdf), io.BytesIO(content_pdf)]
+                )
+
+        self.__render_to_temp_files(front_page_html, content_page_html, _PDF_OPTIONS)
+        with (
+            measure(ReportStage.MERGE),
+            open(self.__output_front, "rb") as f_front,
+            open(self.__output_content, "rb") as f_content,
+        ):
+            return self.__merge_documents([f_front, f_content])
+
+    def __render_with_backend(self, sections: list[dict]) -> PdfWriter:
+        # The front page stays an HTML template; the backend draws the
+        # content document from the sections directly.
+        measure = self.__stage
+        with measure(ReportStage.TEMPLATES):
+            front_page_html = self.__render_front_page()
+            context = self.__content_context()
+
+        render = self.__renderer.render if self.__renderer is not None else render_pdf
+        with measure(ReportStage.RENDER_FRONT):
+            front_pdf = render(front_page_html, _PDF_OPTIONS)
+        with measure(ReportStage.RENDER_CONTENT):
+            content_pdf = self.__content_backend.render_content(sections, context)
+
+        with measure(ReportStage.MERGE):
+            return self.__merge_documents(
+                [io.BytesIO(front_pdf), io.BytesIO(content_pdf)]
+            )
+
+    def __apply_memory_budget(self, sections: list[dict]) -> None:
+        # Oversized content is cut down to what fits in the content document;
+        # the rest is written to appendix files and rendered at the end of
+        # the report, one bounded chunk at a time.
+        report = MemoryBudgetReport(
+            self.__memory_budget, html_limit(self.__memory_budget)
+        )
+        spill_sections(
+            sections,
+            report,
+            self.__output_appendix,
+            self.__translations.get(
+                "SECTION_CONTINUED_IN_APPENDIX",
+                "{0} continues in the appendix at the end of this report.",
+            ),
+        )
+        self.__memory_budget_report = report
+
+    def __append_appendices(
+        self, writer: PdfWriter, report: MemoryBudgetReport
+    ) -> None:
+        render = self.__renderer.render if self.__renderer is not None else render_pdf
+        label = self.__translations.get("APPENDIX", "Appendix")
+        for spilled in report.spilled:
+            title = f"{label}: {spilled.title}"
+            for chunk in iter_appendix_chunks(spilled, report.html_limit):
+                if self.__cancel_event is not None and self.__cancel_event.is_set():
+                    raise ReportGenerationCancelled(ReportStage.APPENDIX)
+                pdf = render(render_appendix_html(spilled, title, chunk), _PDF_OPTIONS)
+                for page in PdfReader(io.BytesIO(pdf)).pages:
+                    writer.add_page(page)
+                report.appendix_chunks += 1
+                report.largest_chunk = max(report.largest_chunk, len(chunk))
+
+    def __log_memory_budget(self, report: MemoryBudgetReport) -> None:
+        debug(
+            f"Memory budget {report.budget} bytes: "
+            f"estimated peak {report.estimated_peak} bytes, "
+            f"{len(report.spilled)} sections moved to the appendix "
+            f"in {report.appendix_chunks} chunks"
+            + ("" if report.within_budget else ", budget exceeded"),
+            context=_LOG_CONTEXT,
+        )
+
+    def __stage(self, stage: ReportStage) -> ContextManager[None]:
+        # Every stage starts here: a cancel request is honoured before any
+        # work of the stage is done.
+        if self.__cancel_event is not None and self.__cancel_event.is_set():
+            raise ReportGenerationCancelled(stage)
+        if self.__progress_callback is not None:
+            self.__progress_callback(stage)
+        return self.__instrumentation.measure(stage)
+
+    def __remove_temporary_files(self) -> None:
+        if os.path.exists(self.__output_front):
+            os.remove(self.__output_front)
+        if os.path.exists(self.__output_content):
+            os.remove(self.__output_content)
+        shutil.rmtree(self.__output_tiles, ignore_errors=True)
+        shutil.rmtree(self.__output_appendix, ignore_errors=True)
+
+    def __remove_verify_info_file(self) -> None:
+        if self.__verify_info_file_path is not None and os.path.exists(
+            self.__verify_info_file_path
+        ):
+            os.remove(self.__verify_info_file_path)
+
+    def __fingerprint(self) -> str:
+        fingerprint = ReportFingerprint()
+        fingerprint.add_text("report_type", self.__report_type.name)
+        fingerprint.add_json("translations", dict(self.__translations or {}))
+        fingerprint.add_json("case_info", dict(self.__case_info))
+        fingerprint.add_json(
+            "options",
+            {
+                "screen_recorder_filename": self.__screen_recorder_filename,
+                "packet_capture_filename": self.__packet_capture_filename,
+                "acquisition_type": self.__acquisition_type,
+                "ntp": self.__ntp,
+                "verify_result": self.__verify_result,
+                "screenshot_dpi": self.__screenshot_dpi,
+                "screenshot_tiling": self.__screenshot_tiling,
+                "hash_rows_limit": self.__hash_rows_limit,
+                "rows_per_table": self.__rows_per_table,
+                "optimize_output": self.__optimize_output,
+                "image_quality": self.__image_quality,
+                "memory_budget": self.__memory_budget,
+                "content_backend": type(self.__content_backend).__qualname__
+                if self.__content_backend is not None
+                else None,
+            },
+        )
+        fingerprint.add_text("version", get_version())
+        fingerprint.add_text(
+            "templates", get_report_templates_digest(("front.html", "content.html"))
+        )
+        fingerprint.add_text("logo", self.__fit_logo())
+
+        if self.__verify_info_file_path:
+            fingerprint.add_file("verify_info", self.__verify_info_file_path)
+
+        if self.__report_type == ReportType.ACQUISITION:
+            # The files whose content is embedded in the report are hashed.
+            index = self.__acquisition_index()
+            fingerprint.add_json("listing", self.__artifact_listing(index))
+            for name in ("acquisition.hash", "whois.txt", "acquisition_page.png"):
+                fingerprint.add_file(name, index.join(name))
+
+        return fingerprint.hexdigest()
+
+    def __reuse_cached_report(self, output_path: str, digest: str) -> bool:
+        if read_fingerprint(output_path) == digest:
+            debug(
+                f"Report inputs unchanged, keeping {output_path}", context=_LOG_CONTEXT
+            )
+            return True
+
+        cached_report = find_cached_report(self.__path, digest)
+        if cached_report is None:
+            return False
+        shutil.copyfile(cached_report, output_path)
+        write_fingerprint(output_path, digest)
+        debug(
+            f"Report inputs unchanged, copied {cached_report} to {output_path}",
+            context=_LOG_CONTEXT,
+        )
+        return True
+
+    def __fit_logo(self) -> str:
+        return get_data_uri_cache().from_resource(
+            files("fit_assets.images") / "logo-640x640.png"
+        )
+
+    def __render_front_page(self) -> str:
         template = self.__load_template("front.html")
 
-        front_page_html = template.render(
-            img=f"data:image/png;base64,{logo_base64}",
+        return template.render(
+            img=self.__fit_logo(),
             document_title=self.__translations["DOCUMENT_TITLE"],
             document_subtitle=self.__translations["DOCUMENT_SUBTITLE"],
             application_short_name=self.__translations["APPLICATION_SHORT_NAME"],
             version=get_version(),
         )
 
+    def __company_logo(self) -> str:
+        logo = (self.__case_info.get("logo_bin") or "").strip()
+        if not logo:
+            return "<div></div>"
+        return (
+            '<div style="padding-bottom: 10px;"><img src="'
+            + get_data_uri_cache().from_bytes(logo)
+            + '" height="'
+            + self.__case_info.get("logo_height", "")
+            + '" width="'
+            + self.__case_info.get("logo_width", "")
+            + '"></div>'
+        )
+
+    def __build_sections(self) -> list[dict]:
         sections = []
 
         # FIT Description
@@ -154,6 +711,146 @@ class PdfReportBuilder:
             )
 
         # Case Information
+        sections.append(
+            self.__cached_section(
+                "case_info",
+                {
+                    "case_info": {
+                        key: self.__case_info.get(key)
+                        for key in (
+                            "name",
+                            "lawyer_name",
+                            "operator",
+                            "proceeding_type_name",
+                            "courthouse",
+                            "proceeding_number",
+                            "notes",
+                        )
+                    },
+                    "acquisition_type": self.__acquisition_type,
+                    "ntp": self.__ntp,
+                },
+                self.__case_info_section,
+            )
+        )
+
+        if self.__report_type == ReportType.ACQUISITION:
+            index = self.__acquisition_index()
+            listing = self.__artifact_listing(index)
+            sections.append(
+                self.__cached_section(
+                    "system_artifacts", listing, self.__system_artifacts_section
+                )
+            )
+            sections.append(
+                self.__cached_section(
+                    "acquired_content", listing, self.__acquired_content_section
+                )
+            )
+
+            optional_sections = [
+                (
+                    "integrity_verification",
+                    {
+                        "file": self.__file_signature(index, "acquisition.hash"),
+                        "limit": self.__hash_rows_limit,
+                    },
+                    self.__integrity_verification_section,
+                ),
+                (
+                    "whois",
+                    self.__file_signature(index, "whois.txt"),
+                    self.__whois_section,
+                ),
+                (
+                    "screenshot",
+                    {
+                        "file": self.__file_signature(index, "acquisition_page.png"),
+                        "dpi": self.__screenshot_dpi,
+                    },
+                    self.__screenshot_section,
+                ),
+                (
+                    "video",
+                    {
+                        "path": self.__path,
+                        "file": self.__screen_recorder_filename
+                        and index.find_prefix(self.__screen_recorder_filename),
+                    },
+                    self.__video_section,
+                ),
+            ]
+            for kind, inputs, build in optional_sections:
+                # Derivatives and tiles are embedded inline: keep those images
+                # out of the process-wide section cache.
+                cacheable = kind != "screenshot" or not (
+                    self.__screenshot_tiling or self.__screenshot_dpi
+                )
+                section = self.__cached_section(kind, inputs, build, cacheable)
+                if section is not None:
+                    sections.append(section)
+
+        if self.__report_type == ReportType.VERIFY:
+            verify_info = ReportFingerprint()
+            if self.__verify_info_file_path:
+                verify_info.add_file("verify_info", self.__verify_info_file_path)
+            sections.append(
+                self.__cached_section(
+                    "verification_report",
+                    {
+                        "verify_result": self.__verify_result,
+                        "verify_info": verify_info.hexdigest(),
+                    },
+                    self.__verification_report_section,
+                )
+            )
+
+        return sections
+
+    def __cached_section(
+        self,
+        kind: str,
+        inputs: object,
+        build: Callable[[], dict | None],
+        cacheable: bool = True,
+    ) -> dict | None:
+        if not self.__section_cache or not cacheable:
+            return build()
+
+        if self.__translations_digest is None:
+            translations = ReportFingerprint()
+            translations.add_json("translations", dict(self.__translations or {}))
+            self.__translations_digest = translations.hexdigest()
+
+        key = ReportFingerprint()
+        key.add_text("section", kind)
+        key.add_text("translations", self.__translations_digest)
+        key.add_json("inputs", inputs)
+        return get_section_cache().get_or_build(key.hexdigest(), build)
+
+    def __file_signature(
+        self, index: AcquisitionDirectoryIndex, filename: str
+    ) -> tuple[str | None, int, int] | None:
+        stat = index.stat(filename)
+        if stat is None:
+            return None
+        return self.__path, stat.st_size, stat.st_mtime_ns
+
+    def __artifact_listing(
+        self, index: AcquisitionDirectoryIndex
+    ) -> list[tuple[str | None, str | None, bool | None]]:
+        # The artifact tables only show which known files exist and whether
+        # they are empty.
+        listing = []
+        for filename in self.__artifact_filenames():
+            actual_file = index.find_prefix(filename) if filename else None
+            listing.append(
+                (filename, actual_file, actual_file and index.is_empty(actual_file))
+            )
+        listing.append((".eml", self.__pec_eml_filename(index), None))
+        return listing
+
+    def __case_info_section(self) -> dict:
         case_rows = [
             {
                 "value": self.__translations["TABLE_ROW_LABEL_CASE"],
@@ -194,307 +891,294 @@ class PdfReportBuilder:
         case_rows.append(
             {"value": self.__translations["ACQUISITION_DATE"], "desc": self.__ntp}
         )
-        sections.append(
-            {
-                "title": self.__translations["SECTION_TITLE_GENERAL_INFORMATION"],
-                "type": "case_info",
-                "description": "",
-                "columns": [
-                    self.__translations["TABLE_COLUMN_CASE_INFO"],
-                    self.__translations["TABLE_COLUMN_CASE_DATA"],
-                ],
-                "rows": case_rows,
-                "note": self.__safe_text(self.__case_info.get("notes")) or "N/A",
-            }
-        )
+        return {
+            "title": self.__translations["SECTION_TITLE_GENERAL_INFORMATION"],
+            "type": "case_info",
+            "description": "",
+            "columns": [
+                self.__translations["TABLE_COLUMN_CASE_INFO"],
+                self.__translations["TABLE_COLUMN_CASE_DATA"],
+            ],
+            "rows": case_rows,
+            "note": self.__safe_text(self.__case_info.get("notes")) or "N/A",
+        }
 
-        # Company Logo
-        logo = (self.__case_info.get("logo_bin") or "").strip()
-        if logo:
-            logo = (
-                '<div style="padding-bottom: 10px;"><img src="data:image/png;base64,'
-                + base64.b64encode(logo).decode("utf-8")
-                + '" height="'
-                + self.__case_info.get("logo_height", "")
-                + '" width="'
-                + self.__case_info.get("logo_width", "")
-                + '"></div>'
-            )
-        else:
-            logo = "<div></div>"
+    def __system_artifacts_section(self) -> dict:
+        acquisition_files = self._acquisition_files_names()
+        file_checks = [
+            (
+                "acquisition_report.pdf",
+                self.__translations["TABLE_ROW_DESCRIPTION_REPORT"],
+            ),
+            (
+                self.__screen_recorder_filename,
+                self.__translations["TABLE_ROW_DESCRIPTION_SCREEN_CAPTURE"],
+            ),
+            ("acquisition.hash", self.__translations["TABLE_ROW_DESCRIPTION_HASH"]),
+            ("acquisition.log", self.__translations["TABLE_ROW_DESCRIPTION_LOG"]),
+            (
+                self.__packet_capture_filename,
+                self.__translations["TABLE_ROW_DESCRIPTION_PCAP"],
+            ),
+            (
+                "caseinfo.json",
+                self.__translations["TABLE_ROW_DESCRIPTION_CASE_INFORMATION"],
+            ),
+            (
+                "system_info.txt",
+                self.__translations["TABLE_ROW_DESCRIPTION_SYSTEM_INFORMATION"],
+            ),
+            (
+                "timestamp.tsr",
+                self.__translations["TABLE_ROW_DESCRIPTION_TIMESTAMP_TSR"],
+            ),
+            (
+                "tsa.crt",
+                self.__translations["TABLE_ROW_DESCRIPTION_TSA_CERTIFICATE"],
+            ),
+            ("whois.txt", self.__translations["TABLE_ROW_DESCRIPTION_WHOIS"]),
+            ("headers.txt", self.__translations["TABLE_ROW_DESCRIPTION_HEADERS"]),
+            ("nslookup.txt", self.__translations["TABLE_ROW_DESCRIPTION_NSLOOKUP"]),
+            ("server.cer", self.__translations["TABLE_ROW_DESCRIPTION_CER"]),
+            (
+                "sslkey.log",
+                self.__translations["TABLE_ROW_DESCRIPTION_SSLKEYLOG"],
+            ),
+            (
+                "traceroute.txt",
+                self.__translations["TABLE_ROW_DESCRIPTION_TRACEROUTE"],
+            ),
+        ]
 
-        if self.__report_type == ReportType.ACQUISITION:
-            # System artifacts
-            acquisition_files = self._acquisition_files_names()
-            file_checks = [
-                (
-                    "acquisition_report.pdf",
-                    self.__translations["TABLE_ROW_DESCRIPTION_REPORT"],
-                ),
-                (
-                    self.__screen_recorder_filename,
-                    self.__translations["TABLE_ROW_DESCRIPTION_SCREEN_CAPTURE"],
-                ),
-                ("acquisition.hash", self.__translations["TABLE_ROW_DESCRIPTION_HASH"]),
-                ("acquisition.log", self.__translations["TABLE_ROW_DESCRIPTION_LOG"]),
-                (
-                    self.__packet_capture_filename,
-                    self.__translations["TABLE_ROW_DESCRIPTION_PCAP"],
-                ),
-                (
-                    "caseinfo.json",
-                    self.__translations["TABLE_ROW_DESCRIPTION_CASE_INFORMATION"],
-                ),
-                (
-                    "system_info.txt",
-                    self.__translations["TABLE_ROW_DESCRIPTION_SYSTEM_INFORMATION"],
-                ),
-                (
-                    "timestamp.tsr",
-                    self.__translations["TABLE_ROW_DESCRIPTION_TIMESTAMP_TSR"],
-                ),
-                (
-                    "tsa.crt",
-                    self.__translations["TABLE_ROW_DESCRIPTION_TSA_CERTIFICATE"],
-                ),
-                ("whois.txt", self.__translations["TABLE_ROW_DESCRIPTION_WHOIS"]),
-                ("headers.txt", self.__translations["TABLE_ROW_DESCRIPTION_HEADERS"]),
-                ("nslookup.txt", self.__translations["TABLE_ROW_DESCRIPTION_NSLOOKUP"]),
-                ("server.cer", self.__translations["TABLE_ROW_DESCRIPTION_CER"]),
-                (
-                    "sslkey.log",
-                    self.__translations["TABLE_ROW_DESCRIPTION_SSLKEYLOG"],
-                ),
+        if self.__eml_filename is not None:
+            file_checks.append(
                 (
-                    "traceroute.txt",
-                    self.__translations["TABLE_ROW_DESCRIPTION_TRACEROUTE"],
+                    self.__eml_filename,
+                    self.__translations["TABLE_ROW_DESCRIPTION_PEC_EMAIL"],
                 ),
-            ]
-
-            if self.__eml_filename is not None:
-                file_checks.append(
-                    (
-                        self.__eml_filename,
-                        self.__translations["TABLE_ROW_DESCRIPTION_PEC_EMAIL"],
-                    ),
-                )
-
-            file_rows = [
-                {"value": acquisition_files[file], "desc": desc}
-                for file, desc in file_checks
-                if file in acquisition_files and acquisition_files[file]
-            ]
-
-            sections.append(
-                {
-                    "title": self.__translations["SECTION_TITLE_SYSTEM_ARTIFACTS"],
-                    "type": "system_artifacts",
-                    "description": self.__translations[
-                        "SECTION_DESCRIPTION_SYSTEM_ARTIFACTS"
-                    ],
-                    "columns": [
-                        self.__translations["TABLE_COLUMN_FILE_NAME"],
-                        self.__translations["TABLE_COLUMN_FILE_DESCRIPTION"],
-                    ],
-                    "rows": file_rows,
-                    "note": "",
-                }
             )
 
-            # Acquired Content
-            acquisition_files = self._acquisition_files_names()
-            file_checks = [
-                (
-                    "acquisition_page.png",
-                    self.__translations["TABLE_ROW_DESCRIPTION_PAGE_SCREENSHOT"],
-                ),
-                (
-                    "acquisition_page.wacz",
-                    self.__translations["TABLE_ROW_DESCRIPTION_WACZ"],
-                ),
-                (
-                    "acquisition_mail.zip",
-                    self.__translations["TABLE_ROW_DESCRIPTION_MAIL_ACQUISITION"],
-                ),
-                (
-                    "acquisition.zip",
-                    self.__translations["TABLE_ROW_DESCRIPTION_ACQUISITION_ARCHIVE"],
-                ),
-                (
-                    "screenshot.zip",
-                    self.__translations["TABLE_ROW_DESCRIPTION_SCREENSHOTS_ARCHIVE"],
-                ),
-                (
-                    "downloads.zip",
-                    self.__translations["TABLE_ROW_DESCRIPTION_DOWNLOADS_ARCHIVE"],
-                ),
-            ]
-            file_rows = [
-                {"value": acquisition_files[file], "desc": desc}
-                for file, desc in file_checks
-                if file in acquisition_files and acquisition_files[file]
-            ]
+        file_rows = [
+            {"value": acquisition_files[file], "desc": desc}
+            for file, desc in file_checks
+            if file in acquisition_files and acquisition_files[file]
+        ]
 
-            sections.append(
-                {
-                    "title": self.__translations["SECTION_TITLE_ACQUIRED_CONTENT"],
-                    "type": "acquired_content",
-                    "description": self.__translations[
-                        "SECTION_DESCRIPTION_ACQUIRED_CONTENT"
-                    ],
-                    "columns": [
-                        self.__translations["TABLE_COLUMN_FILE_NAME"],
-                        self.__translations["TABLE_COLUMN_FILE_DESCRIPTION"],
-                    ],
-                    "rows": file_rows,
-                    "note": "",
-                }
-            )
+        return {
+            "title": self.__translations["SECTION_TITLE_SYSTEM_ARTIFACTS"],
+            "type": "system_artifacts",
+            "description": self.__translations["SECTION_DESCRIPTION_SYSTEM_ARTIFACTS"],
+            "columns": [
+                self.__translations["TABLE_COLUMN_FILE_NAME"],
+                self.__translations["TABLE_COLUMN_FILE_DESCRIPTION"],
+            ],
+            "rows": file_rows,
+            "note": "",
+        }
 
-            # hash
-            hash_content = self.__hash_reader()
-            if hash_content:
-                sections.append(
-                    {
-                        "title": self.__translations[
-                            "SECTION_TITLE_INTEGRITY_VERIFICATION"
-                        ],
-                        "type": "integrity_verification",
-                        "description": self.__translations[
-                            "SECTION_DESCRIPTION_INTEGRITY_VERIFICATION"
-                        ],
-                        "content": hash_content,
-                    }
-                )
+    def __acquired_content_section(self) -> dict:
+        acquisition_files = self._acquisition_files_names()
+        file_checks = [
+            (
+                "acquisition_page.png",
+                self.__translations["TABLE_ROW_DESCRIPTION_PAGE_SCREENSHOT"],
+            ),
+            (
+                "acquisition_page.wacz",
+                self.__translations["TABLE_ROW_DESCRIPTION_WACZ"],
+            ),
+            (
+                "acquisition_mail.zip",
+                self.__translations["TABLE_ROW_DESCRIPTION_MAIL_ACQUISITION"],
+            ),
+            (
+                "acquisition.zip",
+                self.__translations["TABLE_ROW_DESCRIPTION_ACQUISITION_ARCHIVE"],
+            ),
+            (
+                "screenshot.zip",
+                self.__translations["TABLE_ROW_DESCRIPTION_SCREENSHOTS_ARCHIVE"],
+            ),
+            (
+                "downloads.zip",
+                self.__translations["TABLE_ROW_DESCRIPTION_DOWNLOADS_ARCHIVE"],
+            ),
+        ]
+        file_rows = [
+            {"value": acquisition_files[file], "desc": desc}
+            for file, desc in file_checks
+            if file in acquisition_files and acquisition_files[file]
+        ]
 
-            # whois
-            whois_content = self.__read_file("whois.txt")
-            if whois_content:
-                sections.append(
-                    {
-                        "title": self.__translations[
-                            "SECTION_TITLE_DATA_OWNERSHIP_VERIFICATION"
-                        ],
-                        "type": "whois",
-                        "description": self.__translations[
-                            "SECTION_DESCRIPTION_DATA_OWNERSHIP_VERIFICATION"
-                        ],
-                        "content": whois_content,
-                    }
-                )
+        return {
+            "title": self.__translations["SECTION_TITLE_ACQUIRED_CONTENT"],
+            "type": "acquired_content",
+            "description": self.__translations["SECTION_DESCRIPTION_ACQUIRED_CONTENT"],
+            "columns": [
+                self.__translations["TABLE_COLUMN_FILE_NAME"],
+                self.__translations["TABLE_COLUMN_FILE_DESCRIPTION"],
+            ],
+            "rows": file_rows,
+            "note": "",
+        }
 
-            # Screenshots
-            screenshot_content = self.__insert_screenshot()
-            if screenshot_content:
-                sections.append(
-                    {
-                        "title": self.__translations.get(
-                            "SCREENSHOT_LINK_LABEL",
-                            self.__translations["SECTION_TITLE_SCREENSHOTS"],
-                        ),
-                        "type": "screenshot",
-                        "description": self.__translations[
-                            "SECTION_DESCRIPTION_SCREENSHOTS"
-                        ],
-                        "content": screenshot_content,
-                    }
-                )
+    def __integrity_verification_section(self) -> dict | None:
+        hash_content = self.__hash_reader()
+        if not hash_content:
+            return None
+        return {
+            "title": self.__translations["SECTION_TITLE_INTEGRITY_VERIFICATION"],
+            "type": "integrity_verification",
+            "description": self.__translations[
+                "SECTION_DESCRIPTION_INTEGRITY_VERIFICATION"
+            ],
+            "content": hash_content,
+        }
 
-            # Video
-            video_content = self.__insert_video_hyperlink()
-            if video_content:
-                sections.append(
-                    {
-                        "title": self.__translations["SECTION_TITLE_VIDEO_ACQUISITION"],
-                        "type": "video",
-                        "description": self.__translations[
-                            "SECTION_DESCRIPTION_VIDEO_ACQUISITION"
-                        ],
-                        "content": video_content,
-                    }
-                )
+    def __whois_section(self) -> dict | None:
+        whois_content = self.__read_file("whois.txt")
+        if not whois_content:
+            return None
+        return {
+            "title": self.__translations["SECTION_TITLE_DATA_OWNERSHIP_VERIFICATION"],
+            "type": "whois",
+            "description": self.__translations[
+                "SECTION_DESCRIPTION_DATA_OWNERSHIP_VERIFICATION"
+            ],
+            "content": whois_content,
+        }
 
-        if self.__report_type == ReportType.VERIFY:
-            # Verification report
-            verification_result = ""
-            if self.__verify_result:
-                verification_result = (
-                    self.__translations["VERIFI_OK"]
-                    if self.__verify_result
-                    else self.__translations["VERIFI_KO"]
-                )
-            info_file = ""
-            if self.__verify_info_file_path:
-                with open(self.__verify_info_file_path, "r") as f:
-                    info_file = f.read()
+    def __screenshot_section(self) -> dict | None:
+        screenshot_content = self.__insert_screenshot()
+        if not screenshot_content:
+            return None
+        return {
+            "title": self.__translations.get(
+                "SCREENSHOT_LINK_LABEL",
+                self.__translations["SECTION_TITLE_SCREENSHOTS"],
+            ),
+            "type": "screenshot",
+            "description": self.__translations["SECTION_DESCRIPTION_SCREENSHOTS"],
+            "content": screenshot_content,
+        }
 
-            sections.append(
-                {
-                    "title": self.__translations["SECTION_TITLE_VERIFICATION"],
-                    "type": "verification_report",
-                    "verification_result": verification_result,
-                    "content": info_file,
-                }
+    def __video_section(self) -> dict | None:
+        video_content = self.__insert_video_hyperlink()
+        if not video_content:
+            return None
+        return {
+            "title": self.__translations["SECTION_TITLE_VIDEO_ACQUISITION"],
+            "type": "video",
+            "description": self.__translations["SECTION_DESCRIPTION_VIDEO_ACQUISITION"],
+            "content": video_content,
+        }
+
+    def __verification_report_section(self) -> dict:
+        verification_result = ""
+        if self.__verify_result is not None:
+            verification_result = (
+                self.__translations["VERIFI_OK"]
+                if self.__verify_result
+                else self.__translations["VERIFI_KO"]
             )
+        info_file = ""
+        if self.__verify_info_file_path:
+            with open(self.__verify_info_file_path, "r") as f:
+                info_file = f.read()
+
+        return {
+            "title": self.__translations["SECTION_TITLE_VERIFICATION"],
+            "type": "verification_report",
+            "verification_result": verification_result,
+            "content": info_file,
+        }
 
-        template = Template(
-            (files("fit_assets.templates") / "content.html").read_text(encoding="utf-8")
-        )
+    def __content_context(self) -> dict[str, str]:
+        return {
+            "title": self.__translations["APPLICATION_SHORT_NAME"],
+            "document_title": self.__translations["DOCUMENT_TITLE"],
+            "index": self.__translations["INDEX"],
+            "note": self.__translations["NOTE"],
+            "logo": self.__company_logo(),
+            "page": self.__translations["PAGE"],
+            "of": self.__translations["OF"],
+        }
 
-        content_page_html = template.render(
-            title=self.__translations["APPLICATION_SHORT_NAME"],
-            document_title=self.__translations["DOCUMENT_TITLE"],
-            index=self.__translations["INDEX"],
-            sections=sections,
-            note=self.__translations["NOTE"],
-            logo=logo,
-            page=self.__translations["PAGE"],
-            of=self.__translations["OF"],
-        )
+    def __render_content_page(self, sections: list[dict]) -> str:
+        template = self.__load_template("content.html")
 
-        pdf_options = {
-            "page-size": "Letter",
-            "margin-top": "1in",
-            "margin-right": "1in",
-            "margin-bottom": "1in",
-            "margin-left": "1in",
-        }
+        return template.render(sections=sections, **self.__content_context())
 
-        # create pdf front and content, merge them and remove merged files
-        with open(self.__output_front, "w+b") as front_result:
-            pisa.CreatePDF(front_page_html, dest=front_result, options=pdf_options)
+    def __render_to_temp_files(
+        self, front_html: str, content_html: str, options: Mapping[str, str]
+    ) -> None:
+        if self.__parallel_rendering or self.__renderer is not None:
+            front_pdf, content_pdf = self.__render_to_bytes(
+                front_html, content_html, options
+            )
+            with open(self.__output_front, "wb") as front_result:
+                front_result.write(front_pdf)
+            with open(self.__output_content, "wb") as content_result:
+                content_result.write(content_pdf)
+            return
+
+        measure = self.__stage
+        with measure(ReportStage.RENDER_FRONT):
+            with open(self.__output_front, "w+b") as front_result:
+                pisa.CreatePDF(front_html, dest=front_result, options=options)
+
+        with measure(ReportStage.RENDER_CONTENT):
+            with open(self.__output_content, "w+b") as content_result:
+                pisa.CreatePDF(content_html, dest=content_result, options=options)
+
+    def __render_to_bytes(
+        self, front_html: str, content_html: str, options: Mapping[str, str]
+    ) -> tuple[bytes, bytes]:
+        measure = self.__stage
+        if self.__parallel_rendering:
+            # Spawning a process per report costs far more than the front
+            # page it saves, so the content goes to a long-lived warm worker
+            # (the shared one unless a renderer is set) while this process
+            # renders the front page; the thread only waits on the pipe.
+            renderer = self.__renderer or get_renderer_worker()
+            with (
+                measure(ReportStage.RENDER),
+                ThreadPoolExecutor(max_workers=1) as executor,
+            ):
+                content_future = executor.submit(
+                    renderer.render, content_html, options, fallback=False
+                )
+                front_pdf = render_pdf(front_html, options)
+                try:
+                    content_pdf = content_future.result()
+                except RendererUnavailable as exc:
+                    # reportlab is not thread-safe: without a worker process
+                    # the content is rendered here, after the front page.
+                    debug(
+                        f"Renderer worker unavailable, rendering serially: {exc}",
+                        context=_LOG_CONTEXT,
+                    )
+                    content_pdf = render_pdf(content_html, options)
+                return front_pdf, content_pdf
 
-        with open(self.__output_content, "w+b") as content_result:
-            pisa.CreatePDF(content_page_html, dest=content_result, options=pdf_options)
+        render = self.__renderer.render if self.__renderer is not None else render_pdf
+        with measure(ReportStage.RENDER_FRONT):
+            front_pdf = render(front_html, options)
+        with measure(ReportStage.RENDER_CONTENT):
+            content_pdf = render(content_html, options)
+        return front_pdf, content_pdf
 
+    @staticmethod
+    def __merge_documents(documents: list[BinaryIO]) -> PdfWriter:
         writer = PdfWriter()
-        with open(self.__output_front, "rb") as f_front:
-            reader_front = PdfReader(f_front)
-            for page in reader_front.pages:
+        for document in documents:
+            reader = PdfReader(document)
+            for page in reader.pages:
                 writer.add_page(page)
-
-        with open(self.__output_content, "rb") as f_content:
-            reader_content = PdfReader(f_content)
-            for page in reader_content.pages:
-                writer.add_page(page)
-
-        output_path = os.path.join(self.__path, self.__filename)
-        with open(output_path, "wb") as f_out:
-            writer.write(f_out)
-
-        if os.path.exists(self.__output_front):
-            os.remove(self.__output_front)
-        if os.path.exists(self.__output_content):
-            os.remove(self.__output_content)
-        if self.__verify_info_file_path is not None and os.path.exists(
-            self.__verify_info_file_path
-        ):
-            os.remove(self.__verify_info_file_path)
+        return writer
 
     def __load_template(self, template: str) -> Template:
-        return Template(
-            (files("fit_assets.templates") / template).read_text(encoding="utf-8")
-        )
+        return get_report_template(template)
 
     def __read_file(self, filename: str) -> str | None:
         try:
@@ -510,23 +1194,23 @@ class PdfReportBuilder:
     def __force_wrap(self, text: str, every: int = 80) -> str:
         return "\n".join(text[i : i + every] for i in range(0, len(text), every))
 
-    def __pec_eml_filename(self) -> str | None:
-        if not self.__path or not os.path.isdir(self.__path):
-            return None
-
-        for entry in os.scandir(self.__path):
-            if entry.is_file() and entry.name.lower().endswith(".eml"):
-                return entry.name
-
-        return None
-
-    def _acquisition_files_names(self) -> dict[str, str]:
-        acquisition_files = {}
-        files = [f.name for f in os.scandir(self.__path) if f.is_file()]
-        for file in files:
-            acquisition_files[file] = file
-
-        file_checks = [
+    def __acquisition_index(self) -> AcquisitionDirectoryIndex:
+        # generate_pdf shares one snapshot between all section builders;
+        # outside of it every lookup sees the folder as it is now.
+        if self.__index is not None:
+            return self.__index
+        return AcquisitionDirectoryIndex.scan(self.__path)
+
+    def __pec_eml_filename(
+        self, index: AcquisitionDirectoryIndex | None = None
+    ) -> str | None:
+        if index is None:
+            index = self.__acquisition_index()
+        eml_files = index.with_suffix(".eml", case_sensitive=False)
+        return eml_files[0] if eml_files else None
+
+    def __artifact_filenames(self) -> list[str | None]:
+        return [
             "acquisition_page.png",
             "acquisition_page.wacz",
             "acquisition_mail.zip",
@@ -550,72 +1234,145 @@ class PdfReportBuilder:
             "whois.txt",
         ]
 
-        for filename in file_checks:
-            matching_files = [
-                file for file in acquisition_files.values() if file.startswith(filename)
-            ]
+    def _acquisition_files_names(self) -> dict[str, str]:
+        index = self.__acquisition_index()
+        acquisition_files = {name: name for name in index.names()}
+
+        for filename in self.__artifact_filenames():
+            if not filename:
+                continue
 
-            if not matching_files:
+            actual_file = index.find_prefix(filename)
+            if actual_file is None:
                 acquisition_files.pop(filename, None)
-            else:
-                actual_file = matching_files[0]
-                if self.__is_empty_file(actual_file):
-                    acquisition_files[actual_file] = self.__translations[
-                        "EMPTY_FILE"
-                    ].format(actual_file)
-
-        self.__eml_filename = self.__pec_eml_filename()
+            elif index.is_empty(actual_file):
+                acquisition_files[actual_file] = self.__translations[
+                    "EMPTY_FILE"
+                ].format(actual_file)
+
+        self.__eml_filename = self.__pec_eml_filename(index)
         if self.__eml_filename is not None:
             acquisition_files[self.__eml_filename] = self.__eml_filename
 
         return acquisition_files
 
-    def __is_empty_file(self, filename: str) -> bool:
-        path = os.path.join(self.__path, filename)
-        return not os.path.isfile(path) or os.path.getsize(path) == 0
-
     def _zip_files_enum(self) -> str:
-        zip_enum = ""
-        zip_dir = None
-        # getting zip folder and passing file names and dimensions to the template
-        for fname in os.listdir(self.__path):
-            if fname.endswith(".zip"):
-                zip_dir = os.path.join(self.__path, fname)
-
-        if zip_dir:
-            zip_folder = zipfile.ZipFile(zip_dir)
-            for zip_file in zip_folder.filelist:
-                size = zip_file.file_size
-                filename = zip_file.filename
-                if filename.count(".") > 1:
-                    filename = filename.rsplit(".", 1)[0]
-                else:
-                    pass
-                if size > 0:
-                    zip_enum += "<p>" + self.__force_wrap(filename, 78) + "</p>"
-                    zip_enum += (
-                        "<p>" + self.__translations["SIZE"] + str(size) + " bytes</p>"
+        return "".join(self.__zip_fragments())
+
+    def __zip_fragments(self) -> Iterator[str]:
+        # Every archive in the folder, entries streamed from the central
+        # directory, followed by its totals.
+        index = self.__acquisition_index()
+        listed = 0
+        for archive in index.with_suffix(".zip"):
+            files = 0
+            total_size = 0
+            try:
+                for entry in iter_zip_manifest(index.join(archive)):
+                    size = entry.file_size
+                    if size <= 0:
+                        continue
+                    filename = entry.filename
+                    if filename.count(".") > 1:
+                        filename = filename.rsplit(".", 1)[0]
+                    if (
+                        self.__zip_entries_per_page
+                        and listed
+                        and listed % self.__zip_entries_per_page == 0
+                    ):
+                        yield "<pdf:nextpage />"
+                    yield (
+                        "<p>"
+                        + self.__force_wrap(filename, 78)
+                        + "</p><p>"
+                        + self.__translations["SIZE"]
+                        + str(size)
+                        + " bytes</p><hr>"
                     )
-                    zip_enum += "<hr>"
-        return zip_enum
+                    listed += 1
+                    files += 1
+                    total_size += size
+            except (OSError, zipfile.BadZipFile) as exc:
+                debug(f"Unable to list {archive}: {exc}", context=_LOG_CONTEXT)
+            yield (
+                "<p><b>"
+                + archive
+                + "</b>: "
+                + self.__translations.get(
+                    "ZIP_ARCHIVE_TOTALS", "{0} files, {1} bytes"
+                ).format(files, total_size)
+                + "</p>"
+            )
 
     def __hash_reader(self) -> str:
-        hash_text = ""
-        filename = "acquisition.hash"
+        return "".join(self.__hash_fragments())
 
-        if self.__read_file(filename):
-            with open(
-                os.path.join(
-                    self.__path,
-                    filename,
-                ),
-                "r",
-                encoding="latin-1",
-            ) as f:
-                for line in f:
-                    hash_text += "<p>" + line + "</p>"
+    def __hash_fragments(self) -> Iterator[str]:
+        # One pass over the manifest: rows are yielded as they are read and
+        # joined once, instead of growing a string line by line.
+        filename = "acquisition.hash"
+        file_path = os.path.join(self.__path, filename)
+        try:
+            # hash_acquisition writes the manifest as UTF-8; older ones were
+            # latin-1, which decodes any byte.
+            f = open(file_path, "r", encoding=self.__text_encoding(file_path))
+        except OSError:
+            return
+
+        with f:
+            # Leading blank lines are held back: a manifest with no content
+            # produces no section at all.
+            leading: list[str] = []
+            has_content = False
+            rows = 0
+            omitted = 0
+            for line in f:
+                if not has_content:
+                    if not line.strip():
+                        leading.append(line)
+                        continue
+                    has_content = True
+                    for blank in leading:
+                        if self.__hash_row_allowed(rows):
+                            rows += 1
+                            yield "<p>" + blank + "</p>"
+                        else:
+                            omitted += 1
+                if self.__hash_row_allowed(rows):
+                    rows += 1
+                    yield "<p>" + line + "</p>"
+                else:
+                    omitted += 1
+
+        if omitted:
+            yield (
+                "<p>"
+                + self.__translations.get(
+                    "HASH_ROWS_OMITTED",
+                    "{0} more lines are not shown, see the full list in {1}",
+                ).format(
+                    omitted,
+                    '<a href="file://' + file_path + '">' + filename + "</a>",
+                )
+                + "</p>"
+            )
 
-        return hash_text
+    @staticmethod
+    def __text_encoding(path: str) -> str:
+        # Decoded in blocks up front: the rows are streamed, and a late
+        # UnicodeDecodeError would come after some were already yielded.
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with open(path, "rb") as f:
+            try:
+                while block := f.read(1024 * 1024):
+                    decoder.decode(block)
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                return "latin-1"
+        return "utf-8"
+
+    def __hash_row_allowed(self, rows: int) -> bool:
+        return self.__hash_rows_limit is None or rows < self.__hash_rows_limit
 
     def __insert_screenshot(self) -> str:
         screenshot_path = os.path.join(self.__path, "acquisition_page.png")
@@ -628,11 +1385,49 @@ class PdfReportBuilder:
         max_height = 520
         width, height = self.__read_png_dimensions(screenshot_path)
         img_attributes = 'style="display:block; margin: 0 auto;"'
+        image_source = screenshot_path
+        link = (
+            "<p>"
+            '<a href="file://'
+            + screenshot_path
+            + '">'
+            + self.__translations["SCREENSHOT_LINK_LABEL"]
+            + "</a></p>"
+        )
+
+        if (
+            self.__screenshot_tiling
+            and width
+            and height
+            and height * max_width > width * max_height
+        ):
+            # Too tall to stay readable on one page: one strip per page.
+            tiles = tile_screenshot(
+                screenshot_path,
+                self.__output_tiles,
+                max_width,
+                max_height,
+                dpi=self.__screenshot_dpi or 150,
+            )
+            if tiles:
+                # Inline, as pisa may not read files outside the cwd.
+                return link + "<pdf:nextpage />".join(
+                    f'<p><img src="{data_uri(Path(tile.path).read_bytes())}" '
+                    f'width="{tile.width_pt}" '
+                    f'height="{tile.height_pt}" '
+                    'style="display:block; margin: 0 auto;"></p>'
+                    for tile in tiles
+                )
 
         if width and height and width > 0 and height > 0:
             scale = min(max_width / width, max_height / height, 1)
             render_width = max(1, int(width * scale))
             render_height = max(1, int(height * scale))
+            if self.__screenshot_dpi:
+                # Embed a right-sized copy, the link still opens the original.
+                image_source = self.__embedded_derivative(
+                    screenshot_path, render_width, render_height
+                )
             img_attributes = (
                 f'width="{render_width}" height="{render_height}" '
                 'style="display:block; margin: 0 auto;"'
@@ -643,18 +1438,25 @@ class PdfReportBuilder:
                 'style="display:block; margin: 0 auto;"'
             )
 
-        return (
-            "<p>"
-            '<a href="file://'
-            + screenshot_path
-            + '">'
-            + self.__translations["SCREENSHOT_LINK_LABEL"]
-            + '</a></p><p><img src="'
-            + screenshot_path
-            + '" '
-            + img_attributes
-            + "></p>"
+        return link + '<p><img src="' + image_source + '" ' + img_attributes + "></p>"
+
+    def __embedded_derivative(
+        self, screenshot_path: str, width: int, height: int
+    ) -> str:
+        derivative = screenshot_derivative(
+            screenshot_path, width, height, dpi=self.__screenshot_dpi or 150
         )
+        if derivative is None or derivative == screenshot_path:
+            return screenshot_path
+        # The derivative cache is outside the cwd, where pisa may not read.
+        try:
+            return get_data_uri_cache().from_resource(Path(derivative))
+        except OSError as exc:
+            debug(
+                f"Unable to embed screenshot derivative {derivative}: {exc}",
+                context=_LOG_CONTEXT,
+            )
+            return screenshot_path
 
     @staticmethod
     def __read_png_dimensions(path: str) -> tuple[int | None, int | None]:
@@ -676,19 +1478,13 @@ class PdfReportBuilder:
         return width, height
 
     def __insert_video_hyperlink(self) -> str | None:
-        acquisition_files = {}
-        files = [f.name for f in os.scandir(self.__path) if f.is_file()]
-        for file in files:
-            acquisition_files[file] = file
-
-        matching_files = [
-            file
-            for file in acquisition_files.values()
-            if file.startswith(self.__screen_recorder_filename)
-        ]
+        actual_filename = None
+        if self.__screen_recorder_filename:
+            actual_filename = self.__acquisition_index().find_prefix(
+                self.__screen_recorder_filename
+            )
 
-        if matching_files:
-            actual_filename = matching_files[0]
+        if actual_filename:
             hyperlink = (
                 '<a href="file://'
                 + os.path.join(self.__path, actual_filename)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Memoized base64 data URIs for images embedded in PDF reports."""
+
+import base64
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from importlib.resources.abc import Traversable
+from typing import Callable
+
+from fit_common.core.cache_info import CacheInfo
+
+
+def data_uri(data: bytes, mime: str = "image/png") -> str:
+    """Encode ``data`` inline, so pisa never has to read a file for it."""
+
+    return f"data:{mime};base64,{base64.b64encode(data).decode('utf-8')}"
+
+
+class DataUriCache:
+    """LRU of encoded data URIs keyed by resource identity and content digest.
+
+    File-backed resources are validated with their size and mtime so a hit
+    does not even read the file; anything else is keyed by its SHA-256.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.__maxsize = maxsize
+        self.__entries: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def from_bytes(
+        self, data: bytes, mime: str = "image/png", identity: str = "bytes"
+    ) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        return self.__get((identity, mime, digest), lambda: data)
+
+    def from_resource(self, resource: Traversable, mime: str = "image/png") -> str:
+        identity = str(resource)
+        if not isinstance(resource, os.PathLike):
+            return self.from_bytes(resource.read_bytes(), mime, identity)
+
+        stat = os.stat(resource)
+        signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+        return self.__get((identity, mime, signature), resource.read_bytes)
+
+    def cache_info(self) -> CacheInfo:
+        with self.__lock:
+            return CacheInfo(
+                self.__hits, self.__misses, self.__maxsize, len(self.__entries)
+            )
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def __get(self, key: tuple[str, str, str], read: Callable[[], bytes]) -> str:
+        with self.__lock:
+            uri = self.__entries.get(key)
+            if uri is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return uri
+            self.__misses += 1
+
+        uri = data_uri(read(), key[1])
+
+        with self.__lock:
+            self.__entries[key] = uri
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+        return uri
+
+
+_data_uri_cache = DataUriCache()
+
+
+def get_data_uri_cache() -> DataUriCache:
+    """Return the process-wide cache used by PdfReportBuilder."""
+
+    return _data_uri_cache
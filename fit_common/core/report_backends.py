@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Rendering backends for the content document of PDF reports."""
+
+import io
+from typing import Any, Mapping, Protocol
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import (
+    Flowable,
+    LongTable,
+    Paragraph,
+    Preformatted,
+    SimpleDocTemplate,
+    Spacer,
+    TableStyle,
+)
+from xhtml2pdf.document import pisaStory
+
+Section = Mapping[str, Any]
+
+# Advance width of a Courier glyph, as a fraction of the font size.
+_COURIER_CHAR_WIDTH = 0.6
+_LINES_PER_BLOCK = 200
+
+
+class ContentBackend(Protocol):
+    def render_content(
+        self, sections: list[Section], context: Mapping[str, Any]
+    ) -> bytes:
+        """Return the content document as PDF bytes.
+
+        ``context`` holds the values passed to content.html besides the
+        sections: title, document_title, index, note, logo, page and of.
+        """
+        ...
+
+
+class _NumberedCanvas(Canvas):
+    """Canvas that writes "page N of M" once the page count is known."""
+
+    def __init__(
+        self, *args: Any, page_label: str = "", of_label: str = "", **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.__page_label = page_label
+        self.__of_label = of_label
+        self.__pages: list[dict[str, Any]] = []
+
+    def showPage(self) -> None:
+        self.__pages.append(dict(self.__dict__))
+        self._startPage()
+
+    def save(self) -> None:
+        total = len(self.__pages)
+        for state in self.__pages:
+            self.__dict__.update(state)
+            self.setFont("Helvetica", 8)
+            self.drawCentredString(
+                self._pagesize[0] / 2,
+                0.5 * inch,
+                f"{self.__page_label} {self._pageNumber} {self.__of_label} {total}",
+            )
+            super().showPage()
+        super().save()
+
+
+class ReportlabBackend:
+    """Draw structured sections with platypus, free-form HTML with xhtml2pdf.
+
+    Tables, hash lines, whois and verification text are laid out directly as
+    reportlab flowables; descriptions, links, screenshots and other HTML
+    fragments go through xhtml2pdf's parser, one fragment at a time. The
+    index lists section titles without page numbers, so the document is
+    built in a single pass.
+    """
+
+    def __init__(self, page_size: tuple[float, float] = letter) -> None:
+        self.__page_size = page_size
+        styles = getSampleStyleSheet()
+        self.__title_style = styles["Title"]
+        self.__heading_style = styles["Heading2"]
+        self.__subheading_style = styles["Heading3"]
+        self.__body_style = styles["BodyText"]
+        self.__cell_style = ParagraphStyle(
+            "FitCell", parent=styles["BodyText"], fontSize=8, leading=10
+        )
+        self.__line_style = ParagraphStyle(
+            "FitLine", parent=styles["Code"], fontSize=7, leading=9, leftIndent=0
+        )
+
+    def render_content(
+        self, sections: list[Section], context: Mapping[str, Any]
+    ) -> bytes:
+        buffer = io.BytesIO()
+        document = SimpleDocTemplate(
+            buffer,
+            pagesize=self.__page_size,
+            leftMargin=inch,
+            rightMargin=inch,
+            topMargin=inch,
+            bottomMargin=inch,
+            title=str(context.get("document_title", "")),
+        )
+        story = self.__story(sections, context, document.width)
+        document.build(
+            story,
+            canvasmaker=lambda *args, **kwargs: _NumberedCanvas(
+                *args,
+                page_label=str(context.get("page", "")),
+                of_label=str(context.get("of", "")),
+                **kwargs,
+            ),
+        )
+        return buffer.getvalue()
+
+    def __story(
+        self, sections: list[Section], context: Mapping[str, Any], width: float
+    ) -> list[Flowable]:
+        story: list[Flowable] = []
+        logo = str(context.get("logo") or "")
+        if logo and logo != "<div></div>":
+            story.extend(self.__html(logo))
+        story.append(
+            Paragraph(
+                escape(str(context.get("document_title", ""))), self.__title_style
+            )
+        )
+
+        titled = [section for section in sections if not section.get("continued")]
+        story.append(
+            Paragraph(escape(str(context.get("index", ""))), self.__heading_style)
+        )
+        for number, section in enumerate(titled, start=1):
+            story.append(
+                Paragraph(
+                    f"{number}. {escape(str(section.get('title', '')))}",
+                    self.__body_style,
+                )
+            )
+
+        number = 0
+        for section in sections:
+            if not section.get("continued"):
+                number += 1
+                story.append(
+                    Paragraph(
+                        f"{number}. {escape(str(section.get('title', '')))}",
+                        self.__heading_style,
+                    )
+                )
+                if section.get("description"):
+                    story.extend(self.__html(str(section["description"])))
+            story.extend(self.__section_body(section, context, width))
+        return story
+
+    def __section_body(
+        self, section: Section, context: Mapping[str, Any], width: float
+    ) -> list[Flowable]:
+        kind = section.get("type")
+        body: list[Flowable] = []
+
+        if "rows" in section:
+            body.append(self.__table(section, width))
+            if section.get("note"):
+                body.append(
+                    Paragraph(
+                        f"<b>{escape(str(context.get('note', '')))}</b>: "
+                        + escape(str(section["note"])),
+                        self.__body_style,
+                    )
+                )
+        elif kind == "digital_forensics":
+            for key, subtitle in dict(section.get("subtitles") or {}).items():
+                body.append(Paragraph(escape(str(subtitle)), self.__subheading_style))
+                body.extend(
+                    self.__html(str(dict(section.get("contents") or {}).get(key, "")))
+                )
+        elif kind == "integrity_verification":
+            body.extend(self.__hash_lines(str(section.get("content") or ""), width))
+        elif kind in ("whois", "verification_report"):
+            if section.get("verification_result"):
+                body.append(
+                    Paragraph(
+                        f"<b>{escape(str(section['verification_result']))}</b>",
+                        self.__body_style,
+                    )
+                )
+            body.extend(
+                self.__preformatted(
+                    str(section.get("content") or "").splitlines(), width
+                )
+            )
+        elif section.get("content"):
+            body.extend(self.__html(str(section["content"])))
+
+        body.append(Spacer(1, 12))
+        return body
+
+    def __table(self, section: Section, width: float) -> LongTable:
+        columns = list(section.get("columns") or [])
+        data = [
+            [
+                Paragraph(f"<b>{escape(str(column))}</b>", self.__cell_style)
+                for column in columns
+            ]
+        ]
+        for row in section.get("rows") or []:
+            data.append(
+                [
+                    Paragraph(escape(str(row.get("value", ""))), self.__cell_style),
+                    Paragraph(escape(str(row.get("desc", ""))), self.__cell_style),
+                ]
+            )
+        table = LongTable(data, colWidths=[width / 2, width / 2], repeatRows=1)
+        table.setStyle(
+            TableStyle(
+                [
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ]
+            )
+        )
+        return table
+
+    def __hash_lines(self, content: str, width: float) -> list[Flowable]:
+        # The builder emits one "<p>line</p>" per manifest line; the overflow
+        # summary is its own markup and is kept as such.
+        flowables: list[Flowable] = []
+        lines: list[str] = []
+        for fragment in content.split("</p>"):
+            fragment = fragment.removeprefix("<p>").strip()
+            if not fragment:
+                continue
+            if "<a href=" in fragment:
+                flowables.extend(self.__preformatted(lines, width))
+                lines = []
+                flowables.append(Paragraph(fragment, self.__body_style))
+            else:
+                lines.append(fragment)
+        flowables.extend(self.__preformatted(lines, width))
+        return flowables
+
+    def __preformatted(self, lines: list[str], width: float) -> list[Flowable]:
+        # Plain text needs no markup parsing: fixed-width blocks of lines,
+        # wrapped by character count, are far cheaper than one paragraph
+        # per line.
+        max_length = max(
+            1, int(width / (_COURIER_CHAR_WIDTH * self.__line_style.fontSize))
+        )
+        return [
+            Preformatted(
+                "\n".join(lines[start : start + _LINES_PER_BLOCK]),
+                self.__line_style,
+                maxLineLength=max_length,
+                newLineChars="",
+            )
+            for start in range(0, len(lines), _LINES_PER_BLOCK)
+        ]
+
+    @staticmethod
+    def __html(html: str) -> list[Flowable]:
+        return list(pisaStory(html).story)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Generate many PDF reports across a pool of worker processes."""
+
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing.queues import SimpleQueue
+from typing import Iterable, Mapping
+
+from fit_common.core.acquisition_type import AcquisitionType
+from fit_common.core.debug import debug
+from fit_common.core.pdf_report_builder import PdfReportBuilder, ReportType
+
+_LOG_CONTEXT = "fit_common.core.report_batch"
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    report_type: ReportType
+    path: str
+    filename: str
+    translations: Mapping[str, str]
+    case_info: Mapping[str, object] | None = None
+    screen_recorder_filename: str | None = None
+    packet_capture_filename: str | None = None
+    acquisition_type: AcquisitionType | None = None
+    ntp: str | None = None
+    verify_result: bool | None = None
+    verify_info_file_path: str | None = None
+    # Extra PdfReportBuilder properties, e.g. {"in_memory": True}.
+    options: Mapping[str, object] = field(default_factory=dict)
+
+    @property
+    def output_path(self) -> str:
+        return os.path.join(self.path, self.filename)
+
+    def build(self) -> PdfReportBuilder:
+        builder = PdfReportBuilder(
+            self.report_type,
+            translations=self.translations,
+            path=self.path,
+            filename=self.filename,
+            case_info=self.case_info,
+            screen_recorder_filename=self.screen_recorder_filename,
+            packet_capture_filename=self.packet_capture_filename,
+        )
+        builder.acquisition_type = self.acquisition_type
+        builder.ntp = self.ntp
+        builder.verify_result = self.verify_result
+        builder.verify_info_file_path = self.verify_info_file_path
+        for name, value in self.options.items():
+            option = getattr(PdfReportBuilder, name, None)
+            if not isinstance(option, property) or option.fset is None:
+                raise ValueError(
+                    f"Unknown or read-only PdfReportBuilder option: {name}"
+                )
+            setattr(builder, name, value)
+        return builder
+
+
+@dataclass(frozen=True)
+class ReportJobResult:
+    job: ReportJob
+    output_path: str | None
+    error: str | None
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_report_job(job: ReportJob) -> ReportJobResult:
+    started = time.perf_counter()
+    try:
+        job.build().generate_pdf()
+    except Exception:
+        return ReportJobResult(
+            job, None, traceback.format_exc(), time.perf_counter() - started
+        )
+    return ReportJobResult(job, job.output_path, None, time.perf_counter() - started)
+
+
+# Set in each worker: where it announces the position of every job it starts.
+_started: SimpleQueue | None = None
+
+
+def _run_started_job(position: int, job: ReportJob) -> ReportJobResult:
+    if _started is not None:
+        # Written straight to the pipe, so it survives a crash of this job.
+        _started.put(position)
+    return _run_report_job(job)
+
+
+def _init_worker(memory_limit: int | None, started: SimpleQueue | None) -> None:
+    global _started
+    _started = started
+    _limit_worker_memory(memory_limit)
+
+
+def _limit_worker_memory(memory_limit: int | None) -> None:
+    if memory_limit is None:
+        return
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows: workers are only recycled.
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _run_pool(
+    jobs: list[ReportJob],
+    max_workers: int | None,
+    max_tasks_per_child: int | None,
+    memory_limit: int | None,
+) -> tuple[dict[int, ReportJobResult], list[int], list[int]]:
+    """Run ``jobs`` in one pool, by position.
+
+    Returns the results, then the jobs that were running when the pool
+    broke and those that had not started yet.
+    """
+
+    context = multiprocessing.get_context("spawn")
+    started_queue = context.SimpleQueue()
+    started: set[int] = set()
+    results: dict[int, ReportJobResult] = {}
+    broken: list[int] = []
+
+    def drain() -> None:
+        # Keep the pipe from filling up while the workers announce jobs.
+        while not started_queue.empty():
+            started.add(started_queue.get())
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(memory_limit, started_queue),
+        max_tasks_per_child=max_tasks_per_child,
+    ) as executor:
+        futures: dict[Future[ReportJobResult], int] = {
+            executor.submit(_run_started_job, position, job): position
+            for position, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            position = futures[future]
+            try:
+                results[position] = future.result()
+            except BrokenProcessPool:
+                broken.append(position)
+            except Exception:
+                # e.g. a job that cannot be pickled to reach the worker
+                results[position] = ReportJobResult(
+                    jobs[position], None, traceback.format_exc(), 0.0
+                )
+            drain()
+    drain()
+    started_queue.close()
+
+    broken.sort()
+    running = [position for position in broken if position in started]
+    waiting = [position for position in broken if position not in started]
+    return results, running, waiting
+
+
+def generate_reports(
+    jobs: Iterable[ReportJob],
+    max_workers: int | None = None,
+    max_tasks_per_child: int | None = 20,
+    memory_limit: int | None = None,
+) -> list[ReportJobResult]:
+    """Run report jobs in parallel and return one result per job, in order.
+
+    Workers are recycled after ``max_tasks_per_child`` reports and, on POSIX,
+    capped to ``memory_limit`` bytes of address space. A job that raises is
+    reported as an error. A worker that dies takes the whole pool with it:
+    the jobs that were running are retried one pool per job, so the blame
+    lands on the folder that actually crashed, and the jobs that had not
+    started yet go to a new shared pool.
+    """
+
+    pending = list(jobs)
+    results: dict[int, ReportJobResult] = {}
+    remaining = list(range(len(pending)))
+
+    while remaining:
+        batch = [pending[position] for position in remaining]
+        done, running, waiting = _run_pool(
+            batch, max_workers, max_tasks_per_child, memory_limit
+        )
+        for index, result in done.items():
+            results[remaining[index]] = result
+        if not running:
+            # The pool broke before any job started: isolate them all.
+            running, waiting = waiting, []
+
+        for index in running:
+            position = remaining[index]
+            job = pending[position]
+            debug(
+                f"Worker pool broken, retrying {job.output_path} in isolation",
+                context=_LOG_CONTEXT,
+            )
+            isolated, crashed, never_started = _run_pool([job], 1, 1, memory_limit)
+            if crashed or never_started:
+                results[position] = ReportJobResult(
+                    job, None, "Report worker process terminated abruptly", 0.0
+                )
+            else:
+                results[position] = isolated[0]
+
+        remaining = [remaining[index] for index in waiting]
+
+    return [results[position] for position in range(len(pending))]
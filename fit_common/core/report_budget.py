@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Keep the HTML handed to xhtml2pdf at once within a memory budget."""
+
+import html
+import os
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from jinja2 import Template
+
+from fit_common.core.report_sections import Section
+
+# Peak Python memory of pisa.CreatePDF per character of HTML, measured with
+# xhtml2pdf 0.2.x: about 45 for hash lines, 150 for one <p> per text line
+# and up to 450 for <pre> text. The worst case is used so the budget holds
+# whatever markup content.html wraps a section in.
+HTML_MEMORY_FACTOR = 450
+
+# Sections whose content is plain text; every other content is HTML.
+TEXT_SECTIONS = frozenset({"whois", "verification_report"})
+
+APPENDIX_TEMPLATE = Template(
+    """<html><head><style>
+@page { size: letter; margin: 1in; }
+body { font-size: 8pt; }
+p.line { font-family: Courier; font-size: 7pt; margin: 0; }
+</style></head><body>
+<h2>{{ title }}</h2>
+{{ content }}
+</body></html>"""
+)
+
+
+@dataclass(frozen=True)
+class SpilledSection:
+    type: str
+    title: str
+    path: str
+    size: int
+    kept: int
+
+    @property
+    def text(self) -> bool:
+        return self.type in TEXT_SECTIONS
+
+
+@dataclass
+class MemoryBudgetReport:
+    budget: int
+    # Largest HTML document, in characters, rendered in one xhtml2pdf call.
+    html_limit: int
+    section_sizes: list[tuple[str, int]] = field(default_factory=list)
+    spilled: list[SpilledSection] = field(default_factory=list)
+    # Section text of the content document after spilling, in characters,
+    # and the largest appendix chunk.
+    content_size: int = 0
+    appendix_chunks: int = 0
+    largest_chunk: int = 0
+
+    @property
+    def estimated_peak(self) -> int:
+        return max(self.content_size, self.largest_chunk) * HTML_MEMORY_FACTOR
+
+    @property
+    def within_budget(self) -> bool:
+        return self.estimated_peak <= self.budget
+
+
+def html_limit(budget: int) -> int:
+    if budget < HTML_MEMORY_FACTOR:
+        raise ValueError(f"memory_budget must be at least {HTML_MEMORY_FACTOR} bytes")
+    return budget // HTML_MEMORY_FACTOR
+
+
+def section_size(value: object) -> int:
+    """Characters of text a section adds to the content document."""
+
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(section_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(section_size(item) for item in value)
+    return 0
+
+
+def spill_sections(
+    sections: list[Section],
+    report: MemoryBudgetReport,
+    directory: str,
+    note: str,
+) -> None:
+    """Move section content to appendix files until the sections fit.
+
+    The largest content goes first; each spilled section keeps the lines
+    that still fit, followed by ``note`` formatted with the section title.
+    The report records sizes and spills.
+    """
+
+    report.section_sizes = [
+        (str(section.get("type")), section_size(section)) for section in sections
+    ]
+    total = sum(size for _, size in report.section_sizes)
+    spillable = sorted(
+        (
+            section
+            for section in sections
+            if isinstance(section.get("content"), str) and section["content"]
+        ),
+        key=lambda section: len(str(section["content"])),
+        reverse=True,
+    )
+    for section in spillable:
+        if total <= report.html_limit:
+            break
+        content = str(section["content"])
+        kind = str(section.get("type"))
+        title = str(section.get("title", kind))
+        text = kind in TEXT_SECTIONS
+        message = note.format(title)
+        # A text head ends with its last line break: one blank line follows.
+        message = "\n" + message if text else "<p>" + html.escape(message) + "</p>"
+
+        allowed = report.html_limit - (total - len(content)) - len(message)
+        head = _head(content, allowed, "\n" if text else "</p>")
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{len(report.spilled):02d}_{kind}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content[len(head) :])
+
+        section["content"] = head + message
+        total += len(head) + len(message) - len(content)
+        report.spilled.append(
+            SpilledSection(kind, title, path, len(content), len(head))
+        )
+    report.content_size = total
+
+
+def iter_appendix_chunks(spilled: SpilledSection, limit: int) -> Iterator[str]:
+    """Yield the spilled content in pieces of at most ``limit`` characters.
+
+    Pieces end on a line (text) or paragraph (HTML) boundary when there is
+    one; only one piece is held in memory at a time.
+    """
+
+    boundary = "\n" if spilled.text else "</p>"
+    pending = ""
+    with open(spilled.path, "r", encoding="utf-8") as f:
+        while True:
+            block = f.read(max(1, limit - len(pending)))
+            if not block:
+                if pending:
+                    yield pending
+                return
+            pending += block
+            if len(pending) < limit:
+                continue
+            cut = pending.rfind(boundary)
+            end = cut + len(boundary) if cut > 0 else len(pending)
+            yield pending[:end]
+            pending = pending[end:]
+
+
+def render_appendix_html(spilled: SpilledSection, title: str, chunk: str) -> str:
+    content = chunk
+    if spilled.text:
+        # One paragraph per line lays out several times faster than <pre>.
+        content = "".join(
+            '<p class="line">'
+            + (html.escape(line).replace("  ", " &nbsp;") or "&nbsp;")
+            + "</p>"
+            for line in chunk.splitlines()
+        )
+    return APPENDIX_TEMPLATE.render(title=title, content=content)
+
+
+def _head(content: str, allowed: int, boundary: str) -> str:
+    if allowed <= 0:
+        return ""
+    if len(content) <= allowed:
+        return content
+    cut = content.rfind(boundary, 0, allowed)
+    return content[: cut + len(boundary)] if cut >= 0 else ""
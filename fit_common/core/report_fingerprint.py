@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Digests of report inputs, stored beside the PDF they produced."""
+
+import hashlib
+import json
+import os
+import tempfile
+
+FINGERPRINT_SUFFIX = ".fingerprint"
+
+
+class ReportFingerprint:
+    """Incremental SHA-256 over labelled report inputs.
+
+    Every value is framed with its label and length, so moving bytes from
+    one input to the next can never produce the same digest.
+    """
+
+    def __init__(self) -> None:
+        self.__digest = hashlib.sha256()
+
+    def add_bytes(self, label: str, data: bytes) -> None:
+        self.__digest.update(f"{label}\0{len(data)}\0".encode("utf-8"))
+        self.__digest.update(data)
+
+    def add_text(self, label: str, text: str | None) -> None:
+        self.add_bytes(label, b"\xff" if text is None else text.encode("utf-8"))
+
+    def add_json(self, label: str, value: object) -> None:
+        self.add_text(
+            label,
+            json.dumps(value, sort_keys=True, default=str, ensure_ascii=False),
+        )
+
+    def add_file(self, label: str, path: str) -> None:
+        """Add the digest of a file's content, or a marker when it is missing."""
+
+        try:
+            with open(path, "rb") as f:
+                file_digest = hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            file_digest = None
+        self.add_text(label, file_digest)
+
+    def hexdigest(self) -> str:
+        return self.__digest.hexdigest()
+
+
+def fingerprint_path(output_path: str) -> str:
+    # Hidden so it never shows up as an acquisition artifact.
+    directory, filename = os.path.split(output_path)
+    return os.path.join(directory, f".{filename}{FINGERPRINT_SUFFIX}")
+
+
+def is_fingerprint_file(name: str) -> bool:
+    return name.startswith(".") and name.endswith(FINGERPRINT_SUFFIX)
+
+
+def read_fingerprint(output_path: str) -> str | None:
+    """Return the stored digest when both the report and its sidecar exist."""
+
+    if not os.path.isfile(output_path):
+        return None
+    try:
+        with open(fingerprint_path(output_path), "r", encoding="ascii") as f:
+            return f.read().strip() or None
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_fingerprint(output_path: str, digest: str) -> None:
+    sidecar = fingerprint_path(output_path)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=".", suffix=FINGERPRINT_SUFFIX, dir=os.path.dirname(sidecar)
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(digest)
+        os.replace(temp_path, sidecar)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def remove_fingerprint(output_path: str) -> None:
+    try:
+        os.remove(fingerprint_path(output_path))
+    except FileNotFoundError:
+        pass
+
+
+def find_cached_report(directory: str, digest: str) -> str | None:
+    """Return a report in ``directory`` whose stored digest is ``digest``."""
+
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return None
+    for name in names:
+        if not is_fingerprint_file(name):
+            continue
+        output_path = os.path.join(directory, name[1 : -len(FINGERPRINT_SUFFIX)])
+        if read_fingerprint(output_path) == digest:
+            return output_path
+    return None
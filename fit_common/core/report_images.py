@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Pre-processing of screenshots before they are embedded in PDF reports."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+
+from PIL import Image
+
+from fit_common.core.debug import debug
+from fit_common.core.paths import resolve_cache_path
+
+_LOG_CONTEXT = "fit_common.core.report_images"
+
+POINTS_PER_INCH = 72
+
+SCREENSHOT_CACHE = "screenshots"
+
+# Derivatives are copies of case evidence kept in a folder shared by every
+# case: they are dropped once unused for this long, or beyond this size.
+_CACHE_MAX_AGE_S = 7 * 24 * 60 * 60
+_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ScreenshotTile:
+    path: str
+    width_pt: int
+    height_pt: int
+
+
+def file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def screenshot_derivative(
+    source_path: str,
+    max_width_pt: float,
+    max_height_pt: float,
+    dpi: int = 150,
+    cache_dir: str | None = None,
+) -> str | None:
+    """Return a PNG that fits the given box at ``dpi``.
+
+    Derivatives are cached by the SHA-256 of the source and the target size,
+    so the same screenshot is only decoded and resampled once across reports.
+    The cache is pruned by age and size (see prune_screenshot_cache) and can
+    be emptied with purge_screenshot_cache. The source itself is returned
+    when it is already small enough, and None when it cannot be decoded.
+    """
+
+    max_width_px = max(1, round(max_width_pt * dpi / POINTS_PER_INCH))
+    max_height_px = max(1, round(max_height_pt * dpi / POINTS_PER_INCH))
+
+    try:
+        with Image.open(source_path) as image:
+            width, height = image.size
+            scale = min(max_width_px / width, max_height_px / height, 1)
+            if scale == 1:
+                return source_path
+            target = (max(1, round(width * scale)), max(1, round(height * scale)))
+
+            cache_dir = cache_dir or resolve_cache_path(SCREENSHOT_CACHE)
+            os.makedirs(cache_dir, exist_ok=True)
+            derivative_path = os.path.join(
+                cache_dir,
+                f"{file_sha256(source_path)}-{target[0]}x{target[1]}.png",
+            )
+            if os.path.isfile(derivative_path):
+                # Pruning drops the least recently used derivatives first.
+                os.utime(derivative_path)
+                return derivative_path
+
+            source: Image.Image = image
+            if image.mode not in ("RGB", "RGBA", "L", "LA"):
+                source = image.convert("RGBA")
+            # reducing_gap lets Pillow shrink by whole factors before the
+            # final resample, which is much cheaper on very tall captures.
+            resized = source.resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            _save_atomically(resized, derivative_path)
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        debug(
+            f"Unable to downscale screenshot {source_path}: {exc}",
+            context=_LOG_CONTEXT,
+        )
+        return None
+
+    prune_screenshot_cache(cache_dir)
+    return derivative_path
+
+
+def prune_screenshot_cache(
+    cache_dir: str | None = None,
+    max_age_s: float = _CACHE_MAX_AGE_S,
+    max_bytes: int = _CACHE_MAX_BYTES,
+) -> int:
+    """Drop derivatives unused for ``max_age_s`` and the oldest beyond ``max_bytes``.
+
+    The most recent derivative is always kept. Returns the number of files
+    removed.
+    """
+
+    cache_dir = cache_dir or resolve_cache_path(SCREENSHOT_CACHE)
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.is_file()]
+    except OSError:
+        return 0
+
+    files = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+    # Most recently used first: everything past the budget goes.
+    files.sort(reverse=True)
+
+    oldest = time.time() - max_age_s
+    kept_bytes = 0
+    removed = 0
+    for number, (mtime, size, path) in enumerate(files):
+        kept_bytes += size
+        # The newest file is the derivative a report is about to embed.
+        if number == 0 or (mtime >= oldest and kept_bytes <= max_bytes):
+            continue
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+        kept_bytes -= size
+    return removed
+
+
+def purge_screenshot_cache(cache_dir: str | None = None) -> None:
+    """Remove every cached derivative, e.g. when a case is closed."""
+
+    shutil.rmtree(cache_dir or resolve_cache_path(SCREENSHOT_CACHE), ignore_errors=True)
+
+
+def _save_atomically(image: Image.Image, path: str) -> None:
+    # Concurrent reports may build the same derivative: never expose a
+    # partially written file under the final name.
+    fd, temp_path = tempfile.mkstemp(suffix=".png", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, format="PNG", optimize=True)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def tile_screenshot(
+    source_path: str,
+    output_dir: str,
+    tile_width_pt: float,
+    tile_height_pt: float,
+    dpi: int = 150,
+) -> list[ScreenshotTile]:
+    """Split a tall screenshot into page-sized strips written to ``output_dir``.
+
+    The capture is decoded once and immediately scaled to the strip width;
+    strips are then cropped, written and released one at a time, so only a
+    single strip is alive besides the scaled capture. Returns an empty list
+    when the source cannot be decoded.
+    """
+
+    tile_width_px = max(1, round(tile_width_pt * dpi / POINTS_PER_INCH))
+    tile_height_px = max(1, round(tile_height_pt * dpi / POINTS_PER_INCH))
+    tiles: list[ScreenshotTile] = []
+
+    try:
+        with Image.open(source_path) as image:
+            width, height = image.size
+            scaled: Image.Image = image
+            if width > tile_width_px:
+                scaled = image.resize(
+                    (tile_width_px, max(1, round(height * tile_width_px / width))),
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=3.0,
+                )
+                # Release the full resolution bitmap before writing strips.
+                image.close()
+
+            os.makedirs(output_dir, exist_ok=True)
+            for number, top in enumerate(range(0, scaled.height, tile_height_px)):
+                bottom = min(top + tile_height_px, scaled.height)
+                strip = scaled.crop((0, top, scaled.width, bottom))
+                path = os.path.join(output_dir, f"screenshot-tile-{number:04d}.png")
+                strip.save(path, format="PNG")
+                tiles.append(
+                    ScreenshotTile(
+                        path,
+                        max(1, round(strip.width * POINTS_PER_INCH / dpi)),
+                        max(1, round(strip.height * POINTS_PER_INCH / dpi)),
+                    )
+                )
+                strip.close()
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        debug(
+            f"Unable to tile screenshot {source_path}: {exc}",
+            context=_LOG_CONTEXT,
+        )
+        return []
+
+    return tiles
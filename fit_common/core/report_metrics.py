@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Per-stage timing and memory instrumentation for PDF report generation."""
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Iterator
+
+
+class ReportStage(str, Enum):
+    SCAN = "scan"
+    FINGERPRINT = "fingerprint"
+    SECTIONS = "sections"
+    TEMPLATES = "templates"
+    RENDER_FRONT = "render_front"
+    RENDER_CONTENT = "render_content"
+    # Front and content rendered concurrently in parallel mode.
+    RENDER = "render"
+    MERGE = "merge"
+    # Spilled sections rendered in chunks in memory-budget mode.
+    APPENDIX = "appendix"
+    WRITE = "write"
+    OPTIMIZE = "optimize"
+
+
+@dataclass(frozen=True)
+class StageMetrics:
+    stage: ReportStage
+    wall_time: float
+    cpu_time: float
+    # How far the stage pushed the process peak RSS, in bytes: 0 when it
+    # stayed below an earlier peak. With trace_memory, the peak of Python
+    # allocations above the level at stage start instead.
+    peak_memory: int
+
+
+@dataclass
+class ReportMetrics:
+    stages: list[StageMetrics] = field(default_factory=list)
+
+    @property
+    def total_wall_time(self) -> float:
+        return sum(stage.wall_time for stage in self.stages)
+
+    @property
+    def total_cpu_time(self) -> float:
+        return sum(stage.cpu_time for stage in self.stages)
+
+    @property
+    def peak_memory(self) -> int:
+        return max((stage.peak_memory for stage in self.stages), default=0)
+
+    def get(self, stage: ReportStage) -> StageMetrics | None:
+        for metrics in self.stages:
+            if metrics.stage == stage:
+                return metrics
+        return None
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "stages": [
+                {**asdict(metrics), "stage": metrics.stage.value}
+                for metrics in self.stages
+            ],
+            "total_wall_time": self.total_wall_time,
+            "total_cpu_time": self.total_cpu_time,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class ReportInstrumentation:
+    """Collects StageMetrics; ``measure`` costs nothing when disabled.
+
+    CPU time is the CPU time of this process, so work done in worker
+    processes only shows up in the wall time. Memory comes from the peak
+    RSS, which is free to read. ``trace_memory`` uses tracemalloc for exact
+    Python allocations, but tracing slows Python-heavy stages many times
+    over (rendering took about 10x longer), so timings taken with it on do
+    not tell which stage is slow.
+    """
+
+    def __init__(self, enabled: bool = False, trace_memory: bool = False) -> None:
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.metrics = ReportMetrics()
+
+    @contextmanager
+    def measure(self, stage: ReportStage) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        if self.trace_memory:
+            with self.__traced(stage):
+                yield
+            return
+
+        rss_start = _peak_rss()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            self.metrics.stages.append(
+                StageMetrics(
+                    stage, wall_time, cpu_time, max(0, _peak_rss() - rss_start)
+                )
+            )
+
+    @contextmanager
+    def __traced(self, stage: ReportStage) -> Iterator[None]:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            self.metrics.stages.append(
+                StageMetrics(stage, wall_time, cpu_time, max(0, peak - baseline))
+            )
+
+
+def _peak_rss() -> int:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows: no memory figures.
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""HTML to PDF rendering, in-process or in a long-lived warm worker."""
+
+import atexit
+import io
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Mapping
+
+from xhtml2pdf import pisa
+
+from fit_common.core.debug import debug
+
+_LOG_CONTEXT = "fit_common.core.report_renderer"
+
+_WARM_UP_HTML = (
+    "<html><head><style>body { font-family: Helvetica; }</style></head>"
+    "<body><h1>FIT</h1><p>warm-up</p>"
+    "<table><tr><th>a</th><td>b</td></tr></table></body></html>"
+)
+
+
+def render_pdf(html: str, options: Mapping[str, str]) -> bytes:
+    # Module level so it can be pickled and run in a worker process.
+    buffer = io.BytesIO()
+    pisa.CreatePDF(html, dest=buffer, options=options)
+    return buffer.getvalue()
+
+
+def _serve(connection: Connection) -> None:
+    # Pay for fonts, CSS defaults and lazy reportlab imports once.
+    render_pdf(_WARM_UP_HTML, {})
+    connection.send(("ready", None))
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        html, options = request
+        try:
+            connection.send(("ok", render_pdf(html, options)))
+        except Exception as exc:
+            try:
+                connection.send(("error", exc))
+            except Exception:
+                connection.send(("error", RuntimeError(repr(exc))))
+    connection.close()
+
+
+class RendererUnavailable(RuntimeError):
+    """Raised by ``RendererWorker.render(..., fallback=False)`` without a worker."""
+
+
+class RendererWorker:
+    """Long-lived process that keeps the xhtml2pdf/reportlab stack loaded.
+
+    Requests are HTML in, PDF bytes out over a local pipe, one at a time.
+    If the worker cannot be started or dies, rendering falls back to this
+    process, unless the caller asks for RendererUnavailable instead; a
+    failed render is raised here like the in-process call would. A worker
+    that does not answer within ``render_timeout`` seconds is killed and
+    started again on the next request.
+    """
+
+    def __init__(
+        self, start_timeout: float = 60.0, render_timeout: float = 600.0
+    ) -> None:
+        self.__start_timeout = start_timeout
+        self.__render_timeout = render_timeout
+        self.__context = multiprocessing.get_context("spawn")
+        self.__process: BaseProcess | None = None
+        self.__connection: Connection | None = None
+        self.__lock = threading.Lock()
+
+    @property
+    def is_alive(self) -> bool:
+        return self.__process is not None and self.__process.is_alive()
+
+    def start(self) -> None:
+        with self.__lock:
+            self.__start()
+
+    def render(
+        self, html: str, options: Mapping[str, str], fallback: bool = True
+    ) -> bytes:
+        with self.__lock:
+            try:
+                connection = self.__start()
+                connection.send((html, dict(options)))
+                if not connection.poll(self.__render_timeout):
+                    self.__kill()
+                    raise RuntimeError("Renderer worker did not answer in time")
+                status, payload = connection.recv()
+            except (EOFError, OSError, RuntimeError) as exc:
+                if not fallback:
+                    self.__stop()
+                    raise RendererUnavailable(str(exc)) from exc
+                debug(
+                    f"Renderer worker unavailable, rendering in-process: {exc}",
+                    context=_LOG_CONTEXT,
+                )
+                self.__stop()
+                return render_pdf(html, options)
+
+        if status == "error":
+            raise payload
+        return payload
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__stop()
+
+    def __enter__(self) -> "RendererWorker":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __start(self) -> Connection:
+        if self.is_alive and self.__connection is not None:
+            return self.__connection
+        self.__stop()
+        parent_connection, child_connection = self.__context.Pipe()
+        process = self.__context.Process(
+            target=_serve,
+            args=(child_connection,),
+            name="fit-report-renderer",
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        self.__process = process
+        self.__connection = parent_connection
+
+        if not parent_connection.poll(self.__start_timeout):
+            self.__stop()
+            raise RuntimeError("Renderer worker did not become ready in time")
+        status, _ = parent_connection.recv()
+        if status != "ready":
+            self.__stop()
+            raise RuntimeError(f"Unexpected renderer worker status: {status}")
+        return parent_connection
+
+    def __stop(self) -> None:
+        if self.__connection is not None:
+            try:
+                self.__connection.send(None)
+            except OSError:
+                pass
+            self.__connection.close()
+            self.__connection = None
+        if self.__process is not None:
+            self.__process.join(timeout=5)
+            if self.__process.is_alive():
+                self.__process.terminate()
+                self.__process.join()
+            self.__process = None
+
+    def __kill(self) -> None:
+        # A hung render would never read the stop request.
+        if self.__process is not None:
+            self.__process.kill()
+            self.__process.join()
+            self.__process = None
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+
+_renderer_worker: RendererWorker | None = None
+_renderer_worker_lock = threading.Lock()
+
+
+def get_renderer_worker() -> RendererWorker:
+    """Return the shared worker; call ``start()`` early to preload it."""
+
+    global _renderer_worker
+    with _renderer_worker_lock:
+        if _renderer_worker is None:
+            _renderer_worker = RendererWorker()
+            atexit.register(shutdown_renderer_worker)
+        return _renderer_worker
+
+
+def shutdown_renderer_worker() -> None:
+    global _renderer_worker
+    with _renderer_worker_lock:
+        if _renderer_worker is not None:
+            _renderer_worker.close()
+            _renderer_worker = None
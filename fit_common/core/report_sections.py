@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Report sections: memoized by the digest of their inputs, split for layout."""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from fit_common.core.cache_info import CacheInfo
+
+Section = dict[str, object]
+
+
+class SectionCache:
+    """LRU of built report sections, HTML fragments included.
+
+    A section that is not part of the report (e.g. no whois.txt) is cached
+    as None. Callers get a copy, so a cached section is never mutated.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.__maxsize = maxsize
+        self.__entries: OrderedDict[str, Section | None] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_or_build(
+        self, key: str, build: Callable[[], Section | None]
+    ) -> Section | None:
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return copy.deepcopy(self.__entries[key])
+            self.__misses += 1
+
+        section = build()
+        with self.__lock:
+            self.__entries[key] = copy.deepcopy(section)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+        return section
+
+    def cache_info(self) -> CacheInfo:
+        with self.__lock:
+            return CacheInfo(
+                self.__hits, self.__misses, self.__maxsize, len(self.__entries)
+            )
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+
+_section_cache = SectionCache()
+
+
+def get_section_cache() -> SectionCache:
+    """Return the process-wide cache used by PdfReportBuilder."""
+
+    return _section_cache
+
+
+def split_table_sections(sections: list[Section], rows_per_table: int) -> list[Section]:
+    """Split table sections into consecutive sections of ``rows_per_table`` rows.
+
+    xhtml2pdf lays out a table as a whole, so one huge table costs far more
+    than the same rows spread over smaller ones. Continuation sections keep
+    the title and columns, drop the description, and are marked with
+    ``continued`` so renderers can leave them out of the index.
+
+    The report tables are small: system_artifacts and acquired_content list
+    at most one row per known artifact (about 16), so in practice only
+    case_info is long enough to be split.
+    """
+
+    if rows_per_table < 1:
+        raise ValueError("rows_per_table must be at least 1")
+
+    split: list[Section] = []
+    for section in sections:
+        rows = section.get("rows")
+        if not isinstance(rows, list) or len(rows) <= rows_per_table:
+            split.append(section)
+            continue
+
+        starts = range(0, len(rows), rows_per_table)
+        for start in starts:
+            chunk = dict(section, rows=rows[start : start + rows_per_table])
+            if start:
+                chunk.update(description="", continued=True)
+            # The note goes under the last part of the table.
+            if start != starts[-1]:
+                chunk["note"] = ""
+            split.append(chunk)
+    return split
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Run a PdfReportBuilder in the background with progress and cancellation."""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+from fit_common.core.pdf_report_builder import PdfReportBuilder
+from fit_common.core.report_metrics import ReportStage
+
+
+class ReportTask:
+    """Generate one report on a background thread.
+
+    ``progress_callback`` is called from that thread when each stage starts.
+    ``cancel`` is cooperative: the builder stops before its next stage,
+    removes its temporary files and the future fails with
+    ReportGenerationCancelled.
+    """
+
+    def __init__(
+        self,
+        builder: PdfReportBuilder,
+        progress_callback: Callable[[ReportStage], None] | None = None,
+    ) -> None:
+        self.__builder = builder
+        self.__cancel_event = threading.Event()
+        self.__future: Future[None] = Future()
+        builder.cancel_event = self.__cancel_event
+        if progress_callback is not None:
+            builder.progress_callback = progress_callback
+        self.__thread = threading.Thread(
+            target=self.__run, name="fit-report-task", daemon=True
+        )
+
+    @property
+    def future(self) -> Future[None]:
+        return self.__future
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self.__cancel_event.is_set()
+
+    def start(self) -> Future[None]:
+        self.__thread.start()
+        return self.__future
+
+    def cancel(self) -> None:
+        self.__cancel_event.set()
+
+    def __run(self) -> None:
+        if not self.__future.set_running_or_notify_cancel():
+            return
+        try:
+            self.__builder.generate_pdf()
+        except BaseException as exc:
+            self.__future.set_exception(exc)
+        else:
+            self.__future.set_result(None)
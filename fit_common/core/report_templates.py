@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Process-wide Jinja2 environment for the report templates in fit_assets."""
+
+import hashlib
+import os
+from importlib.resources import files
+from typing import Callable
+
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateNotFound,
+)
+from jinja2.bccache import Bucket
+
+from fit_common.core.paths import resolve_cache_path
+
+TEMPLATES_PACKAGE = "fit_assets.templates"
+
+_environment: Environment | None = None
+
+
+class _ResourceLoader(BaseLoader):
+    """Load templates from a package through importlib.resources."""
+
+    def __init__(self, package: str) -> None:
+        self.package = package
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str | None, Callable[[], bool]]:
+        try:
+            source = (files(self.package) / template).read_text(encoding="utf-8")
+        except (ModuleNotFoundError, OSError) as exc:
+            raise TemplateNotFound(template) from exc
+        # Package data does not change while the process is running.
+        return source, None, lambda: True
+
+
+class _ContentHashBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache keyed by the template name and source digest.
+
+    The compiled code embeds the template name, so identical sources under
+    two names get two entries.
+    """
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> Bucket:
+        key = hashlib.sha256(
+            f"{jinja2.__version__}\0{name}\0{source}".encode("utf-8")
+        ).hexdigest()
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+
+def get_report_environment() -> Environment:
+    """Return the shared environment, creating it on first use."""
+
+    global _environment
+    if _environment is None:
+        _environment = Environment(
+            loader=_ResourceLoader(TEMPLATES_PACKAGE), auto_reload=False
+        )
+    return _environment
+
+
+def get_report_template(name: str) -> Template:
+    """Return a compiled report template, compiling it only once per process."""
+
+    return get_report_environment().get_template(name)
+
+
+def get_report_templates_digest(names: tuple[str, ...]) -> str:
+    """Return the SHA-256 of the given template sources; missing ones count as empty."""
+
+    environment = get_report_environment()
+    digest = hashlib.sha256()
+    for name in names:
+        try:
+            source = _ResourceLoader(TEMPLATES_PACKAGE).get_source(environment, name)[0]
+        except TemplateNotFound:
+            source = ""
+        digest.update(f"{name}\0{len(source)}\0{source}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def enable_template_bytecode_cache(directory: str | None = None) -> str:
+    """Persist compiled templates on disk, by default under the app cache folder."""
+
+    cache_dir = directory or resolve_cache_path("templates")
+    os.makedirs(cache_dir, exist_ok=True)
+    get_report_environment().bytecode_cache = _ContentHashBytecodeCache(cache_dir)
+    return cache_dir
+
+
+def disable_template_bytecode_cache() -> None:
+    get_report_environment().bytecode_cache = None
+
+
+def clear_template_cache() -> None:
+    """Drop the in-memory compiled templates."""
+
+    cache = get_report_environment().cache
+    if cache is not None:
+        cache.clear()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Integrity verification of an acquisition folder against acquisition.hash."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+
+from fit_common.core.hash_cache import HashCache
+from fit_common.core.hashing import (
+    ALGORITHM_LABELS,
+    DEFAULT_BUFFER_SIZE,
+    HASH_MANIFEST,
+    ManifestEntry,
+    digest_file,
+    read_hash_manifest,
+)
+
+
+class VerificationStatus(str, Enum):
+    OK = "ok"
+    MISMATCH = "mismatch"
+    MISSING = "missing"
+    ERROR = "error"
+
+
+@dataclass(frozen=True)
+class FileVerification:
+    name: str
+    status: VerificationStatus
+    expected: dict[str, str]
+    actual: dict[str, str] = field(default_factory=dict)
+    # Bytes read to compute ``actual``.
+    size: int = 0
+    elapsed: float = 0.0
+    detail: str | None = None
+    # True when ``actual`` comes from a HashCache; ``size`` is then 0.
+    cached: bool = False
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second; 0 when nothing was read."""
+
+        return self.size / self.elapsed if self.elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        if self.status == VerificationStatus.OK and self.cached:
+            return f"{self.name}: OK (cached)"
+        if self.status == VerificationStatus.OK:
+            return (
+                f"{self.name}: OK ({self.size} bytes, "
+                f"{self.throughput / 2**20:.1f} MiB/s)"
+            )
+        if self.detail:
+            return f"{self.name}: {self.status.name} ({self.detail})"
+        return f"{self.name}: {self.status.name}"
+
+
+@dataclass(frozen=True)
+class VerificationResult:
+    path: str
+    files: list[FileVerification]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.files) and all(
+            file.status == VerificationStatus.OK for file in self.files
+        )
+
+    @property
+    def bytes_verified(self) -> int:
+        return sum(file.size for file in self.files)
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second over the whole run, all workers together."""
+
+        return self.bytes_verified / self.elapsed if self.elapsed > 0 else 0.0
+
+    def count(self, status: VerificationStatus) -> int:
+        return sum(1 for file in self.files if file.status == status)
+
+    def to_text(self) -> str:
+        """Plain-text log, as embedded by the VERIFY report section."""
+
+        lines = [file.describe() for file in self.files]
+        lines.append("")
+        lines.append(
+            f"Files: {len(self.files)}, "
+            + ", ".join(
+                f"{status.name}: {self.count(status)}" for status in VerificationStatus
+            )
+        )
+        cached = sum(1 for file in self.files if file.cached)
+        if cached:
+            lines.append(f"Taken from the hash cache, not read again: {cached}")
+        lines.append(
+            f"Verified {self.bytes_verified} bytes in {self.elapsed:.2f}s "
+            f"({self.throughput / 2**20:.1f} MiB/s)"
+        )
+        return "\n".join(lines) + "\n"
+
+    def write_info_file(self, info_path: str) -> str:
+        """Write ``to_text()`` to ``info_path`` for verify_info_file_path."""
+
+        with open(info_path, "w", encoding="utf-8") as f:
+            f.write(self.to_text())
+        return info_path
+
+
+def verify_acquisition(
+    path: str,
+    manifest: str = HASH_MANIFEST,
+    max_workers: int | None = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    use_mmap: bool = False,
+    cache: HashCache | None = None,
+    strict: bool = False,
+) -> VerificationResult:
+    """Re-hash every file listed in the manifest of ``path`` and compare.
+
+    Files are hashed concurrently, each in one streaming pass over all the
+    algorithms its manifest entry lists. A missing or unreadable manifest
+    raises OSError; problems with single files are reported per file.
+
+    With a ``cache``, files unchanged since they were last hashed are
+    compared with their cached digests instead. Forensic re-verification
+    must pass ``strict=True``: every byte is read again and the cache is
+    only refreshed.
+    """
+
+    started = time.perf_counter()
+    entries = read_hash_manifest(os.path.join(path, manifest))
+
+    def verify(entry: ManifestEntry) -> FileVerification:
+        return _verify_entry(path, entry, buffer_size, use_mmap, cache, strict)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        thread_name_prefix="fit-verify",
+    ) as executor:
+        files = list(executor.map(verify, entries))
+    return VerificationResult(path, files, time.perf_counter() - started)
+
+
+def _verify_entry(
+    path: str,
+    entry: ManifestEntry,
+    buffer_size: int,
+    use_mmap: bool,
+    cache: HashCache | None,
+    strict: bool,
+) -> FileVerification:
+    root = os.path.realpath(path)
+    file_path = os.path.realpath(os.path.join(root, entry.name))
+    if os.path.commonpath([root, file_path]) != root:
+        return FileVerification(
+            entry.name,
+            VerificationStatus.ERROR,
+            entry.digests,
+            detail="outside of the acquisition folder",
+        )
+    if not entry.digests:
+        return FileVerification(
+            entry.name, VerificationStatus.ERROR, {}, detail="no digest listed"
+        )
+    if not os.path.isfile(file_path):
+        return FileVerification(entry.name, VerificationStatus.MISSING, entry.digests)
+
+    if entry.size is not None:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as exc:
+            return FileVerification(
+                entry.name, VerificationStatus.ERROR, entry.digests, detail=str(exc)
+            )
+        if size != entry.size:
+            # No need to read the file: it cannot match.
+            return FileVerification(
+                entry.name,
+                VerificationStatus.MISMATCH,
+                entry.digests,
+                detail=f"size {size}, expected {entry.size}",
+            )
+
+    try:
+        digest = digest_file(
+            root,
+            entry.name,
+            list(entry.digests),
+            buffer_size,
+            use_mmap,
+            cache,
+            strict,
+        )
+    except OSError as exc:
+        return FileVerification(
+            entry.name, VerificationStatus.ERROR, entry.digests, detail=str(exc)
+        )
+
+    mismatched = [
+        ALGORITHM_LABELS[algorithm]
+        for algorithm, expected in entry.digests.items()
+        if digest.digests[algorithm] != expected
+    ]
+    return FileVerification(
+        entry.name,
+        VerificationStatus.MISMATCH if mismatched else VerificationStatus.OK,
+        entry.digests,
+        digest.digests,
+        0 if digest.cached else digest.size,
+        digest.elapsed,
+        ", ".join(mismatched) + " differ" if mismatched else None,
+        digest.cached,
+    )
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+"""Lazy reader for the central directory of (ZIP64) archives."""
+
+import os
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+from zipfile import BadZipFile
+
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_STRUCT = struct.Struct("<4s4H2LH")
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_LOCATOR_STRUCT = struct.Struct("<4sLQL")
+_ZIP64_EOCD_SIGNATURE = b"PK\x06\x06"
+_ZIP64_EOCD_STRUCT = struct.Struct("<4sQ2H2L4Q")
+_CENTRAL_SIGNATURE = b"PK\x01\x02"
+_CENTRAL_STRUCT = struct.Struct("<4s4B4HL2L5H2L")
+_ZIP64_EXTRA_ID = 0x0001
+_UTF8_FLAG = 0x800
+_MAX_COMMENT = 0xFFFF
+
+
+@dataclass(frozen=True)
+class ZipManifestEntry:
+    filename: str
+    file_size: int
+    compress_size: int
+
+    @property
+    def is_dir(self) -> bool:
+        return self.filename.endswith("/")
+
+
+def iter_zip_manifest(path: str) -> Iterator[ZipManifestEntry]:
+    """Yield the entries of a ZIP archive straight from its central directory.
+
+    Only the end-of-central-directory records and the central directory are
+    read, one record at a time, so memory does not grow with the number of
+    entries. Raises ``zipfile.BadZipFile`` on a malformed archive.
+    """
+
+    with open(path, "rb") as f:
+        count, directory_offset = _locate_central_directory(f)
+        f.seek(directory_offset)
+        for _ in range(count):
+            yield _read_central_entry(f)
+
+
+def _locate_central_directory(f: BinaryIO) -> tuple[int, int]:
+    file_size = f.seek(0, os.SEEK_END)
+    tail_size = min(file_size, _EOCD_STRUCT.size + _MAX_COMMENT)
+    f.seek(file_size - tail_size)
+    tail = f.read(tail_size)
+
+    position = tail.rfind(_EOCD_SIGNATURE)
+    while position >= 0 and position + _EOCD_STRUCT.size > len(tail):
+        position = tail.rfind(_EOCD_SIGNATURE, 0, position)
+    if position < 0:
+        raise BadZipFile("End of central directory record not found")
+    eocd_offset = file_size - tail_size + position
+    (_, _, _, _, count, directory_size, directory_offset, _) = _EOCD_STRUCT.unpack(
+        tail[position : position + _EOCD_STRUCT.size]
+    )
+
+    locator_offset = eocd_offset - _ZIP64_LOCATOR_STRUCT.size
+    if locator_offset >= 0:
+        f.seek(locator_offset)
+        locator = f.read(_ZIP64_LOCATOR_STRUCT.size)
+        if locator[:4] == _ZIP64_LOCATOR_SIGNATURE:
+            _, _, zip64_offset, _ = _ZIP64_LOCATOR_STRUCT.unpack(locator)
+            # The locator offset is wrong when data was prepended to the
+            # archive: the record always sits right before the locator.
+            record_offset = locator_offset - _ZIP64_EOCD_STRUCT.size
+            f.seek(record_offset)
+            record = f.read(_ZIP64_EOCD_STRUCT.size)
+            if record[:4] != _ZIP64_EOCD_SIGNATURE:
+                raise BadZipFile("Corrupt ZIP64 end of central directory record")
+            fields = _ZIP64_EOCD_STRUCT.unpack(record)
+            count, directory_size, directory_offset = fields[7], fields[8], fields[9]
+            prepended = record_offset - directory_size - directory_offset
+            return count, directory_offset + max(0, prepended)
+
+    # Self-extracting archives: offsets are relative to the archive start.
+    prepended = eocd_offset - directory_size - directory_offset
+    if prepended < 0:
+        raise BadZipFile("Central directory offset out of range")
+    return count, directory_offset + prepended
+
+
+def _read_central_entry(f: BinaryIO) -> ZipManifestEntry:
+    header = f.read(_CENTRAL_STRUCT.size)
+    if len(header) != _CENTRAL_STRUCT.size or header[:4] != _CENTRAL_SIGNATURE:
+        raise BadZipFile("Bad central directory entry")
+    fields = _CENTRAL_STRUCT.unpack(header)
+    flags = fields[5]
+    compress_size, file_size = fields[10], fields[11]
+    name_length, extra_length, comment_length = fields[12], fields[13], fields[14]
+
+    raw_name = f.read(name_length)
+    extra = f.read(extra_length)
+    f.seek(comment_length, os.SEEK_CUR)
+    if len(raw_name) != name_length or len(extra) != extra_length:
+        raise BadZipFile("Truncated central directory entry")
+
+    if 0xFFFFFFFF in (file_size, compress_size):
+        file_size, compress_size = _zip64_sizes(extra, file_size, compress_size)
+
+    filename = raw_name.decode("utf-8" if flags & _UTF8_FLAG else "cp437")
+    return ZipManifestEntry(filename, file_size, compress_size)
+
+
+def _zip64_sizes(extra: bytes, file_size: int, compress_size: int) -> tuple[int, int]:
+    position = 0
+    while position + 4 <= len(extra):
+        header_id, length = struct.unpack_from("<2H", extra, position)
+        data = extra[position + 4 : position + 4 + length]
+        if header_id == _ZIP64_EXTRA_ID:
+            # Only the fields saturated in the header are present, in order.
+            values = iter(struct.unpack_from(f"<{len(data) // 8}Q", data))
+            try:
+                if file_size == 0xFFFFFFFF:
+                    file_size = next(values)
+                if compress_size == 0xFFFFFFFF:
+                    compress_size = next(values)
+            except StopIteration:
+                raise BadZipFile("Corrupt ZIP64 extra field") from None
+            return file_size, compress_size
+        position += 4 + length
+    raise BadZipFile("Missing ZIP64 extra field")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+
+from concurrent.futures import Future
+
+from PySide6.QtCore import QObject, Signal
+
+from fit_common.core.pdf_report_builder import (
+    PdfReportBuilder,
+    ReportGenerationCancelled,
+)
+from fit_common.core.report_metrics import ReportStage
+from fit_common.core.report_task import ReportTask
+
+
+class ReportWorker(QObject):
+    # Emitted from the report thread; Qt queues them to the receivers' thread.
+    progress = Signal(str)
+    finished = Signal()
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, builder: PdfReportBuilder, parent: QObject | None = None):
+        super().__init__(parent)
+        self.__task = ReportTask(builder, self.__on_progress)
+        self.__task.future.add_done_callback(self.__on_done)
+
+    def start(self) -> None:
+        self.__task.start()
+
+    def cancel(self) -> None:
+        self.__task.cancel()
+
+    def __on_progress(self, stage: ReportStage) -> None:
+        self.progress.emit(stage.value)
+
+    def __on_done(self, future: Future[None]) -> None:
+        if future.cancelled():
+            self.cancelled.emit()
+            return
+        exc = future.exception()
+        if exc is None:
+            self.finished.emit()
+        elif isinstance(exc, ReportGenerationCancelled):
+            self.cancelled.emit()
+        else:
+            self.failed.emit(str(exc))
@@ -110,6 +110,12 @@ class _CaptureTemplate:
         return "content-html"
 
 
+def _load_template(_builder, template_name):
+    if template_name == "content.html":
+        return _CaptureTemplate(template_name)
+    return _FakeFrontTemplate()
+
+
 class _FakePdfReader:
     def __init__(self, _file_obj):
         self.pages = [object()]
@@ -145,7 +151,6 @@ def test_pdf_report_builder_verify_contract_contains_verification_section(tmp_pa
 
     monkeypatch.setattr("fit_common.core.pdf_report_builder.files", lambda package: _FakeResource(package))
     monkeypatch.setattr("fit_common.core.pdf_report_builder.get_version", lambda: "1.0.0")
-    monkeypatch.setattr("fit_common.core.pdf_report_builder.Template", _CaptureTemplate)
     monkeypatch.setattr("fit_common.core.pdf_report_builder.PdfReader", _FakePdfReader)
     monkeypatch.setattr("fit_common.core.pdf_report_builder.PdfWriter", _FakePdfWriter)
     monkeypatch.setattr(
@@ -155,7 +160,7 @@ def test_pdf_report_builder_verify_contract_contains_verification_section(tmp_pa
     monkeypatch.setattr(
         PdfReportBuilder,
         "_PdfReportBuilder__load_template",
-        lambda self, template_name: _FakeFrontTemplate(),
+        _load_template,
     )
 
     builder.generate_pdf()
@@ -185,7 +190,6 @@ def test_pdf_report_builder_acquisition_contract_includes_core_sections(tmp_path
 
     monkeypatch.setattr("fit_common.core.pdf_report_builder.files", lambda package: _FakeResource(package))
     monkeypatch.setattr("fit_common.core.pdf_report_builder.get_version", lambda: "1.0.0")
-    monkeypatch.setattr("fit_common.core.pdf_report_builder.Template", _CaptureTemplate)
     monkeypatch.setattr("fit_common.core.pdf_report_builder.PdfReader", _FakePdfReader)
     monkeypatch.setattr("fit_common.core.pdf_report_builder.PdfWriter", _FakePdfWriter)
     monkeypatch.setattr(
@@ -195,7 +199,7 @@ def test_pdf_report_builder_acquisition_contract_includes_core_sections(tmp_path
     monkeypatch.setattr(
         PdfReportBuilder,
         "_PdfReportBuilder__load_template",
-        lambda self, template_name: _FakeFrontTemplate(),
+        _load_template,
     )
 
     builder.generate_pdf()
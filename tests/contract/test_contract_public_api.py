@@ -9,6 +9,7 @@ def test_core_public_api_symbols_are_available():
         "resolve_path",
         "resolve_log_path",
         "resolve_db_path",
+        "resolve_cache_path",
         "resolve_app_path",
         "AcquisitionType",
         "get_platform",
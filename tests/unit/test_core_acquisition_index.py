@@ -0,0 +1,64 @@
+import os
+
+from fit_common.core import acquisition_index
+from fit_common.core.acquisition_index import AcquisitionDirectoryIndex
+
+
+def test_scan_missing_directory_returns_empty_index():
+    index = AcquisitionDirectoryIndex.scan("/does/not/exist")
+    assert len(index) == 0
+    assert index.find_prefix("acquisition") is None
+
+
+def test_scan_lists_only_files_in_sorted_order(tmp_path):
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "folder").mkdir()
+
+    index = AcquisitionDirectoryIndex.scan(str(tmp_path))
+
+    assert index.names() == ["a.txt", "b.txt"]
+    assert "folder" not in index
+    assert index.join("a.txt") == os.path.join(str(tmp_path), "a.txt")
+
+
+def test_prefix_lookups_use_sorted_names(tmp_path):
+    for name in ("acquisition.log.2", "acquisition.log.1", "acquisition.hash", "whois.txt"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+
+    index = AcquisitionDirectoryIndex.scan(str(tmp_path))
+
+    assert index.find_prefix("acquisition.log") == "acquisition.log.1"
+    assert index.with_prefix("acquisition.log") == ["acquisition.log.1", "acquisition.log.2"]
+    assert index.find_prefix("acquisition.zip") is None
+    assert index.find_prefix("zzz") is None
+
+
+def test_suffix_lookup_can_ignore_case(tmp_path):
+    (tmp_path / "message.EML").write_text("x", encoding="utf-8")
+    (tmp_path / "archive.zip").write_text("x", encoding="utf-8")
+
+    index = AcquisitionDirectoryIndex.scan(str(tmp_path))
+
+    assert index.with_suffix(".eml") == []
+    assert index.with_suffix(".eml", case_sensitive=False) == ["message.EML"]
+    assert index.with_suffix(".zip") == ["archive.zip"]
+
+
+def test_stat_results_are_cached_from_single_scan(tmp_path, monkeypatch):
+    (tmp_path / "empty.txt").write_text("", encoding="utf-8")
+    (tmp_path / "full.txt").write_text("abc", encoding="utf-8")
+
+    calls = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(
+        acquisition_index.os, "scandir", lambda path: calls.append(path) or real_scandir(path)
+    )
+    index = AcquisitionDirectoryIndex.scan(str(tmp_path))
+    (tmp_path / "full.txt").unlink()
+
+    assert index.size("full.txt") == 3
+    assert index.is_empty("empty.txt")
+    assert index.is_empty("missing.txt")
+    assert not index.is_empty("full.txt")
+    assert len(calls) == 1
@@ -1,6 +1,8 @@
+import hashlib
 import importlib.util
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 
@@ -115,3 +117,38 @@ def test_find_device_index_helpers_return_none_when_missing():
 
     assert ffmpeg.find_screen_device_index(devices) is None
     assert ffmpeg.find_audio_device_index(devices) is None
+
+
+def test_execute_ffmpeg_recording_hashes_output_while_writing(monkeypatch, tmp_path):
+    monkeypatch.setattr(ffmpeg, "debug", lambda message, context=None: None)
+    script = (
+        "import sys; assert sys.argv[1] == 'pipe:1'; "
+        "sys.stdout.buffer.write(b'frame' * 100000); sys.stdout.flush(); "
+        "sys.stdin.read(1); sys.stdout.buffer.write(b'trailer'); "
+        "sys.stderr.write('recording stopped\\n')"
+    )
+    stop = threading.Event()
+    stop.set()
+
+    result = ffmpeg.execute_ffmpeg_recording(sys.executable, ["-c", script], tmp_path / "video.mkv", ("md5", "sha256"), stop=stop)
+
+    data = b"frame" * 100000 + b"trailer"
+    assert result.returncode == 0
+    assert result.timed_out is False
+    assert result.stderr == "recording stopped\n"
+    assert (tmp_path / "video.mkv").read_bytes() == data
+    assert result.digest.name == "video.mkv"
+    assert result.digest.size == len(data)
+    assert result.digest.digests == {"md5": hashlib.md5(data).hexdigest(), "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def test_execute_ffmpeg_recording_kills_on_timeout(monkeypatch, tmp_path):
+    monkeypatch.setattr(ffmpeg, "debug", lambda message, context=None: None)
+    script = "import sys, time; sys.stdout.buffer.write(b'partial'); sys.stdout.flush(); time.sleep(30)"
+
+    result = ffmpeg.execute_ffmpeg_recording(sys.executable, ["-c", script], tmp_path / "video.mkv", timeout=0.5)
+
+    assert result.timed_out is True
+    assert result.returncode != 0
+    assert result.digest.size == len(b"partial")
+    assert result.digest.digests["sha1"] == hashlib.sha1(b"partial").hexdigest()
@@ -0,0 +1,99 @@
+import hashlib
+import os
+
+from fit_common.core import hashing
+from fit_common.core.hash_cache import HashCache
+from fit_common.core.hashing import digest_file, hash_acquisition
+from fit_common.core.verification import VerificationStatus, verify_acquisition
+
+# Old enough for the cache to trust the files.
+_MTIME_NS = 1_600_000_000 * 10**9
+
+
+def _write(path, data, mtime_ns=_MTIME_NS):
+    path.write_bytes(data)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _count_reads(monkeypatch):
+    reads = []
+    original = hashing._digest_file
+    monkeypatch.setattr(hashing, "_digest_file", lambda path, *args: reads.append(os.path.basename(path)) or original(path, *args))
+    return reads
+
+
+def test_digest_file_skips_unchanged_files(tmp_path, monkeypatch):
+    _write(tmp_path / "video.mp4", b"v" * 1000)
+    reads = _count_reads(monkeypatch)
+
+    with HashCache(str(tmp_path / "cache.db")) as cache:
+        first = digest_file(str(tmp_path), "video.mp4", cache=cache)
+        second = digest_file(str(tmp_path), "video.mp4", cache=cache)
+        md5_only = digest_file(str(tmp_path), "video.mp4", ("md5",), cache=cache)
+        sha512 = digest_file(str(tmp_path), "video.mp4", ("sha512",), cache=cache)
+
+        assert reads == ["video.mp4", "video.mp4"]
+        assert not first.cached and second.cached and md5_only.cached and not sha512.cached
+        assert second.digests == first.digests
+        assert second.size == 1000
+        assert md5_only.digests == {"md5": hashlib.md5(b"v" * 1000).hexdigest()}
+        assert cache.cache_info().hits == 2
+
+
+def test_cache_misses_after_any_change_and_keeps_last_version(tmp_path):
+    path = tmp_path / "video.mp4"
+    _write(path, b"v" * 1000)
+    with HashCache(str(tmp_path / "cache.db")) as cache:
+        digest_file(str(tmp_path), "video.mp4", cache=cache)
+        _write(path, b"w" * 1000, _MTIME_NS + 1)
+
+        digest = digest_file(str(tmp_path), "video.mp4", cache=cache)
+
+        assert not digest.cached
+        assert digest.digests["sha256"] == hashlib.sha256(b"w" * 1000).hexdigest()
+        assert cache.cache_info().currsize == 1
+
+
+def test_cache_persists_across_instances(tmp_path):
+    _write(tmp_path / "a.txt", b"a")
+    with HashCache(str(tmp_path / "cache.db")) as cache:
+        digest_file(str(tmp_path), "a.txt", cache=cache)
+
+    with HashCache(str(tmp_path / "cache.db")) as cache:
+        assert digest_file(str(tmp_path), "a.txt", cache=cache).cached
+
+
+def test_recently_modified_files_are_not_cached(tmp_path):
+    (tmp_path / "live.log").write_text("still being written")
+    with HashCache(str(tmp_path / "cache.db")) as cache:
+        digest_file(str(tmp_path), "live.log", cache=cache)
+
+        assert not digest_file(str(tmp_path), "live.log", cache=cache).cached
+        assert cache.cache_info().currsize == 0
+
+
+def test_verify_acquisition_uses_cache_unless_strict(tmp_path, monkeypatch):
+    acquisition = tmp_path / "acquisition"
+    acquisition.mkdir()
+    _write(acquisition / "acquisition.log", b"log")
+    _write(acquisition / "video.mp4", b"v" * 10000)
+    cache = HashCache(str(tmp_path / "cache.db"))
+    hash_acquisition(str(acquisition), cache=cache)
+    reads = _count_reads(monkeypatch)
+
+    cached = verify_acquisition(str(acquisition), cache=cache)
+    assert reads == []
+    assert cached.ok and all(file.cached for file in cached.files)
+    assert cached.bytes_verified == 0
+    assert "video.mp4: OK (cached)" in cached.to_text()
+    assert "not read again: 2" in cached.to_text()
+
+    strict = verify_acquisition(str(acquisition), cache=cache, strict=True)
+    assert sorted(reads) == ["acquisition.log", "video.mp4"]
+    assert strict.ok and not any(file.cached for file in strict.files)
+    assert strict.bytes_verified == 10003
+
+    _write(acquisition / "video.mp4", b"V" * 10000, _MTIME_NS + 1)
+    changed = verify_acquisition(str(acquisition), cache=cache)
+    assert [file.status for file in changed.files] == [VerificationStatus.OK, VerificationStatus.MISMATCH]
+    cache.close()
@@ -0,0 +1,72 @@
+import hashlib
+import io
+import os
+import threading
+
+import pytest
+
+from fit_common.core.hash_tee import HashingWriter, tee_to_file
+
+
+class _ShortWriter(io.RawIOBase):
+    # Accepts at most three bytes per call, like a busy pipe.
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.data += bytes(data[:3])
+        return min(len(data), 3)
+
+
+def test_hashing_writer_hashes_only_accepted_bytes():
+    target = _ShortWriter()
+    writer = HashingWriter(target, ("md5", "sha256"))
+
+    assert writer.write(b"abcdef") == 3
+    assert writer.write(memoryview(b"def")) == 3
+
+    assert writer.size == 6
+    assert writer.digests() == {"md5": hashlib.md5(b"abcdef").hexdigest(), "sha256": hashlib.sha256(b"abcdef").hexdigest()}
+    writer.close()
+    assert target.closed
+    with pytest.raises(ValueError):
+        writer.write(b"x")
+
+
+def test_hashing_writer_rejects_unknown_algorithms():
+    with pytest.raises(ValueError):
+        HashingWriter(io.BytesIO(), ("crc32",))
+
+
+def test_tee_to_file_copies_and_hashes_stream(tmp_path):
+    data = os.urandom(300000)
+
+    digest = tee_to_file(io.BytesIO(data), str(tmp_path / "capture.pcap"), buffer_size=4096)
+
+    assert (tmp_path / "capture.pcap").read_bytes() == data
+    assert digest.name == "capture.pcap"
+    assert digest.size == len(data)
+    assert digest.digests == {name: hashlib.new(name, data).hexdigest() for name in ("md5", "sha1", "sha256")}
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes are POSIX only")
+def test_tee_to_file_reads_named_pipe(tmp_path):
+    fifo = tmp_path / "ffmpeg.fifo"
+    os.mkfifo(fifo)
+    data = b"frame" * 50000
+
+    def produce():
+        with open(fifo, "wb") as f:
+            f.write(data)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    digest = tee_to_file(str(fifo), str(tmp_path / "video.ts"), ("sha256",))
+    producer.join()
+
+    assert digest.digests == {"sha256": hashlib.sha256(data).hexdigest()}
+    assert (tmp_path / "video.ts").read_bytes() == data
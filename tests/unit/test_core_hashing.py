@@ -0,0 +1,115 @@
+import hashlib
+
+import pytest
+
+from fit_common.core.hashing import (
+    HASH_MANIFEST,
+    acquisition_file_names,
+    hash_acquisition,
+    hash_file,
+    hash_files,
+    read_hash_manifest,
+)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_hash_file_matches_hashlib_for_every_algorithm(tmp_path, use_mmap):
+    data = bytes(range(256)) * 1000 + b"tail"
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(data)
+
+    digests = hash_file(str(path), ("md5", "sha1", "sha256", "sha512"), buffer_size=4096, use_mmap=use_mmap)
+
+    assert digests == {name: hashlib.new(name, data).hexdigest() for name in ("md5", "sha1", "sha256", "sha512")}
+
+
+def test_hash_file_handles_empty_files_with_mmap(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert hash_file(str(path), ("sha256",), use_mmap=True) == {"sha256": hashlib.sha256(b"").hexdigest()}
+
+
+def test_hash_file_rejects_unknown_algorithms(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("a")
+
+    with pytest.raises(ValueError):
+        hash_file(str(path), ("crc32",))
+
+
+def test_hash_files_keeps_order_and_sizes(tmp_path):
+    names = [f"file-{number}.bin" for number in range(20)]
+    for number, name in enumerate(names):
+        (tmp_path / name).write_bytes(b"x" * number * 1000)
+
+    digests = hash_files(str(tmp_path), names, ("sha256",), max_workers=4, buffer_size=1024)
+
+    assert [digest.name for digest in digests] == names
+    assert [digest.size for digest in digests] == [number * 1000 for number in range(20)]
+    assert digests[3].digests["sha256"] == hashlib.sha256(b"x" * 3000).hexdigest()
+
+
+def test_hash_files_raises_for_missing_files(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        hash_files(str(tmp_path), ["missing.bin"])
+
+
+def test_acquisition_file_names_skips_sidecars_and_leftover_temp_files(tmp_path):
+    for name in [
+        "acquisition.log",
+        "capture.pcap",
+        "capture.pcap.merkle",
+        ".report.pdf.fingerprint",
+        ".k3x_9q2a.hash",
+        ".k3x_9q2a.merkle",
+        ".k3x_9q2a.fingerprint",
+        ".k3x_9q2a.pdf",
+        ".hidden-evidence.pdf",
+    ]:
+        (tmp_path / name).write_text(name)
+
+    assert acquisition_file_names(str(tmp_path)) == [".hidden-evidence.pdf", "acquisition.log", "capture.pcap"]
+
+
+def test_hash_acquisition_writes_manifest_without_itself(tmp_path):
+    (tmp_path / "acquisition.log").write_text("log")
+    (tmp_path / "whois.txt").write_text("whois")
+    (tmp_path / HASH_MANIFEST).write_text("stale")
+    (tmp_path / "downloads").mkdir()
+
+    digests = hash_acquisition(str(tmp_path))
+
+    assert acquisition_file_names(str(tmp_path)) == ["acquisition.log", "whois.txt"]
+    assert [digest.name for digest in digests] == ["acquisition.log", "whois.txt"]
+    assert (tmp_path / HASH_MANIFEST).read_text() == (
+        "Name: acquisition.log\n"
+        "Size: 3\n"
+        f"MD5: {hashlib.md5(b'log').hexdigest()}\n"
+        f"SHA-1: {hashlib.sha1(b'log').hexdigest()}\n"
+        f"SHA-256: {hashlib.sha256(b'log').hexdigest()}\n"
+        "\n"
+        "Name: whois.txt\n"
+        "Size: 5\n"
+        f"MD5: {hashlib.md5(b'whois').hexdigest()}\n"
+        f"SHA-1: {hashlib.sha1(b'whois').hexdigest()}\n"
+        f"SHA-256: {hashlib.sha256(b'whois').hexdigest()}\n"
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["acquisition.hash", "acquisition.log", "downloads", "whois.txt"]
+
+
+def test_read_hash_manifest_parses_blocks_and_checksum_lines(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    hash_acquisition(str(tmp_path), ("md5", "sha512"))
+    manifest = tmp_path / HASH_MANIFEST
+    with manifest.open("a") as f:
+        f.write(f"\n{hashlib.sha256(b'b').hexdigest()}  downloads/b.txt\n")
+        f.write(f"{hashlib.sha1(b'c').hexdigest().upper()} *c.txt\n")
+        f.write("not a manifest line\n")
+
+    entries = read_hash_manifest(str(manifest))
+
+    assert [(entry.name, entry.size) for entry in entries] == [("a.txt", 1), ("downloads/b.txt", None), ("c.txt", None)]
+    assert entries[0].digests == {"md5": hashlib.md5(b"a").hexdigest(), "sha512": hashlib.sha512(b"a").hexdigest()}
+    assert entries[1].digests == {"sha256": hashlib.sha256(b"b").hexdigest()}
+    assert entries[2].digests == {"sha1": hashlib.sha1(b"c").hexdigest()}
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from fit_common.core import merkle
+from fit_common.core.merkle import (
+    hash_file_merkle,
+    leaf_digest,
+    merkle_root,
+    read_merkle_sidecar,
+    verify_chunks,
+)
+
+
+def _evidence(tmp_path, size=10 * 1000 + 7):
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(bytes(number % 251 for number in range(size)))
+    return path
+
+
+def test_merkle_root_pairs_nodes_and_carries_odd_ones_up():
+    a, b, c = (leaf_digest(data) for data in (b"a", b"b", b"c"))
+    ab = hashlib.sha256(b"\x01" + a + b).digest()
+
+    assert merkle_root([a]) == a
+    assert merkle_root([a, b, c]) == hashlib.sha256(b"\x01" + ab + c).digest()
+    assert merkle_root([]) == leaf_digest(b"")
+
+
+def test_hash_file_merkle_computes_tree_and_plain_digests(tmp_path):
+    path = _evidence(tmp_path)
+    data = path.read_bytes()
+
+    digest = hash_file_merkle(str(path), chunk_size=1000, algorithms=("md5", "sha256"), max_workers=3)
+
+    chunks = [data[start : start + 1000] for start in range(0, len(data), 1000)]
+    assert digest.leaves == [leaf_digest(chunk).hex() for chunk in chunks]
+    assert digest.root == merkle_root([leaf_digest(chunk) for chunk in chunks]).hex()
+    assert digest.digests == {"md5": hashlib.md5(data).hexdigest(), "sha256": hashlib.sha256(data).hexdigest()}
+    assert read_merkle_sidecar(str(path) + ".merkle") == digest
+
+
+def test_hash_file_merkle_resumes_from_checkpoint(tmp_path, monkeypatch):
+    path = _evidence(tmp_path)
+    full = hash_file_merkle(str(path), chunk_size=1000)
+    sidecar = tmp_path / "capture.pcap.merkle"
+    data = json.loads(sidecar.read_text())
+    data.update(leaves=data["leaves"][:4], root=None, digests={})
+    sidecar.write_text(json.dumps(data))
+
+    hashed = []
+    original = merkle.leaf_digest
+    monkeypatch.setattr(merkle, "leaf_digest", lambda chunk: hashed.append(len(chunk)) or original(chunk))
+    resumed = hash_file_merkle(str(path), chunk_size=1000)
+
+    assert len(hashed) == len(full.leaves) - 4
+    assert resumed == full
+
+
+def test_hash_file_merkle_restarts_when_file_changed(tmp_path):
+    path = _evidence(tmp_path)
+    hash_file_merkle(str(path), chunk_size=1000)
+    path.write_bytes(b"other content")
+    os.utime(path, ns=(1, 1))
+
+    digest = hash_file_merkle(str(path), chunk_size=1000)
+
+    assert digest.digests["sha256"] == hashlib.sha256(b"other content").hexdigest()
+    assert digest.leaves == [leaf_digest(b"other content").hex()]
+
+
+def test_verify_chunks_reports_only_altered_chunks_in_range(tmp_path):
+    path = _evidence(tmp_path)
+    hash_file_merkle(str(path), chunk_size=1000)
+    with path.open("r+b") as f:
+        f.seek(2500)
+        f.write(b"\xff")
+        f.seek(7100)
+        f.write(b"\xff")
+
+    assert verify_chunks(str(path)) == [2, 7]
+    assert verify_chunks(str(path), start=3000, end=7000) == []
+    assert verify_chunks(str(path), start=6999, end=7101) == [7]
+
+    with path.open("r+b") as f:
+        f.truncate(9000)
+    assert verify_chunks(str(path), start=8000) == [9, 10]
+
+
+def test_verify_chunks_rejects_tampered_sidecar(tmp_path):
+    path = _evidence(tmp_path)
+    hash_file_merkle(str(path), chunk_size=1000)
+    sidecar = tmp_path / "capture.pcap.merkle"
+    data = json.loads(sidecar.read_text())
+    data["leaves"][0] = leaf_digest(b"forged").hex()
+    sidecar.write_text(json.dumps(data))
+
+    with pytest.raises(ValueError):
+        verify_chunks(str(path))
+
+
+@pytest.mark.parametrize("option", [{"chunk_size": 0}, {"checkpoint_every": 0}])
+def test_hash_file_merkle_rejects_invalid_options_before_reading(tmp_path, option):
+    path = _evidence(tmp_path)
+
+    with pytest.raises(ValueError):
+        hash_file_merkle(str(path), **option)
+
+    assert not (tmp_path / "capture.pcap.merkle").exists()
@@ -36,3 +36,15 @@ def test_resolve_db_and_log_paths_create_directories(monkeypatch, tmp_path):
     assert log_file.parent.exists()
     assert db_file.name == "main.db"
     assert log_file.name == "app.log"
+
+
+def test_resolve_cache_path_creates_directory(monkeypatch, tmp_path):
+    monkeypatch.setattr(paths.sys, "frozen", False, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    cache_dir = Path(paths.resolve_cache_path())
+    cache_file = Path(paths.resolve_cache_path("templates"))
+
+    assert cache_dir.exists()
+    assert cache_dir.name == "cache"
+    assert cache_file.parent == cache_dir
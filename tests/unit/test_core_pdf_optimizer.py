@@ -0,0 +1,96 @@
+import io
+
+from PIL import Image
+from pypdf import PdfReader, PdfWriter
+
+from fit_common.core.pdf_optimizer import optimize_pdf_bytes, optimize_pdf_file, optimize_pdf_writer
+
+
+def _image_pdf(color=None):
+    image = Image.effect_noise((200, 200), 80).convert("RGB") if color is None else Image.new("RGB", (200, 200), color)
+    buffer = io.BytesIO()
+    image.save(buffer, "PDF", quality=95)
+    return buffer.getvalue()
+
+
+def _merged(path, *documents):
+    writer = PdfWriter()
+    for document in documents:
+        for page in PdfReader(io.BytesIO(document)).pages:
+            writer.add_page(page)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def test_optimize_pdf_file_deduplicates_identical_objects(tmp_path):
+    report = tmp_path / "report.pdf"
+    document = _image_pdf()
+    _merged(report, document, document)
+
+    result = optimize_pdf_file(str(report))
+
+    assert result.original_size == len(report.read_bytes()) + result.saved
+    assert result.optimized_size < result.original_size * 0.6
+    assert result.images_recompressed == 0
+    assert result.elapsed >= 0
+    assert len(PdfReader(str(report)).pages) == 2
+
+
+def test_optimize_pdf_writer_recompresses_each_image_once(tmp_path):
+    report = tmp_path / "report.pdf"
+    document = _image_pdf()
+    _merged(report, document, document, _image_pdf("white"))
+    writer = PdfWriter(clone_from=PdfReader(str(report)))
+
+    assert optimize_pdf_writer(writer, image_quality=30) == 2
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    assert len(buffer.getvalue()) < report.stat().st_size
+    assert len(PdfReader(buffer).pages) == 3
+
+
+def test_optimize_pdf_file_keeps_original_when_not_smaller(tmp_path):
+    report = tmp_path / "report.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    writer.compress_identical_objects()
+    with open(report, "wb") as f:
+        writer.write(f)
+    original = report.read_bytes()
+    mtime = report.stat().st_mtime_ns
+
+    result = optimize_pdf_file(str(report))
+
+    assert result.saved == 0
+    assert result.optimized_size == len(original)
+    assert report.read_bytes() == original
+    assert report.stat().st_mtime_ns == mtime
+    assert [path.name for path in tmp_path.iterdir()] == ["report.pdf"]
+
+
+def test_optimize_pdf_bytes_returns_smaller_document_without_disk_writes(tmp_path):
+    document = _image_pdf()
+    writer = PdfWriter()
+    for _ in range(2):
+        for page in PdfReader(io.BytesIO(document)).pages:
+            writer.add_page(page)
+
+    data, result = optimize_pdf_bytes(writer)
+
+    assert len(data) == result.optimized_size < result.original_size * 0.6
+    assert len(PdfReader(io.BytesIO(data)).pages) == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_optimize_pdf_bytes_keeps_original_when_not_smaller():
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    original = io.BytesIO()
+    writer.write(original)
+
+    data, result = optimize_pdf_bytes(writer)
+
+    assert result.saved == 0
+    assert result.images_recompressed == 0
+    assert data == original.getvalue()
@@ -0,0 +1,57 @@
+import base64
+
+from fit_common.core.report_assets import DataUriCache, get_data_uri_cache
+
+
+def test_from_bytes_encodes_and_counts_hits_and_misses():
+    cache = DataUriCache()
+
+    first = cache.from_bytes(b"logo")
+    second = cache.from_bytes(b"logo")
+
+    assert first == "data:image/png;base64," + base64.b64encode(b"logo").decode("utf-8")
+    assert second == first
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = DataUriCache(maxsize=2)
+    cache.from_bytes(b"a")
+    cache.from_bytes(b"b")
+    cache.from_bytes(b"a")
+    cache.from_bytes(b"c")
+
+    cache.from_bytes(b"a")
+    cache.from_bytes(b"b")
+
+    info = cache.cache_info()
+    assert info.currsize == 2
+    assert (info.hits, info.misses) == (2, 4)
+
+
+def test_from_resource_is_invalidated_when_file_changes(tmp_path):
+    cache = DataUriCache()
+    image = tmp_path / "logo.png"
+    image.write_bytes(b"first")
+
+    assert cache.from_resource(image).endswith(base64.b64encode(b"first").decode("utf-8"))
+    cache.from_resource(image)
+    assert cache.cache_info().hits == 1
+
+    image.write_bytes(b"second-version")
+    assert cache.from_resource(image).endswith(
+        base64.b64encode(b"second-version").decode("utf-8")
+    )
+    assert cache.cache_info().misses == 2
+
+
+def test_clear_resets_entries_and_counters():
+    cache = DataUriCache()
+    cache.from_bytes(b"x", mime="image/jpeg")
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 32, 0)
+
+
+def test_default_cache_is_shared():
+    assert get_data_uri_cache() is get_data_uri_cache()
@@ -0,0 +1,65 @@
+import io
+
+from pypdf import PdfReader
+
+from fit_common.core.report_backends import ReportlabBackend
+
+_CONTEXT = {
+    "title": "FIT",
+    "document_title": "Acquisition report",
+    "index": "Index",
+    "note": "Note",
+    "logo": "<div></div>",
+    "page": "Page",
+    "of": "of",
+}
+
+
+def _text(pdf_bytes):
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return [page.extract_text() for page in reader.pages]
+
+
+def test_reportlab_backend_draws_structured_sections():
+    sections = [
+        {"title": "FIT", "type": "fit_description", "content": 'See <a href="https://example.test">releases</a>'},
+        {
+            "title": "General",
+            "type": "case_info",
+            "description": "",
+            "columns": ["Field", "Value"],
+            "rows": [{"value": "Case", "desc": "Case <X> & co"}],
+            "note": "a note",
+        },
+        {
+            "title": "Hashes",
+            "type": "integrity_verification",
+            "description": "Digests",
+            "content": "<p>sha256 abc\n</p><p>md5 <def>\n</p>",
+        },
+        {"title": "Verification", "type": "verification_report", "verification_result": "OK", "content": "line 1\n\nline 2"},
+    ]
+
+    pdf = ReportlabBackend().render_content(sections, _CONTEXT)
+
+    assert pdf.startswith(b"%PDF")
+    text = "\n".join(_text(pdf))
+    for expected in ("Acquisition report", "1. FIT", "releases", "Case <X> & co", "Note: a note", "md5 <def>", "OK", "line 2"):
+        assert expected in text
+    assert "Page 1 of 1" in text
+
+
+def test_reportlab_backend_numbers_pages_and_skips_continued_titles():
+    rows = [{"value": f"file-{n}.html", "desc": "Downloaded"} for n in range(300)]
+    sections = [
+        {"title": "Files", "type": "acquired_content", "description": "", "columns": ["Name", "Desc"], "rows": rows[:150], "note": ""},
+        {"title": "Files", "type": "acquired_content", "description": "", "columns": ["Name", "Desc"], "rows": rows[150:], "note": "", "continued": True},
+    ]
+
+    pages = _text(ReportlabBackend().render_content(sections, _CONTEXT))
+
+    assert len(pages) > 2
+    assert f"Page {len(pages)} of {len(pages)}" in pages[-1]
+    assert "\n".join(pages).count("1. Files") == 2
+    assert "2. Files" not in "\n".join(pages)
+    assert "file-299.html" in pages[-1]
@@ -0,0 +1,114 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from fit_common.core import report_batch
+from fit_common.core.pdf_report_builder import PdfReportBuilder, ReportType
+from fit_common.core.report_batch import ReportJob, generate_reports
+
+
+class _WorkerDied(BaseException):
+    pass
+
+
+class _FakeBuilder:
+    def __init__(self, path):
+        self.path = path
+
+    def generate_pdf(self):
+        if self.path.endswith("broken"):
+            raise RuntimeError(f"cannot build {self.path}")
+        if self.path.endswith("crash"):
+            raise _WorkerDied()
+
+
+class _InlineExecutor:
+    """Runs jobs in-process; a 'crash' job breaks the pool like a killed worker.
+
+    Jobs submitted after the crash never start.
+    """
+
+    pools = []
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None, initargs=(), max_tasks_per_child=None):
+        initializer(*initargs)
+        self.broken = False
+        self.size = 0
+        _InlineExecutor.pools.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        self.size += 1
+        future = Future()
+        if not self.broken:
+            try:
+                future.set_result(fn(*args))
+            except _WorkerDied:
+                self.broken = True
+        if self.broken:
+            future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+@pytest.fixture
+def inline_pool(monkeypatch):
+    _InlineExecutor.pools.clear()
+    monkeypatch.setattr(report_batch, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(ReportJob, "build", lambda job: _FakeBuilder(job.path))
+    return _InlineExecutor.pools
+
+
+def _job(path):
+    return ReportJob(ReportType.VERIFY, path=path, filename="report.pdf", translations={})
+
+
+def test_generate_reports_returns_results_in_order_and_isolates_errors(inline_pool, tmp_path):
+    jobs = [_job(str(tmp_path / "a")), _job(str(tmp_path / "broken")), _job(str(tmp_path / "c"))]
+
+    results = generate_reports(jobs, max_workers=2)
+
+    assert [result.job for result in results] == jobs
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].output_path == str(tmp_path / "a" / "report.pdf")
+    assert "cannot build" in results[1].error
+
+
+def test_generate_reports_retries_jobs_left_by_a_dead_worker(inline_pool, tmp_path):
+    jobs = [_job(str(tmp_path / name)) for name in ("a", "crash", "c", "d", "e")]
+
+    results = generate_reports(jobs)
+
+    assert [result.ok for result in results] == [True, False, True, True, True]
+    assert "terminated abruptly" in results[1].error
+    # the crashed job alone in its own pool, the jobs that never started in a new shared one
+    assert [pool.size for pool in inline_pool] == [5, 1, 3]
+
+
+def test_report_job_build_applies_builder_options(tmp_path):
+    job = ReportJob(
+        ReportType.VERIFY,
+        path=str(tmp_path),
+        filename="report.pdf",
+        translations={},
+        ntp="2026-02-20",
+        options={"in_memory": True},
+    )
+
+    builder = job.build()
+
+    assert isinstance(builder, PdfReportBuilder)
+    assert builder.in_memory is True
+    assert builder.ntp == "2026-02-20"
+
+
+@pytest.mark.parametrize("option", ["nope", "metrics", "optimization", "memory_budget_report"])
+def test_report_job_build_rejects_unknown_and_read_only_options(tmp_path, option):
+    job = ReportJob(ReportType.VERIFY, path=str(tmp_path), filename="r.pdf", translations={}, options={option: 1})
+    with pytest.raises(ValueError, match=option):
+        job.build()
@@ -0,0 +1,77 @@
+import pytest
+
+from fit_common.core.report_budget import (
+    HTML_MEMORY_FACTOR,
+    MemoryBudgetReport,
+    html_limit,
+    iter_appendix_chunks,
+    render_appendix_html,
+    section_size,
+    spill_sections,
+)
+
+
+def _hash_content(lines):
+    return "".join(f"<p>{number:064x}  file-{number}\n</p>" for number in range(lines))
+
+
+def test_html_limit_rejects_budgets_below_one_character():
+    assert html_limit(HTML_MEMORY_FACTOR * 1000) == 1000
+    with pytest.raises(ValueError):
+        html_limit(HTML_MEMORY_FACTOR - 1)
+
+
+def test_section_size_counts_nested_text():
+    section = {"title": "ab", "rows": [{"value": "cde", "desc": "f"}], "n": 3}
+    assert section_size(section) == 6
+
+
+def test_spill_sections_leaves_small_reports_untouched(tmp_path):
+    sections = [{"type": "whois", "title": "Whois", "content": "line\n" * 10}]
+    report = MemoryBudgetReport(HTML_MEMORY_FACTOR * 1000, 1000)
+
+    spill_sections(sections, report, str(tmp_path), "{0} continues")
+
+    assert report.spilled == []
+    assert report.content_size == section_size(sections[0])
+    assert sections[0]["content"] == "line\n" * 10
+
+
+def test_spill_sections_moves_largest_content_to_appendix(tmp_path):
+    content = _hash_content(200)
+    sections = [
+        {"type": "case_info", "title": "Case", "rows": [{"value": "a", "desc": "b"}]},
+        {"type": "integrity_verification", "title": "Hashes", "content": content},
+        {"type": "whois", "title": "Whois", "content": "whois line\n" * 20},
+    ]
+    report = MemoryBudgetReport(HTML_MEMORY_FACTOR * 4000, 4000)
+
+    spill_sections(sections, report, str(tmp_path), "{0} continues")
+
+    assert [spilled.type for spilled in report.spilled] == ["integrity_verification"]
+    head = sections[1]["content"]
+    assert head.endswith("<p>Hashes continues</p>")
+    assert head.count("</p>") - 1 == report.spilled[0].kept // len(_hash_content(1))
+    assert report.content_size <= report.html_limit
+    assert sections[2]["content"] == "whois line\n" * 20
+
+    spilled = report.spilled[0]
+    chunks = list(iter_appendix_chunks(spilled, 1000))
+    assert content[: spilled.kept] + "".join(chunks) == content
+    assert all(len(chunk) <= 1000 and chunk.endswith("</p>") for chunk in chunks)
+
+
+def test_spilled_text_sections_keep_whole_lines_and_escape_appendix(tmp_path):
+    content = "".join(f"<field {number}>\n" for number in range(100))
+    sections = [{"type": "whois", "title": "Whois", "content": content}]
+    report = MemoryBudgetReport(HTML_MEMORY_FACTOR * 300, 300)
+
+    spill_sections(sections, report, str(tmp_path), "{0} continues")
+
+    head = content[: report.spilled[0].kept]
+    assert head.endswith("\n")
+    assert sections[0]["content"] == head + "\nWhois continues"
+
+    chunk = list(iter_appendix_chunks(report.spilled[0], 300))[-1]
+    html = render_appendix_html(report.spilled[0], "Appendix: Whois", chunk)
+    assert '<p class="line">&lt;field 99&gt;</p>' in html
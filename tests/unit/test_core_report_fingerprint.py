@@ -0,0 +1,77 @@
+from fit_common.core.report_fingerprint import (
+    ReportFingerprint,
+    find_cached_report,
+    fingerprint_path,
+    is_fingerprint_file,
+    read_fingerprint,
+    remove_fingerprint,
+    write_fingerprint,
+)
+
+
+def test_fingerprint_frames_values_by_label_and_length():
+    first = ReportFingerprint()
+    first.add_text("a", "xy")
+    first.add_text("b", "z")
+    second = ReportFingerprint()
+    second.add_text("a", "x")
+    second.add_text("b", "yz")
+
+    assert first.hexdigest() != second.hexdigest()
+
+
+def test_fingerprint_json_ignores_key_order_and_none_differs_from_empty():
+    first = ReportFingerprint()
+    first.add_json("case", {"name": "X", "lawyer": "Y"})
+    second = ReportFingerprint()
+    second.add_json("case", {"lawyer": "Y", "name": "X"})
+    assert first.hexdigest() == second.hexdigest()
+
+    none = ReportFingerprint()
+    none.add_text("ntp", None)
+    empty = ReportFingerprint()
+    empty.add_text("ntp", "")
+    assert none.hexdigest() != empty.hexdigest()
+
+
+def test_fingerprint_add_file_tracks_content_and_missing_files(tmp_path):
+    path = tmp_path / "acquisition.hash"
+    missing = ReportFingerprint()
+    missing.add_file("hash", str(path))
+
+    path.write_text("abc")
+    first = ReportFingerprint()
+    first.add_file("hash", str(path))
+    path.write_text("abd")
+    second = ReportFingerprint()
+    second.add_file("hash", str(path))
+
+    assert len({missing.hexdigest(), first.hexdigest(), second.hexdigest()}) == 3
+
+
+def test_sidecar_roundtrip_requires_the_report(tmp_path):
+    output = tmp_path / "report.pdf"
+    write_fingerprint(str(output), "abc")
+
+    assert fingerprint_path(str(output)) == str(tmp_path / ".report.pdf.fingerprint")
+    assert is_fingerprint_file(".report.pdf.fingerprint")
+    assert read_fingerprint(str(output)) is None
+
+    output.write_bytes(b"%PDF")
+    assert read_fingerprint(str(output)) == "abc"
+
+    remove_fingerprint(str(output))
+    remove_fingerprint(str(output))
+    assert read_fingerprint(str(output)) is None
+
+
+def test_find_cached_report_matches_by_digest(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"a")
+    (tmp_path / "b.pdf").write_bytes(b"b")
+    write_fingerprint(str(tmp_path / "a.pdf"), "111")
+    write_fingerprint(str(tmp_path / "b.pdf"), "222")
+    write_fingerprint(str(tmp_path / "gone.pdf"), "333")
+
+    assert find_cached_report(str(tmp_path), "222") == str(tmp_path / "b.pdf")
+    assert find_cached_report(str(tmp_path), "333") is None
+    assert find_cached_report(str(tmp_path / "missing"), "111") is None
@@ -0,0 +1,96 @@
+import os
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from fit_common.core import report_images
+
+
+def _screenshot(path: Path, size=(1000, 4000)) -> Path:
+    Image.new("RGB", size, "white").save(path)
+    return path
+
+
+def test_screenshot_derivative_fits_box_at_requested_dpi(tmp_path):
+    source = _screenshot(tmp_path / "acquisition_page.png")
+
+    derivative = report_images.screenshot_derivative(
+        str(source), 130, 520, dpi=144, cache_dir=str(tmp_path / "cache")
+    )
+
+    assert derivative is not None
+    assert Path(derivative).parent == tmp_path / "cache"
+    assert Path(derivative).name.startswith(report_images.file_sha256(str(source)))
+    with Image.open(derivative) as image:
+        assert image.size == (260, 1040)
+
+
+def test_screenshot_derivative_is_cached_by_source_digest(tmp_path, monkeypatch):
+    source = _screenshot(tmp_path / "acquisition_page.png")
+    cache_dir = str(tmp_path / "cache")
+    first = report_images.screenshot_derivative(str(source), 100, 400, cache_dir=cache_dir)
+
+    def fail_resize(*args, **kwargs):
+        raise AssertionError("derivative should come from the cache")
+
+    monkeypatch.setattr(Image.Image, "resize", fail_resize)
+    copy = _screenshot(tmp_path / "copy.png")
+    assert report_images.screenshot_derivative(str(copy), 100, 400, cache_dir=cache_dir) == first
+
+
+def test_screenshot_derivative_defaults_to_shared_cache_folder(tmp_path, monkeypatch):
+    source = _screenshot(tmp_path / "acquisition_page.png")
+    monkeypatch.setattr(report_images, "resolve_cache_path", lambda name: str(tmp_path / name))
+
+    derivative = report_images.screenshot_derivative(str(source), 100, 400)
+
+    assert Path(derivative).parent == tmp_path / report_images.SCREENSHOT_CACHE
+    report_images.purge_screenshot_cache()
+    assert not (tmp_path / report_images.SCREENSHOT_CACHE).exists()
+
+
+def test_prune_screenshot_cache_drops_old_and_least_recently_used(tmp_path):
+    now = time.time()
+    for name, size, age in [("newest.png", 40, 0), ("recent.png", 40, 60), ("lru.png", 40, 120), ("stale.png", 1, 3600)]:
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        os.utime(path, (now - age, now - age))
+
+    assert report_images.prune_screenshot_cache(str(tmp_path), max_age_s=600, max_bytes=100) == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["newest.png", "recent.png"]
+
+    # The derivative just written is kept even when it alone is over budget.
+    assert report_images.prune_screenshot_cache(str(tmp_path), max_age_s=600, max_bytes=10) == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["newest.png"]
+
+
+def test_screenshot_derivative_returns_source_when_already_small(tmp_path):
+    source = _screenshot(tmp_path / "small.png", size=(100, 100))
+    assert (
+        report_images.screenshot_derivative(str(source), 430, 520, cache_dir=str(tmp_path))
+        == str(source)
+    )
+
+
+def test_screenshot_derivative_returns_none_for_undecodable_file(tmp_path):
+    source = tmp_path / "broken.png"
+    source.write_bytes(b"not a png")
+    assert report_images.screenshot_derivative(str(source), 430, 520, cache_dir=str(tmp_path)) is None
+
+
+def test_tile_screenshot_writes_page_height_strips(tmp_path):
+    source = _screenshot(tmp_path / "acquisition_page.png", size=(1000, 5000))
+
+    tiles = report_images.tile_screenshot(str(source), str(tmp_path / "tiles"), 100, 200, dpi=72)
+
+    assert [(tile.width_pt, tile.height_pt) for tile in tiles] == [(100, 200), (100, 200), (100, 100)]
+    for tile in tiles:
+        with Image.open(tile.path) as image:
+            assert image.size == (tile.width_pt, tile.height_pt)
+
+
+def test_tile_screenshot_returns_empty_list_for_undecodable_file(tmp_path):
+    source = tmp_path / "broken.png"
+    source.write_bytes(b"not a png")
+    assert report_images.tile_screenshot(str(source), str(tmp_path / "tiles"), 100, 200) == []
@@ -0,0 +1,69 @@
+import tracemalloc
+
+from fit_common.core import report_metrics
+from fit_common.core.report_metrics import (
+    ReportInstrumentation,
+    ReportMetrics,
+    ReportStage,
+    StageMetrics,
+)
+
+
+def test_disabled_instrumentation_records_nothing():
+    instrumentation = ReportInstrumentation()
+    with instrumentation.measure(ReportStage.SCAN):
+        pass
+    assert instrumentation.metrics.stages == []
+
+
+def test_measure_records_peak_rss_growth_without_tracing(monkeypatch):
+    readings = iter([10_000, 50_000])
+    monkeypatch.setattr(report_metrics, "_peak_rss", lambda: next(readings))
+    instrumentation = ReportInstrumentation(enabled=True)
+    with instrumentation.measure(ReportStage.RENDER_CONTENT):
+        assert not tracemalloc.is_tracing()
+
+    stage = instrumentation.metrics.get(ReportStage.RENDER_CONTENT)
+    assert stage is not None
+    assert stage.wall_time >= 0
+    assert stage.cpu_time >= 0
+    assert stage.peak_memory == 40_000
+
+
+def test_measure_traces_python_allocations_when_asked():
+    instrumentation = ReportInstrumentation(enabled=True, trace_memory=True)
+    with instrumentation.measure(ReportStage.TEMPLATES):
+        payload = bytearray(2_000_000)
+        del payload
+
+    stage = instrumentation.metrics.get(ReportStage.TEMPLATES)
+    assert stage is not None
+    assert stage.wall_time >= 0
+    assert stage.cpu_time >= 0
+    assert stage.peak_memory >= 2_000_000
+
+
+def test_measure_records_stage_when_block_raises():
+    instrumentation = ReportInstrumentation(enabled=True)
+    try:
+        with instrumentation.measure(ReportStage.WRITE):
+            raise OSError("disk full")
+    except OSError:
+        pass
+    assert instrumentation.metrics.get(ReportStage.WRITE) is not None
+
+
+def test_report_metrics_totals_and_dict():
+    metrics = ReportMetrics(
+        [
+            StageMetrics(ReportStage.SCAN, 1.0, 0.5, 100),
+            StageMetrics(ReportStage.MERGE, 2.0, 1.5, 300),
+        ]
+    )
+
+    assert metrics.total_wall_time == 3.0
+    assert metrics.total_cpu_time == 2.0
+    assert metrics.peak_memory == 300
+    data = metrics.to_dict()
+    assert [stage["stage"] for stage in data["stages"]] == ["scan", "merge"]
+    assert data["total_wall_time"] == 3.0
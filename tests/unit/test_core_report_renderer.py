@@ -0,0 +1,78 @@
+import pytest
+
+from fit_common.core import report_renderer
+from fit_common.core.report_renderer import (
+    RendererUnavailable,
+    RendererWorker,
+    get_renderer_worker,
+    render_pdf,
+    shutdown_renderer_worker,
+)
+
+_HTML = "<html><body><p>Hello FIT</p></body></html>"
+
+
+def test_render_pdf_returns_pdf_bytes():
+    assert render_pdf(_HTML, {}).startswith(b"%PDF")
+
+
+def test_renderer_worker_renders_in_warm_process():
+    with RendererWorker() as worker:
+        assert worker.is_alive
+        first = worker.render(_HTML, {})
+        second = worker.render(_HTML, {})
+        assert worker.is_alive
+
+    assert first.startswith(b"%PDF")
+    assert second.startswith(b"%PDF")
+    assert not worker.is_alive
+
+
+def test_renderer_worker_falls_back_in_process_when_start_fails(monkeypatch):
+    worker = RendererWorker()
+    monkeypatch.setattr(
+        worker,
+        "_RendererWorker__start",
+        lambda: (_ for _ in ()).throw(RuntimeError("cannot spawn")),
+    )
+    monkeypatch.setattr(report_renderer, "render_pdf", lambda html, options: b"%PDF-local")
+
+    assert worker.render(_HTML, {}) == b"%PDF-local"
+    with pytest.raises(RendererUnavailable):
+        worker.render(_HTML, {}, fallback=False)
+
+
+def test_renderer_worker_raises_render_errors(monkeypatch):
+    class _Connection:
+        def send(self, request):
+            pass
+
+        def poll(self, timeout):
+            return True
+
+        def recv(self):
+            return "error", ValueError("bad html")
+
+    worker = RendererWorker()
+    monkeypatch.setattr(worker, "_RendererWorker__start", lambda: _Connection())
+
+    with pytest.raises(ValueError, match="bad html"):
+        worker.render(_HTML, {})
+
+
+def test_renderer_worker_kills_a_hung_worker_and_renders_in_process(monkeypatch):
+    with RendererWorker(render_timeout=0.0) as worker:
+        process = worker._RendererWorker__process
+        monkeypatch.setattr(worker._RendererWorker__connection, "poll", lambda timeout: False)
+        monkeypatch.setattr(report_renderer, "render_pdf", lambda html, options: b"%PDF-local")
+
+        assert worker.render(_HTML, {}) == b"%PDF-local"
+        assert not process.is_alive()
+        assert not worker.is_alive
+
+
+def test_get_renderer_worker_is_shared():
+    try:
+        assert get_renderer_worker() is get_renderer_worker()
+    finally:
+        shutdown_renderer_worker()
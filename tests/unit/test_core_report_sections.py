@@ -0,0 +1,90 @@
+import pytest
+
+from fit_common.core.report_sections import SectionCache, get_section_cache, split_table_sections
+
+
+def test_section_cache_builds_once_per_key():
+    cache = SectionCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"type": "whois", "content": "<p>whois</p>"}
+
+    first = cache.get_or_build("a", build)
+    second = cache.get_or_build("a", build)
+
+    assert first == second
+    assert len(builds) == 1
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+
+
+def test_section_cache_returns_copies():
+    cache = SectionCache()
+    first = cache.get_or_build("a", lambda: {"rows": [{"value": "x"}]})
+    first["rows"].append({"value": "y"})
+
+    assert cache.get_or_build("a", lambda: None) == {"rows": [{"value": "x"}]}
+
+
+def test_section_cache_remembers_missing_sections():
+    cache = SectionCache()
+    builds = []
+
+    assert cache.get_or_build("a", lambda: builds.append(1)) is None
+    assert cache.get_or_build("a", lambda: builds.append(1)) is None
+    assert len(builds) == 1
+
+
+def test_section_cache_evicts_least_recently_used():
+    cache = SectionCache(maxsize=2)
+    cache.get_or_build("a", lambda: {"n": 1})
+    cache.get_or_build("b", lambda: {"n": 2})
+    cache.get_or_build("a", lambda: {"n": 0})
+    cache.get_or_build("c", lambda: {"n": 3})
+
+    assert cache.get_or_build("a", lambda: {"n": 0}) == {"n": 1}
+    assert cache.get_or_build("b", lambda: {"n": 0}) == {"n": 0}
+
+    cache.clear()
+    assert cache.cache_info().currsize == 0
+
+
+def test_get_section_cache_is_shared():
+    assert get_section_cache() is get_section_cache()
+
+
+def _table(rows, note="note"):
+    return {
+        "title": "Acquired content",
+        "type": "acquired_content",
+        "description": "desc",
+        "columns": ["File", "Description"],
+        "rows": [{"value": f"f{n}", "desc": "d"} for n in range(rows)],
+        "note": note,
+    }
+
+
+def test_split_table_sections_chunks_rows_in_order():
+    text = {"title": "FIT", "type": "fit_description", "content": "x"}
+    sections = split_table_sections([text, _table(5)], 2)
+
+    assert sections[0] is text
+    tables = sections[1:]
+    assert [len(s["rows"]) for s in tables] == [2, 2, 1]
+    assert [row["value"] for s in tables for row in s["rows"]] == [f"f{n}" for n in range(5)]
+    assert [s["description"] for s in tables] == ["desc", "", ""]
+    assert [s["note"] for s in tables] == ["", "", "note"]
+    assert [s.get("continued", False) for s in tables] == [False, True, True]
+    assert all(s["title"] == "Acquired content" and s["columns"] == ["File", "Description"] for s in tables)
+
+
+def test_split_table_sections_keeps_small_tables():
+    table = _table(2)
+    assert split_table_sections([table], 2) == [table]
+
+
+def test_split_table_sections_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        split_table_sections([_table(1)], 0)
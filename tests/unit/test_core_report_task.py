@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+
+from fit_common.core.pdf_report_builder import ReportGenerationCancelled
+from fit_common.core.report_metrics import ReportStage
+from fit_common.core.report_task import ReportTask
+
+
+class _FakeBuilder:
+    def __init__(self, stages=(ReportStage.SCAN, ReportStage.WRITE), error=None):
+        self.cancel_event = None
+        self.progress_callback = None
+        self.stages = stages
+        self.error = error
+        self.thread = None
+
+    def generate_pdf(self):
+        self.thread = threading.current_thread()
+        for stage in self.stages:
+            if self.cancel_event.is_set():
+                raise ReportGenerationCancelled(stage)
+            if self.progress_callback is not None:
+                self.progress_callback(stage)
+        if self.error is not None:
+            raise self.error
+
+
+def test_report_task_runs_in_background_and_reports_progress():
+    builder = _FakeBuilder()
+    stages = []
+
+    task = ReportTask(builder, stages.append)
+    task.start().result(timeout=10)
+
+    assert stages == [ReportStage.SCAN, ReportStage.WRITE]
+    assert builder.thread is not threading.current_thread()
+
+
+def test_report_task_cancel_before_next_stage():
+    builder = _FakeBuilder()
+    task = ReportTask(builder, lambda stage: task.cancel())
+
+    with pytest.raises(ReportGenerationCancelled) as excinfo:
+        task.start().result(timeout=10)
+
+    assert task.cancel_requested
+    assert excinfo.value.stage == ReportStage.WRITE
+
+
+def test_report_task_propagates_errors():
+    task = ReportTask(_FakeBuilder(error=ValueError("broken")))
+
+    with pytest.raises(ValueError, match="broken"):
+        task.start().result(timeout=10)
+
+
+def test_report_task_future_cancelled_before_start_skips_generation():
+    builder = _FakeBuilder()
+    task = ReportTask(builder)
+    assert task.future.cancel()
+
+    task.start()
+
+    assert task.future.cancelled()
+    assert builder.thread is None
@@ -0,0 +1,64 @@
+import sys
+
+import pytest
+from jinja2 import TemplateNotFound
+
+from fit_common.core import report_templates
+
+
+@pytest.fixture
+def templates_package(tmp_path, monkeypatch):
+    package = tmp_path / "fake_report_templates"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "front.html").write_text("<h1>{{ title }}</h1>", encoding="utf-8")
+    (package / "copy.html").write_text("<h1>{{ title }}</h1>", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Each test gets its own package directory, not the one imported first.
+    monkeypatch.delitem(sys.modules, "fake_report_templates", raising=False)
+    monkeypatch.setattr(report_templates, "TEMPLATES_PACKAGE", "fake_report_templates")
+    monkeypatch.setattr(report_templates, "_environment", None)
+    return package
+
+
+def test_get_report_template_renders_and_compiles_once(templates_package):
+    template = report_templates.get_report_template("front.html")
+
+    assert template.render(title="Report") == "<h1>Report</h1>"
+    assert report_templates.get_report_template("front.html") is template
+
+
+def test_clear_template_cache_recompiles(templates_package):
+    template = report_templates.get_report_template("front.html")
+    report_templates.clear_template_cache()
+    assert report_templates.get_report_template("front.html") is not template
+
+
+def test_get_report_template_missing_raises_template_not_found(templates_package):
+    with pytest.raises(TemplateNotFound):
+        report_templates.get_report_template("missing.html")
+
+
+def test_bytecode_cache_is_keyed_by_template_content(templates_package, tmp_path):
+    cache_dir = tmp_path / "bytecode"
+    assert report_templates.enable_template_bytecode_cache(str(cache_dir)) == str(cache_dir)
+
+    report_templates.get_report_template("front.html")
+    report_templates.get_report_template("copy.html")
+
+    # The same source under two names compiles to two entries.
+    assert len(list(cache_dir.iterdir())) == 2
+
+    report_templates.clear_template_cache()
+    front = report_templates.get_report_template("front.html")
+    copy = report_templates.get_report_template("copy.html")
+    assert (front.name, copy.name) == ("front.html", "copy.html")
+    assert copy.render(title="Cached") == "<h1>Cached</h1>"
+
+    (templates_package / "copy.html").write_text("<h2>{{ title }}</h2>", encoding="utf-8")
+    report_templates.clear_template_cache()
+    assert report_templates.get_report_template("copy.html").render(title="Edited") == "<h2>Edited</h2>"
+    assert len(list(cache_dir.iterdir())) == 3
+
+    report_templates.disable_template_bytecode_cache()
+    assert report_templates.get_report_environment().bytecode_cache is None
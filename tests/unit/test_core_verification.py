@@ -0,0 +1,61 @@
+import hashlib
+
+import pytest
+
+from fit_common.core.hashing import HASH_MANIFEST, hash_acquisition
+from fit_common.core.verification import VerificationStatus, verify_acquisition
+
+
+def _acquisition(tmp_path):
+    (tmp_path / "acquisition.log").write_text("log")
+    (tmp_path / "video.mp4").write_bytes(b"v" * 10000)
+    (tmp_path / "whois.txt").write_text("whois")
+    hash_acquisition(str(tmp_path))
+
+
+def test_verify_acquisition_accepts_untouched_folder(tmp_path):
+    _acquisition(tmp_path)
+
+    result = verify_acquisition(str(tmp_path), max_workers=2, buffer_size=1024)
+
+    assert result.ok
+    assert [file.status for file in result.files] == [VerificationStatus.OK] * 3
+    assert result.bytes_verified == 10008
+    assert result.files[1].actual["sha256"] == hashlib.sha256(b"v" * 10000).hexdigest()
+    assert "Files: 3, OK: 3, MISMATCH: 0, MISSING: 0, ERROR: 0" in result.to_text()
+
+
+def test_verify_acquisition_reports_each_problem(tmp_path):
+    _acquisition(tmp_path)
+    (tmp_path / "acquisition.log").write_text("LOG")
+    (tmp_path / "video.mp4").write_bytes(b"v")
+    (tmp_path / "whois.txt").unlink()
+    with (tmp_path / HASH_MANIFEST).open("a") as f:
+        f.write(f"\n{hashlib.md5(b'x').hexdigest()}  ../outside.txt\n")
+
+    result = verify_acquisition(str(tmp_path))
+
+    statuses = {file.name: (file.status, file.detail) for file in result.files}
+    assert not result.ok
+    assert statuses == {
+        "acquisition.log": (VerificationStatus.MISMATCH, "MD5, SHA-1, SHA-256 differ"),
+        "video.mp4": (VerificationStatus.MISMATCH, "size 1, expected 10000"),
+        "whois.txt": (VerificationStatus.MISSING, None),
+        "../outside.txt": (VerificationStatus.ERROR, "outside of the acquisition folder"),
+    }
+    assert "whois.txt: MISSING" in result.to_text()
+
+
+def test_verify_acquisition_requires_a_manifest(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        verify_acquisition(str(tmp_path))
+
+
+def test_write_info_file_round_trips_text(tmp_path):
+    _acquisition(tmp_path)
+    result = verify_acquisition(str(tmp_path))
+
+    info = result.write_info_file(str(tmp_path / "verify_info.txt"))
+
+    assert (tmp_path / "verify_info.txt").read_text(encoding="utf-8") == result.to_text()
+    assert info == str(tmp_path / "verify_info.txt")
@@ -0,0 +1,64 @@
+import struct
+import zipfile
+
+import pytest
+
+from fit_common.core.zip_manifest import ZipManifestEntry, _zip64_sizes, iter_zip_manifest
+
+
+def _entries_from_zipfile(path):
+    with zipfile.ZipFile(path) as zf:
+        return [ZipManifestEntry(info.filename, info.file_size, info.compress_size) for info in zf.infolist()]
+
+
+def test_iter_zip_manifest_matches_zipfile(tmp_path):
+    archive = tmp_path / "acquisition.zip"
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("index.html", "<html>" * 100)
+        zf.writestr("assets/", "")
+        zf.writestr("assets/città.png", b"\x89PNG" * 10)
+        zf.writestr("empty.txt", "")
+        zf.comment = b"FIT acquisition"
+
+    entries = list(iter_zip_manifest(str(archive)))
+
+    assert entries == _entries_from_zipfile(archive)
+    assert [entry.is_dir for entry in entries] == [False, True, False, False]
+
+
+def test_iter_zip_manifest_handles_prepended_data(tmp_path):
+    plain = tmp_path / "plain.zip"
+    with zipfile.ZipFile(plain, "w") as zf:
+        zf.writestr("a.txt", "abc")
+    archive = tmp_path / "sfx.zip"
+    archive.write_bytes(b"#!stub" * 100 + plain.read_bytes())
+
+    assert list(iter_zip_manifest(str(archive))) == [ZipManifestEntry("a.txt", 3, 3)]
+
+
+def test_iter_zip_manifest_reads_zip64_end_records(tmp_path):
+    archive = tmp_path / "many.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for number in range(0xFFFF + 1):
+            zf.writestr(f"{number}", b"")
+
+    entries = iter_zip_manifest(str(archive))
+
+    assert next(entries) == ZipManifestEntry("0", 0, 0)
+    assert sum(1 for _ in entries) == 0xFFFF
+
+
+def test_zip64_sizes_reads_only_saturated_fields():
+    extra = struct.pack("<2H", 0x9901, 2) + b"xx" + struct.pack("<2HQ", 0x0001, 8, 5_000_000_000)
+
+    assert _zip64_sizes(extra, 0xFFFFFFFF, 10) == (5_000_000_000, 10)
+    with pytest.raises(zipfile.BadZipFile):
+        _zip64_sizes(b"", 0xFFFFFFFF, 10)
+
+
+def test_iter_zip_manifest_rejects_non_zip_files(tmp_path):
+    broken = tmp_path / "broken.zip"
+    broken.write_bytes(b"not a zip archive")
+
+    with pytest.raises(zipfile.BadZipFile):
+        list(iter_zip_manifest(str(broken)))
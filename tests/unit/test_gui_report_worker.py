@@ -0,0 +1,55 @@
+import time
+
+from PySide6.QtCore import QCoreApplication
+
+from fit_common.core.pdf_report_builder import ReportGenerationCancelled
+from fit_common.core.report_metrics import ReportStage
+from fit_common.gui.report_worker import ReportWorker
+
+
+class _FakeBuilder:
+    def __init__(self, error=None):
+        self.cancel_event = None
+        self.progress_callback = None
+        self.error = error
+
+    def generate_pdf(self):
+        for stage in (ReportStage.SCAN, ReportStage.WRITE):
+            if self.cancel_event.is_set():
+                raise ReportGenerationCancelled(stage)
+            self.progress_callback(stage)
+        if self.error is not None:
+            raise self.error
+
+
+def _run(worker, events):
+    worker.progress.connect(lambda stage: events.append(("progress", stage)))
+    worker.finished.connect(lambda: events.append(("finished",)))
+    worker.failed.connect(lambda message: events.append(("failed", message)))
+    worker.cancelled.connect(lambda: events.append(("cancelled",)))
+    worker.start()
+    deadline = time.monotonic() + 10
+    while not any(event[0] in ("finished", "failed", "cancelled") for event in events):
+        assert time.monotonic() < deadline
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+    return events
+
+
+def test_report_worker_emits_progress_then_finished():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    events = _run(ReportWorker(_FakeBuilder()), [])
+
+    assert app is not None
+    assert events == [("progress", "scan"), ("progress", "write"), ("finished",)]
+
+
+def test_report_worker_emits_failed_and_cancelled():
+    QCoreApplication.instance() or QCoreApplication([])
+
+    failed = _run(ReportWorker(_FakeBuilder(error=ValueError("broken"))), [])
+    assert failed[-1] == ("failed", "broken")
+
+    worker = ReportWorker(_FakeBuilder())
+    worker.cancel()
+    assert _run(worker, []) == [("cancelled",)]
@@ -1,9 +1,22 @@
 from pathlib import Path
+import os
+import threading
+import time
 import zipfile
 
 import pytest
+from PIL import Image
+from pypdf import PdfReader
 
-from fit_common.core.pdf_report_builder import PdfReportBuilder, ReportType
+from fit_common.core.hashing import hash_acquisition
+from fit_common.core.merkle import hash_file_merkle
+from fit_common.core.pdf_report_builder import PdfReportBuilder, ReportGenerationCancelled, ReportType
+from fit_common.core.pdf_optimizer import PdfOptimizationResult
+from fit_common.core.report_assets import DataUriCache
+from fit_common.core.report_metrics import ReportStage
+from fit_common.core.report_renderer import RendererWorker
+from fit_common.core.report_sections import get_section_cache
+from fit_common.core.verification import verify_acquisition
 
 
 def _translations():
@@ -196,16 +209,16 @@ def test_pec_eml_filename_detects_case_insensitive_extension(tmp_path, translati
     assert builder._PdfReportBuilder__pec_eml_filename() == "message.EML"
 
 
-def test_is_empty_file_true_for_missing_or_zero_and_false_for_non_empty(tmp_path, translations):
+def test_acquisition_files_drops_missing_marks_empty_and_keeps_non_empty(tmp_path, translations):
     builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    (tmp_path / "acquisition.log").write_text("", encoding="utf-8")
+    (tmp_path / "timestamp.tsr").write_text("abc", encoding="utf-8")
 
-    assert builder._PdfReportBuilder__is_empty_file("missing.txt")
-
-    (tmp_path / "empty.txt").write_text("", encoding="utf-8")
-    assert builder._PdfReportBuilder__is_empty_file("empty.txt")
+    files = builder._acquisition_files_names()
 
-    (tmp_path / "full.txt").write_text("abc", encoding="utf-8")
-    assert not builder._PdfReportBuilder__is_empty_file("full.txt")
+    assert "caseinfo.json" not in files
+    assert files["acquisition.log"] == "acquisition.log is empty"
+    assert files["timestamp.tsr"] == "timestamp.tsr"
 
 
 def test_hash_reader_renders_lines_when_hash_file_present(tmp_path, translations):
@@ -216,11 +229,71 @@ def test_hash_reader_renders_lines_when_hash_file_present(tmp_path, translations
     assert "<p>sha1 b\n</p>" in html
 
 
+def test_generate_pdf_renders_utf8_manifest_names(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    (tmp_path / "perizia_città.pdf").write_bytes(b"%PDF-evidence")
+    hash_acquisition(str(tmp_path))
+
+    rendered = []
+
+    class _Backend:
+        def render_content(self, sections, context):
+            rendered.append(repr(sections))
+            return b"content"
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=_AnyTranslations(), path=str(tmp_path), filename="out.pdf")
+    builder.ntp = "2026-02-20"
+    builder.content_backend = _Backend()
+    builder.generate_pdf()
+
+    assert "<p>Name: perizia_città.pdf\\n</p>" in rendered[0]
+    assert "cittÃ" not in rendered[0]
+
+
+def test_hash_reader_decodes_latin1_manifest_written_by_older_versions(tmp_path, translations):
+    (tmp_path / "acquisition.hash").write_bytes("Name: perizia_città.pdf\nSize: 13\n".encode("latin-1"))
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    html = builder._PdfReportBuilder__hash_reader()
+
+    assert html == "<p>Name: perizia_città.pdf\n</p><p>Size: 13\n</p>"
+
+
 def test_hash_reader_returns_empty_string_when_hash_file_missing(tmp_path, translations):
     builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
     assert builder._PdfReportBuilder__hash_reader() == ""
 
 
+def test_hash_reader_returns_empty_string_when_hash_file_is_blank(tmp_path, translations):
+    (tmp_path / "acquisition.hash").write_text("\n  \n", encoding="latin-1")
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    assert builder._PdfReportBuilder__hash_reader() == ""
+
+
+def test_hash_reader_caps_rows_and_links_full_manifest(tmp_path, translations):
+    hash_file = tmp_path / "acquisition.hash"
+    hash_file.write_text("".join(f"file{i}\n" for i in range(10)), encoding="latin-1")
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    assert builder.hash_rows_limit is None
+    builder.hash_rows_limit = 3
+
+    html = builder._PdfReportBuilder__hash_reader()
+
+    assert html.count("<p>file") == 3
+    assert "<p>file2\n</p>" in html
+    assert "file3" not in html
+    assert f'7 more lines are not shown, see the full list in <a href="file://{hash_file}">acquisition.hash</a>' in html
+
+
+def test_hash_reader_uses_translated_overflow_summary(tmp_path):
+    (tmp_path / "acquisition.hash").write_text("a\nb\n", encoding="latin-1")
+    translations = _AnyTranslations(HASH_ROWS_OMITTED="{0} righe omesse ({1})")
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.hash_rows_limit = 1
+
+    assert "<p>1 righe omesse (<a " in builder._PdfReportBuilder__hash_reader()
+
+
 def test_zip_files_enum_lists_zip_entries_and_sizes(tmp_path, translations):
     archive = tmp_path / "sample.zip"
     with zipfile.ZipFile(archive, "w") as zf:
@@ -235,6 +308,34 @@ def test_zip_files_enum_lists_zip_entries_and_sizes(tmp_path, translations):
     assert "empty.txt" not in html
 
 
+def test_zip_files_enum_lists_every_archive_with_totals(tmp_path, translations):
+    for name, entries in (("acquisition.zip", {"a.html": "abc", "b.html": "defg"}), ("downloads.zip", {"c.bin": "x"})):
+        with zipfile.ZipFile(tmp_path / name, "w") as zf:
+            for entry, content in entries.items():
+                zf.writestr(entry, content)
+    (tmp_path / "broken.zip").write_bytes(b"not a zip")
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    html = builder._zip_files_enum()
+
+    assert "<p><b>acquisition.zip</b>: 2 files, 7 bytes</p>" in html
+    assert "<p><b>downloads.zip</b>: 1 files, 1 bytes</p>" in html
+    assert "<p><b>broken.zip</b>: 0 files, 0 bytes</p>" in html
+    assert html.index("a.html") < html.index("<b>acquisition.zip</b>") < html.index("c.bin")
+    assert "<pdf:nextpage />" not in html
+
+
+def test_zip_files_enum_paginates_entries(tmp_path, translations):
+    with zipfile.ZipFile(tmp_path / "acquisition.zip", "w") as zf:
+        for number in range(5):
+            zf.writestr(f"file{number}.txt", "x")
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.zip_entries_per_page = 2
+
+    assert builder._zip_files_enum().count("<pdf:nextpage />") == 2
+
+
 def test_acquisition_files_supports_prefixed_matching_filename(tmp_path, translations):
     (tmp_path / "acquisition.log.2026-02-20").write_text("x", encoding="utf-8")
     builder = PdfReportBuilder(
@@ -311,3 +412,688 @@ def test_insert_video_hyperlink_returns_anchor_when_file_exists(tmp_path, transl
     html = builder._PdfReportBuilder__insert_video_hyperlink()
     assert f"file://{video}" in html
     assert "Video" in html
+
+
+class _BytesPdfReader:
+    def __init__(self, file_obj):
+        self.pages = [file_obj.read()]
+
+
+class _BytesPdfWriter:
+    def __init__(self):
+        self._pages = []
+
+    def add_page(self, page):
+        self._pages.append(page)
+
+    def write(self, file_obj):
+        file_obj.write(b"|".join(self._pages))
+
+
+def _patch_render_stack(monkeypatch):
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.files", lambda package: _FakeResource(package))
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.get_version", lambda: "1.2.3")
+    monkeypatch.setattr(
+        "fit_common.core.pdf_report_builder.pisa.CreatePDF",
+        lambda html, dest, options: dest.write(html.encode("utf-8")),
+    )
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.PdfReader", _BytesPdfReader)
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.PdfWriter", _BytesPdfWriter)
+    monkeypatch.setattr(
+        PdfReportBuilder,
+        "_PdfReportBuilder__load_template",
+        lambda self, template: _FakeTemplate(),
+    )
+
+
+def _generate_verify_report(tmp_path, translations, filename, parallel):
+    builder = PdfReportBuilder(
+        ReportType.VERIFY,
+        translations=translations,
+        path=str(tmp_path),
+        filename=filename,
+        case_info={"name": "Case X"},
+    )
+    builder.ntp = "2026-02-20"
+    builder.parallel_rendering = parallel
+    builder.generate_pdf()
+    return (tmp_path / filename).read_bytes()
+
+
+class _RecordingRenderer:
+    def __init__(self):
+        self.calls = []
+
+    def render(self, html, options, fallback=True):
+        self.calls.append(html)
+        return html.encode("utf-8")
+
+
+def test_generate_pdf_parallel_rendering_reuses_shared_worker(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    worker = _RecordingRenderer()
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.get_renderer_worker", lambda: worker)
+
+    serial = _generate_verify_report(tmp_path, translations, "serial.pdf", parallel=False)
+    first = _generate_verify_report(tmp_path, translations, "first.pdf", parallel=True)
+    second = _generate_verify_report(tmp_path, translations, "second.pdf", parallel=True)
+
+    assert first == second == serial
+    assert first.count(b"|") == 1
+    assert len(worker.calls) == 2
+
+
+def test_generate_pdf_parallel_rendering_falls_back_to_serial(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    worker = RendererWorker()
+    monkeypatch.setattr(worker, "_RendererWorker__start", lambda: (_ for _ in ()).throw(RuntimeError("cannot spawn")))
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.get_renderer_worker", lambda: worker)
+    lock = threading.Lock()
+    active = []
+    overlaps = []
+
+    def create_pdf(html, dest, options):
+        with lock:
+            active.append(html)
+            overlaps.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(html)
+        dest.write(html.encode("utf-8"))
+
+    monkeypatch.setattr("fit_common.core.report_renderer.pisa.CreatePDF", create_pdf)
+
+    serial = _generate_verify_report(tmp_path, translations, "serial.pdf", parallel=False)
+    fallback = _generate_verify_report(tmp_path, translations, "fallback.pdf", parallel=True)
+
+    assert fallback == serial
+    # Without a worker process pisa never runs twice at once in this process.
+    assert max(overlaps) == 1
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_generate_pdf_uses_configured_renderer(tmp_path, translations, monkeypatch, parallel):
+    _patch_render_stack(monkeypatch)
+    serial = _generate_verify_report(tmp_path, translations, "serial.pdf", parallel=False)
+
+    renderer = _RecordingRenderer()
+    builder = PdfReportBuilder(
+        ReportType.VERIFY,
+        translations=translations,
+        path=str(tmp_path),
+        filename="worker.pdf",
+        case_info={"name": "Case X"},
+    )
+    builder.ntp = "2026-02-20"
+    builder.parallel_rendering = parallel
+    builder.renderer = renderer
+    builder.generate_pdf()
+
+    assert (tmp_path / "worker.pdf").read_bytes() == serial
+    assert len(renderer.calls) == (1 if parallel else 2)
+
+
+def test_generate_pdf_in_memory_matches_temp_file_output(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+
+    on_disk = _generate_verify_report(tmp_path, translations, "disk.pdf", parallel=False)
+
+    builder = PdfReportBuilder(
+        ReportType.VERIFY,
+        translations=translations,
+        path=str(tmp_path),
+        filename="memory.pdf",
+        case_info={"name": "Case X"},
+    )
+    builder.ntp = "2026-02-20"
+    builder.in_memory = True
+    # Without a temp directory only the in-memory pipeline can succeed.
+    builder._PdfReportBuilder__temp_dir.cleanup()
+    builder.generate_pdf()
+
+    assert (tmp_path / "memory.pdf").read_bytes() == on_disk
+
+
+def test_generate_pdf_reuses_encoded_case_logo(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    cache = DataUriCache()
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.get_data_uri_cache", lambda: cache)
+
+    for name in ("first.pdf", "second.pdf"):
+        builder = PdfReportBuilder(
+            ReportType.VERIFY,
+            translations=translations,
+            path=str(tmp_path),
+            filename=name,
+            case_info={"logo_bin": b"company-logo", "logo_height": "10", "logo_width": "10"},
+        )
+        builder.generate_pdf()
+
+    assert cache.cache_info().hits >= 1
+
+
+class _AnyTranslations(dict):
+    def __missing__(self, key):
+        return key
+
+
+def test_generate_pdf_scans_acquisition_folder_once(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    (tmp_path / "acquisition.log").write_text("log", encoding="utf-8")
+    (tmp_path / "video.mp4").write_bytes(b"video")
+    (tmp_path / "mail.eml").write_text("eml", encoding="utf-8")
+
+    calls = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(
+        "fit_common.core.acquisition_index.os.scandir",
+        lambda path: calls.append(path) or real_scandir(path),
+    )
+
+    builder = PdfReportBuilder(
+        ReportType.ACQUISITION,
+        translations=_AnyTranslations(),
+        path=str(tmp_path),
+        filename="out.pdf",
+        screen_recorder_filename="video.mp4",
+        packet_capture_filename="capture.pcap",
+    )
+    builder.generate_pdf()
+
+    assert calls == [str(tmp_path)]
+    assert (tmp_path / "out.pdf").exists()
+
+
+@pytest.fixture
+def screenshot_cache(tmp_path, monkeypatch):
+    cache = tmp_path / "screenshot_cache"
+    monkeypatch.setattr("fit_common.core.report_images.resolve_cache_path", lambda name: str(cache))
+    return cache
+
+
+def test_insert_screenshot_embeds_downscaled_derivative(tmp_path, translations, screenshot_cache):
+    screenshot = tmp_path / "acquisition_page.png"
+    Image.new("RGB", (1200, 6000), "white").save(screenshot)
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.screenshot_dpi = 72
+    html = builder._PdfReportBuilder__insert_screenshot()
+
+    assert f'<a href="file://{screenshot}">' in html
+    assert '<img src="data:image/png;base64,' in html
+    assert 'width="104" height="520"' in html
+
+    # The derivative outlives the builder, for the next report of the same capture.
+    builder._PdfReportBuilder__remove_temporary_files()
+    assert len(list(screenshot_cache.iterdir())) == 1
+
+
+def test_insert_screenshot_tiles_tall_capture_one_strip_per_page(tmp_path, translations):
+    screenshot = tmp_path / "acquisition_page.png"
+    Image.new("RGB", (860, 2600), "white").save(screenshot)
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.screenshot_tiling = True
+    builder.screenshot_dpi = 144
+    html = builder._PdfReportBuilder__insert_screenshot()
+
+    assert f'<a href="file://{screenshot}">' in html
+    assert html.count('<img src="data:image/png;base64,') == 3
+    assert html.count("<pdf:nextpage />") == 2
+    assert 'width="430" height="520"' in html
+
+
+class _SectionsTemplate:
+    def render(self, sections=(), **kwargs):
+        return "<html><body>" + "".join(str(section.get("content", "")) for section in sections) + "<p>FIT</p></body></html>"
+
+
+@pytest.mark.parametrize(("tiling", "images"), [(False, 1), (True, 3)])
+def test_generate_pdf_embeds_screenshot_derivatives_with_real_pisa(tmp_path, screenshot_cache, monkeypatch, tiling, images):
+    # Only the templates are faked: pisa really renders, and the acquisition
+    # folder is outside the cwd, where its resource policy blocks file reads.
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.files", lambda package: _FakeResource(package))
+    monkeypatch.setattr(PdfReportBuilder, "_PdfReportBuilder__load_template", lambda self, template: _SectionsTemplate())
+    acquisition = tmp_path / "acquisition"
+    acquisition.mkdir()
+    Image.new("RGB", (860, 2600), "red").save(acquisition / "acquisition_page.png")
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=_AnyTranslations(), path=str(acquisition), filename="out.pdf")
+    builder.screenshot_dpi = 144
+    builder.screenshot_tiling = tiling
+    builder.generate_pdf()
+
+    reader = PdfReader(acquisition / "out.pdf")
+    assert sum(len(page.images) for page in reader.pages) == images
+
+
+def test_insert_screenshot_tiling_keeps_single_image_when_it_fits(tmp_path, translations):
+    screenshot = tmp_path / "acquisition_page.png"
+    _write_png(screenshot, width=1200, height=600)
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.screenshot_tiling = True
+    html = builder._PdfReportBuilder__insert_screenshot()
+
+    assert html.count("<img ") == 1
+    assert 'width="430"' in html
+
+
+def test_generate_pdf_collects_stage_metrics(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    messages = []
+    monkeypatch.setattr(
+        "fit_common.core.pdf_report_builder.debug",
+        lambda *args, context=None: messages.append(" ".join(str(a) for a in args)),
+    )
+
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="out.pdf")
+    assert builder.metrics is None
+    builder.collect_metrics = True
+    builder.generate_pdf()
+
+    stages = [stage.stage for stage in builder.metrics.stages]
+    assert stages == [
+        ReportStage.SCAN,
+        ReportStage.SECTIONS,
+        ReportStage.TEMPLATES,
+        ReportStage.RENDER_FRONT,
+        ReportStage.RENDER_CONTENT,
+        ReportStage.MERGE,
+        ReportStage.WRITE,
+    ]
+    assert len(messages) == len(stages)
+    assert messages[0].startswith("scan: wall ")
+
+
+def _generate_cached_report(tmp_path, translations, filename, case_name="Case X"):
+    builder = PdfReportBuilder(
+        ReportType.ACQUISITION,
+        translations=translations,
+        path=str(tmp_path),
+        filename=filename,
+        case_info={"name": case_name},
+    )
+    builder.ntp = "2026-02-20"
+    builder.output_cache = True
+    builder.generate_pdf()
+
+
+def test_hash_acquisition_after_report_leaves_out_report_sidecars(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    (tmp_path / "capture.pcap").write_bytes(b"pcap")
+    hash_file_merkle(str(tmp_path / "capture.pcap"), chunk_size=2)
+
+    _generate_cached_report(tmp_path, _AnyTranslations(), "report.pdf")
+    assert (tmp_path / ".report.pdf.fingerprint").exists()
+
+    names = [digest.name for digest in hash_acquisition(str(tmp_path))]
+    assert names == ["capture.pcap", "report.pdf"]
+
+
+def _count_renders(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "fit_common.core.pdf_report_builder.pisa.CreatePDF",
+        lambda html, dest, options: calls.append(html) or dest.write(html.encode("utf-8")),
+    )
+    return calls
+
+
+def test_generate_pdf_output_cache_skips_unchanged_inputs(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    renders = _count_renders(monkeypatch)
+    translations = _AnyTranslations()
+    (tmp_path / "acquisition.hash").write_text("hash-1\n")
+
+    _generate_cached_report(tmp_path, translations, "report.pdf")
+    assert len(renders) == 2
+    assert (tmp_path / ".report.pdf.fingerprint").is_file()
+
+    _generate_cached_report(tmp_path, translations, "report.pdf")
+    assert len(renders) == 2
+
+    (tmp_path / "acquisition.hash").write_text("hash-2\n")
+    _generate_cached_report(tmp_path, translations, "report.pdf")
+    assert len(renders) == 4
+
+    _generate_cached_report(tmp_path, translations, "report.pdf", case_name="Case Y")
+    assert len(renders) == 6
+
+
+def test_generate_pdf_output_cache_copies_report_for_other_filename(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    renders = _count_renders(monkeypatch)
+    translations = _AnyTranslations()
+
+    _generate_cached_report(tmp_path, translations, "first.pdf")
+    _generate_cached_report(tmp_path, translations, "second.pdf")
+
+    assert len(renders) == 2
+    assert (tmp_path / "second.pdf").read_bytes() == (tmp_path / "first.pdf").read_bytes()
+    assert (tmp_path / ".second.pdf.fingerprint").read_text() == (tmp_path / ".first.pdf.fingerprint").read_text()
+
+
+def test_generate_pdf_without_output_cache_drops_stale_fingerprint(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    translations = _AnyTranslations()
+    _generate_cached_report(tmp_path, translations, "report.pdf")
+
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=translations, path=str(tmp_path), filename="report.pdf")
+    builder.generate_pdf()
+
+    assert not (tmp_path / ".report.pdf.fingerprint").exists()
+
+
+def test_generate_pdf_output_cache_still_removes_verify_info(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    renders = _count_renders(monkeypatch)
+    translations = _AnyTranslations()
+
+    for _ in range(2):
+        info = tmp_path / "verify_info.txt"
+        info.write_text("all good")
+        builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="verify.pdf")
+        builder.verify_info_file_path = str(info)
+        builder.output_cache = True
+        builder.generate_pdf()
+        assert not info.exists()
+
+    assert len(renders) == 2
+
+
+def _count_section_builds(monkeypatch):
+    builds = []
+    for name in ("case_info", "integrity_verification", "whois", "verification_report"):
+        attribute = f"_PdfReportBuilder__{name}_section"
+        original = getattr(PdfReportBuilder, attribute)
+
+        def counted(self, original=original, name=name):
+            builds.append(name)
+            return original(self)
+
+        monkeypatch.setattr(PdfReportBuilder, attribute, counted)
+    return builds
+
+
+def _section_cached_builder(tmp_path, translations, notes, report_type=ReportType.ACQUISITION):
+    builder = PdfReportBuilder(
+        report_type,
+        translations=translations,
+        path=str(tmp_path),
+        filename="report.pdf",
+        case_info={"name": "Case X", "notes": notes},
+    )
+    builder.section_cache = True
+    return builder
+
+
+def test_section_cache_rebuilds_only_dirty_sections(tmp_path, monkeypatch):
+    get_section_cache().clear()
+    builds = _count_section_builds(monkeypatch)
+    translations = _AnyTranslations()
+    (tmp_path / "acquisition.hash").write_text("hash-1\n")
+    (tmp_path / "whois.txt").write_text("whois")
+
+    first = _section_cached_builder(tmp_path, translations, "first")._PdfReportBuilder__build_sections()
+    assert sorted(builds) == ["case_info", "integrity_verification", "whois"]
+
+    builds.clear()
+    second = _section_cached_builder(tmp_path, translations, "second")._PdfReportBuilder__build_sections()
+    assert builds == ["case_info"]
+    assert [s["type"] for s in second] == [s["type"] for s in first]
+    assert next(s for s in second if s["type"] == "case_info")["note"] == "second"
+
+    builds.clear()
+    os.utime(tmp_path / "whois.txt", ns=(0, 0))
+    _section_cached_builder(tmp_path, translations, "second")._PdfReportBuilder__build_sections()
+    assert builds == ["whois"]
+
+
+def test_section_cache_skips_screenshot_with_derivative(tmp_path, screenshot_cache, monkeypatch):
+    get_section_cache().clear()
+    builds = _count_section_builds(monkeypatch)
+    original = PdfReportBuilder._PdfReportBuilder__screenshot_section
+    monkeypatch.setattr(
+        PdfReportBuilder,
+        "_PdfReportBuilder__screenshot_section",
+        lambda self: builds.append("screenshot") or original(self),
+    )
+    Image.new("RGB", (1200, 6000), "white").save(tmp_path / "acquisition_page.png")
+
+    for _ in range(2):
+        builder = _section_cached_builder(tmp_path, _AnyTranslations(), "notes")
+        builder.screenshot_dpi = 72
+        builder._PdfReportBuilder__build_sections()
+
+    assert builds.count("screenshot") == 2
+    assert builds.count("case_info") == 1
+
+
+def test_section_cache_tracks_verify_info_content(tmp_path, monkeypatch):
+    get_section_cache().clear()
+    builds = _count_section_builds(monkeypatch)
+    translations = _AnyTranslations()
+    info = tmp_path / "verify_info.txt"
+
+    for content in ("ok", "ok", "changed"):
+        info.write_text(content)
+        builder = _section_cached_builder(tmp_path, translations, "n", ReportType.VERIFY)
+        builder.verify_info_file_path = str(info)
+        sections = builder._PdfReportBuilder__build_sections()
+        assert sections[-1]["content"] == content
+
+    assert builds.count("verification_report") == 2
+
+
+def test_section_cache_disabled_by_default(tmp_path, monkeypatch):
+    get_section_cache().clear()
+    builds = _count_section_builds(monkeypatch)
+    translations = _AnyTranslations()
+
+    for _ in range(2):
+        PdfReportBuilder(
+            ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="report.pdf"
+        )._PdfReportBuilder__build_sections()
+
+    assert builds.count("case_info") == 2
+    assert get_section_cache().cache_info().currsize == 0
+
+
+def test_generate_pdf_splits_large_tables_for_content_backends(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    rendered = []
+
+    class _Backend:
+        def render_content(self, sections, context):
+            rendered.extend(sections)
+            return b"content"
+
+    for name in ("acquisition_page.png", "acquisition.zip", "downloads.zip", "whois.txt", "traceroute.txt"):
+        (tmp_path / name).write_bytes(b"x")
+    builder = PdfReportBuilder(ReportType.ACQUISITION, translations=_AnyTranslations(), path=str(tmp_path), filename="out.pdf")
+    builder.content_backend = _Backend()
+    builder.rows_per_table = 4
+    builder.generate_pdf()
+
+    case_info = [section for section in rendered if section["type"] == "case_info"]
+    assert [len(section["rows"]) for section in case_info] == [4, 3]
+    assert case_info[1]["continued"] is True
+    # The file tables hold one row per known artifact, short enough to stay whole.
+    for kind in ("system_artifacts", "acquired_content"):
+        assert len([section for section in rendered if section["type"] == kind]) == 1
+
+
+def test_generate_pdf_keeps_tables_whole_for_templates(tmp_path, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    rendered = {}
+
+    class _CaptureTemplate:
+        def render(self, **context):
+            rendered.update(context)
+            return "<html></html>"
+
+    monkeypatch.setattr(PdfReportBuilder, "_PdfReportBuilder__load_template", lambda self, template: _CaptureTemplate())
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=_AnyTranslations(), path=str(tmp_path), filename="out.pdf")
+    builder.rows_per_table = 4
+    builder.generate_pdf()
+
+    case_info = [section for section in rendered["sections"] if section["type"] == "case_info"]
+    assert [len(section["rows"]) for section in case_info] == [7]
+
+
+def test_generate_pdf_reports_stage_progress(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    stages = []
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.progress_callback = stages.append
+    builder.generate_pdf()
+
+    assert stages == [
+        ReportStage.SCAN,
+        ReportStage.SECTIONS,
+        ReportStage.TEMPLATES,
+        ReportStage.RENDER_FRONT,
+        ReportStage.RENDER_CONTENT,
+        ReportStage.MERGE,
+        ReportStage.WRITE,
+    ]
+
+
+def test_generate_pdf_cancel_between_stages_cleans_up(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    info = tmp_path / "verify_info.txt"
+    info.write_text("details")
+    cancel_event = threading.Event()
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.verify_info_file_path = str(info)
+    builder.cancel_event = cancel_event
+
+    def progress(stage):
+        if stage == ReportStage.RENDER_CONTENT:
+            cancel_event.set()
+
+    builder.progress_callback = progress
+    with pytest.raises(ReportGenerationCancelled) as excinfo:
+        builder.generate_pdf()
+
+    assert excinfo.value.stage == ReportStage.MERGE
+    assert not Path(builder._PdfReportBuilder__output_front).exists()
+    assert not Path(builder._PdfReportBuilder__output_content).exists()
+    assert not (tmp_path / "out.pdf").exists()
+    assert info.exists()
+
+
+def test_generate_pdf_optimizes_output_when_enabled(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    calls = []
+
+    def fake_optimize(writer, image_quality=None):
+        calls.append((type(writer), image_quality))
+        return b"optimized", PdfOptimizationResult(100, 60, 0.5, 0)
+
+    monkeypatch.setattr("fit_common.core.pdf_report_builder.optimize_pdf_bytes", fake_optimize)
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.generate_pdf()
+    assert calls == []
+    assert builder.optimization is None
+
+    stages = []
+    builder.progress_callback = stages.append
+    builder.optimize_output = True
+    builder.image_quality = 70
+    builder.generate_pdf()
+
+    assert calls == [(_BytesPdfWriter, 70)]
+    assert builder.optimization.saved == 40
+    assert stages[-2:] == [ReportStage.OPTIMIZE, ReportStage.WRITE]
+    assert (tmp_path / "out.pdf").read_bytes() == b"optimized"
+
+
+def test_generate_pdf_uses_content_backend(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    calls = []
+
+    class _Backend:
+        def render_content(self, sections, context):
+            calls.append((sections, context))
+            return b"backend-content"
+
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.content_backend = _Backend()
+    builder.generate_pdf()
+
+    sections, context = calls[0]
+    assert [section["type"] for section in sections][-1] == "verification_report"
+    assert context["page"] == translations["PAGE"]
+    assert context["logo"] == "<div></div>"
+    assert (tmp_path / "out.pdf").read_bytes().endswith(b"|backend-content")
+
+
+def test_generate_pdf_memory_budget_moves_oversized_sections_to_appendix(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    rendered = []
+
+    class _CaptureTemplate:
+        def render(self, **context):
+            rendered.append(context)
+            return "<html></html>"
+
+    monkeypatch.setattr(PdfReportBuilder, "_PdfReportBuilder__load_template", lambda self, template: _CaptureTemplate())
+    info = tmp_path / "verify_info.txt"
+    lines = "".join(f"downloads/file-{number:04d}.html: OK\n" for number in range(500))
+    info.write_text(lines)
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.verify_info_file_path = str(info)
+    builder.memory_budget = 450 * 4000
+    stages = []
+    builder.progress_callback = stages.append
+    builder.generate_pdf()
+
+    report = builder.memory_budget_report
+    assert [spilled.type for spilled in report.spilled] == ["verification_report"]
+    assert report.within_budget
+    assert report.appendix_chunks == 3
+    assert stages[-2:] == [ReportStage.APPENDIX, ReportStage.WRITE]
+
+    verification = rendered[-1]["sections"][-1]["content"]
+    assert len(verification) < 4000
+    output = (tmp_path / "out.pdf").read_bytes().decode("utf-8")
+    assert output.count("Appendix: Verification") == report.appendix_chunks
+    assert "downloads/file-0499.html: OK" in output
+    assert not Path(builder._PdfReportBuilder__output_appendix).exists()
+
+
+def test_memory_budget_rejects_budgets_too_small_to_render(translations):
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations)
+    with pytest.raises(ValueError):
+        builder.memory_budget = 400
+    assert builder.memory_budget is None
+
+
+def test_use_verification_fills_verification_section(tmp_path, translations, monkeypatch):
+    _patch_render_stack(monkeypatch)
+    rendered = []
+
+    class _CaptureTemplate:
+        def render(self, **context):
+            rendered.append(context)
+            return "<html></html>"
+
+    monkeypatch.setattr(PdfReportBuilder, "_PdfReportBuilder__load_template", lambda self, template: _CaptureTemplate())
+    acquisition = tmp_path / "acquisition"
+    acquisition.mkdir()
+    (acquisition / "acquisition.log").write_text("log")
+    hash_acquisition(str(acquisition))
+    (acquisition / "acquisition.log").write_text("tampered")
+
+    builder = PdfReportBuilder(ReportType.VERIFY, translations=translations, path=str(tmp_path), filename="out.pdf")
+    builder.use_verification(verify_acquisition(str(acquisition)))
+    info_file = builder.verify_info_file_path
+    builder.generate_pdf()
+
+    section = rendered[-1]["sections"][-1]
+    assert builder.verify_result is False
+    assert section["verification_result"] == "KO"
+    assert "acquisition.log: MISMATCH" in section["content"]
+    assert not Path(info_file).exists()